@@ -0,0 +1,49 @@
+"""
+Simulaciones del TP 1 de Comunicaciones I.
+
+Los submódulos y las funciones re-exportadas se cargan recién cuando se
+accede a ellos, de modo que `import Codigos` no importa numpy, scipy ni
+matplotlib. Cada ejercicio se corre con `python -m Codigos ejercicio1` (ver
+`python -m Codigos --help`), con `python -m Codigos.ejercicio_1` o, como los
+scripts originales, con `python Codigos/ejercicio_1.py`.
+"""
+import importlib
+
+_SUBMODULOS = [
+    'analitica', 'barrido', 'cli', 'codificacion', 'construir', 'ejercicio_1', 'ejercicio_2',
+    'ejercicio_3', 'ejercicio_4', 'entropia', 'espectro', 'fasores', 'graficos', 'instrumentacion',
+    'rendimiento', 'series_fourier', 'transformadas', 'tuberia',
+]
+
+# Funciones de uso frecuente: nombre -> submódulo que la define
+_FUNCIONES = {
+    'rfft': 'transformadas', 'fft': 'transformadas', 'ifft': 'transformadas',
+    'irfft': 'transformadas', 'frecuencias': 'transformadas',
+    'espectro_multicanal': 'espectro', 'medir_tonos': 'espectro', 'welch_streaming': 'espectro',
+    'reconstrucciones_parciales': 'series_fourier', 'estimar_coeficientes': 'series_fourier',
+    'analizar_gibbs': 'series_fourier',
+    'analizar_analitica': 'analitica', 'HilbertStreaming': 'analitica',
+    'entropia_conteos': 'entropia', 'contar_simbolos': 'entropia',
+    'entropia_condicional': 'entropia',
+    'evaluar_codigos': 'codificacion',
+    'Fasores': 'fasores',
+    'fourier_coefficients': 'ejercicio_2', 'reconstruct_signal': 'ejercicio_2',
+    'hilbert_transform_fft': 'ejercicio_3',
+}
+
+__all__ = _SUBMODULOS + list(_FUNCIONES)
+
+
+def __getattr__(nombre):
+    if nombre in _FUNCIONES:
+        valor = getattr(importlib.import_module(f'.{_FUNCIONES[nombre]}', __name__), nombre)
+    elif nombre in _SUBMODULOS:
+        valor = importlib.import_module(f'.{nombre}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,89 @@
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+# =============================================================================
+# PUNTO DE ENTRADA: python -m Codigos <comando> [opciones]
+# =============================================================================
+# Cada comando importa su módulo recién cuando se elige, así que
+# 'python -m Codigos --help' no carga numpy, scipy ni matplotlib
+COMANDOS = {
+    'ejercicio1': ('ejercicio_1', "Espectro de una suma de tonos"),
+    'ejercicio2': ('ejercicio_2', "Serie de Fourier de una onda cuadrada"),
+    'ejercicio3': ('ejercicio_3', "Transformada de Hilbert y señal analítica"),
+    'ejercicio4': ('ejercicio_4', "Entropía de fuentes discretas"),
+    'figuras': ('graficos', "Regenera las figuras del informe sin ventanas"),
+    'construir': ('construir', "Construye las figuras del informe con caché"),
+    'rendimiento': ('rendimiento', "Mide tiempo y memoria de los núcleos numéricos"),
+    'tuberia': ('tuberia', "Espectro, envolvente y entropía de un flujo de muestras"),
+}
+
+
+def _segundos(argumentos, repeticiones):
+    """Mejor tiempo de pared de un proceso Python nuevo con esos argumentos."""
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, *argumentos], cwd=raiz, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def arranque(argv=None):
+    """
+    Mide el tiempo de arranque en frío de cada ejercicio con --no-plot.
+
+    Se compara con el costo de importar por separado las bibliotecas pesadas,
+    que es lo que pagaban los scripts cuando las importaban al principio.
+    """
+    parser = argparse.ArgumentParser(prog='python -m Codigos arranque',
+                                     description="Mide el arranque en frío de los ejercicios")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    opciones = parser.parse_args(argv)
+
+    referencias = {
+        'python vacío': ['-c', 'pass'],
+        'import Codigos': ['-c', 'import Codigos'],
+        'import numpy': ['-c', 'import numpy'],
+        'import scipy.signal': ['-c', 'import scipy.signal'],
+        'import scipy.stats': ['-c', 'import scipy.stats'],
+        'import matplotlib.pyplot': ['-c', 'import matplotlib.pyplot'],
+    }
+    for i in range(1, 5):
+        referencias[f'ejercicio{i} --no-plot'] = ['-m', 'Codigos', f'ejercicio{i}', '--no-plot']
+
+    tiempos = {}
+    for nombre, argumentos in referencias.items():
+        tiempos[nombre] = _segundos(argumentos, opciones.repeticiones)
+        print(f"{nombre:<28} {1e3 * tiempos[nombre]:8.1f} ms")
+    return tiempos
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = argparse.ArgumentParser(
+        prog='python -m Codigos',
+        description="Simulaciones del TP 1 de Comunicaciones I",
+        epilog="Las opciones que siguen al comando se pasan al módulo; "
+               "por ejemplo: python -m Codigos ejercicio1 --no-plot")
+    parser.add_argument('comando', choices=[*COMANDOS, 'arranque'],
+                        help=', '.join(f'{c}: {d}' for c, (_, d) in COMANDOS.items())
+                        + ', arranque: mide el arranque en frío')
+    parser.add_argument('resto', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    # Solo se interpreta el comando: --help después de él lo atiende el módulo
+    opciones = parser.parse_args(argv[:1] or ['--help'])
+    resto = argv[1:]
+
+    if opciones.comando == 'arranque':
+        return arranque(resto)
+    modulo = importlib.import_module(f'.{COMANDOS[opciones.comando][0]}', __package__)
+    return modulo.main(resto)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import numpy as np
+
+from .transformadas import rfft, irfft, ifft, mascara_analitica, longitud_rapida
+from .instrumentacion import instrumentar
+
+# =============================================================================
+# SEÑAL ANALÍTICA EN UNA SOLA PASADA
+# =============================================================================
+@instrumentar
+def señal_analitica_rfft(x, axis=-1):
+    """
+    Calcula la señal analítica x + j·H{x} con una sola transformada directa.
+
+    La señal es real, así que alcanza con su rfft (solo frecuencias
+    positivas): se pondera con la máscara unilateral (1 en continua y Nyquist,
+    2 en el resto) y una IFFT compleja de N puntos, completada con ceros en
+    las frecuencias negativas, devuelve x + j·H{x}. La máscara se guarda en
+    caché para cada N.
+
+    Parámetros:
+    x: Señal real (1-D o un lote de señales)
+    axis: Eje del tiempo
+
+    Retorna:
+    Señal analítica compleja, con la misma forma que x
+    """
+    x = np.asarray(x, dtype=float)
+    axis = axis % x.ndim
+    N = x.shape[axis]
+
+    forma = [1] * x.ndim
+    forma[axis] = N // 2 + 1
+    X = rfft(x, axis=axis)
+    X *= mascara_analitica(N).reshape(forma)
+    return ifft(X, n=N, axis=axis, sobrescribir=True)
+
+
+@instrumentar
+def analizar_analitica(x, fs=1.0, axis=-1):
+    """
+    Calcula la señal analítica y todas sus magnitudes derivadas juntas.
+
+    Parámetros:
+    x: Señal real (1-D o un lote de señales)
+    fs: Frecuencia de muestreo (Hz), para la frecuencia instantánea
+    axis: Eje del tiempo
+
+    Retorna:
+    Diccionario con arrays de la misma forma que x:
+    'analitica': señal analítica x + j·H{x}
+    'hilbert': transformada de Hilbert H{x}
+    'envolvente': envolvente compleja |x + j·H{x}|
+    'fase': fase instantánea desenvuelta (rad)
+    'frecuencia': frecuencia instantánea (Hz)
+    """
+    z = señal_analitica_rfft(x, axis)
+    fase = np.unwrap(np.angle(z), axis=axis)
+    return {
+        'analitica': z,
+        'hilbert': z.imag,
+        'envolvente': np.abs(z),
+        'fase': fase,
+        'frecuencia': np.gradient(fase, axis=axis) * fs / (2*np.pi),
+    }
+
+
+# =============================================================================
+# TRANSFORMADOR DE HILBERT FIR POR BLOQUES (OVERLAP-SAVE)
+# =============================================================================
+def nucleo_hilbert(num_taps=255, ventana='hamming'):
+    """
+    Respuesta al impulso de un transformador de Hilbert FIR de fase lineal.
+
+    Es la respuesta ideal h[k] = 2/(πk) para k impar y 0 para k par
+    (k = -D..D, D = (num_taps - 1)/2), truncada con una ventana. El retardo
+    de grupo es exactamente D muestras.
+
+    Parámetros:
+    num_taps: Cantidad de coeficientes (impar)
+    ventana: Ventana de truncamiento (scipy.signal.get_window)
+
+    Retorna:
+    Array con los num_taps coeficientes
+    """
+    if num_taps % 2 == 0:
+        raise ValueError("num_taps debe ser impar para tener un retardo entero")
+    k = np.arange(num_taps) - (num_taps - 1) // 2
+    h = np.zeros(num_taps)
+    impares = k % 2 != 0
+    h[impares] = 2 / (np.pi * k[impares])
+    from scipy.signal import get_window  # scipy.signal solo se importa si se usa
+    return h * get_window(ventana, num_taps, fftbins=False)
+
+
+class HilbertStreaming:
+    """
+    Señal analítica de un flujo sin fin, calculada por bloques con overlap-save.
+
+    La parte imaginaria es la convolución con nucleo_hilbert y la parte real
+    es la entrada retrasada el mismo retardo de grupo D = (num_taps - 1)/2, de
+    modo que la muestra de salida k corresponde a la entrada k - D. A
+    diferencia de hilbert_transform_fft la convolución es lineal (no
+    circular): no hay efectos de borde por el cierre circular de la FFT.
+
+    El estado entre llamadas son las últimas num_taps - 1 muestras y las
+    muestras que aún no completan un paso, así que la memoria es constante.
+    """
+
+    def __init__(self, num_taps=255, tam_bloque=4096, ventana='hamming'):
+        self.h = nucleo_hilbert(num_taps, ventana)
+        self.retardo = (num_taps - 1) // 2
+        self.n_fft = longitud_rapida(tam_bloque + num_taps - 1)
+        self.salto = self.n_fft - num_taps + 1
+        self._H = rfft(self.h, n=self.n_fft)
+        self._datos = np.zeros(num_taps - 1)
+
+    def procesar(self, bloque):
+        """
+        Procesa nuevas muestras y devuelve la salida que ya se puede calcular.
+
+        Parámetros:
+        bloque: Array 1-D con muestras nuevas (de cualquier longitud)
+
+        Retorna:
+        Array complejo con las muestras analíticas completas (un múltiplo
+        del paso interno; el resto queda pendiente para la próxima llamada)
+        """
+        M = len(self.h)
+        datos = np.concatenate((self._datos, np.asarray(bloque, dtype=float)))
+        n_pasos = (len(datos) - (M - 1)) // self.salto
+        if n_pasos <= 0:
+            self._datos = datos
+            return np.empty(0, dtype=complex)
+
+        # Segmentos solapados de n_fft muestras (vistas, sin copia). Como
+        # n_fft = salto + M - 1, el último termina en n_pasos·salto + M - 1,
+        # que nunca supera len(datos)
+        fin = (n_pasos - 1) * self.salto + self.n_fft
+        segmentos = np.lib.stride_tricks.sliding_window_view(
+            datos[:fin], self.n_fft)[::self.salto]
+
+        y = irfft(rfft(segmentos, axis=-1) * self._H, self.n_fft, axis=-1)
+        salida = np.empty(n_pasos * self.salto, dtype=complex)
+        salida.imag = y[:, M - 1:M - 1 + self.salto].ravel()
+        inicio = M - 1 - self.retardo
+        salida.real = datos[inicio:inicio + len(salida)]
+
+        self._datos = datos[n_pasos * self.salto:].copy()
+        return salida
+
+    def finalizar(self):
+        """
+        Vacía el estado completando con ceros y devuelve las muestras restantes
+        (incluidas las últimas retardo muestras de la entrada).
+        """
+        pendientes = len(self._datos) - (len(self.h) - 1) + self.retardo
+        faltan = (-pendientes) % self.salto
+        salida = self.procesar(np.zeros(self.retardo + faltan))
+        return salida[:pendientes]
+
+
+def analitica_streaming(bloques, num_taps=255, tam_bloque=4096, ventana='hamming'):
+    """
+    Etapa de generador: transforma un iterable de bloques reales en bloques
+    de señal analítica (retrasada (num_taps - 1)/2 muestras).
+
+    Parámetros:
+    bloques: Iterable de arrays 1-D (por ejemplo espectro.leer_bloques)
+    num_taps, tam_bloque, ventana: Ver HilbertStreaming
+
+    Retorna:
+    Generador de arrays complejos; al agotarse la entrada se vacía el estado
+    """
+    etapa = HilbertStreaming(num_taps, tam_bloque, ventana)
+    for bloque in bloques:
+        salida = etapa.procesar(bloque)
+        if len(salida):
+            yield salida
+    salida = etapa.finalizar()
+    if len(salida):
+        yield salida
+
+
+def envolvente_streaming(bloques, num_taps=255, tam_bloque=4096, ventana='hamming'):
+    """
+    Etapa de generador: detección de envolvente |x + j·H{x}| por bloques.
+
+    Retorna:
+    Generador de arrays reales con la envolvente (retrasada (num_taps - 1)/2
+    muestras)
+    """
+    for z in analitica_streaming(bloques, num_taps, tam_bloque, ventana):
+        yield np.abs(z)
+
+
+# =============================================================================
+# BENCHMARK FRENTE A scipy.signal.hilbert
+# =============================================================================
+if __name__ == "__main__":
+    import timeit
+    from scipy.signal import hilbert
+
+    print("Longitud  canales  scipy (ms)  una pasada (ms)  diferencia máx")
+    for N, canales in [(1000, 1), (2**16, 1), (10**6, 1), (4096, 256)]:
+        x = np.random.randn(canales, N)
+        repeticiones = max(3, 2_000_000 // (N * canales))
+        t_scipy = timeit.timeit(lambda: hilbert(x, axis=-1), number=repeticiones) / repeticiones
+        t_propio = timeit.timeit(lambda: señal_analitica_rfft(x), number=repeticiones) / repeticiones
+        error = np.max(np.abs(hilbert(x, axis=-1) - señal_analitica_rfft(x)))
+        print(f"{N:>8}  {canales:>7}  {1e3*t_scipy:>10.3f}  {1e3*t_propio:>15.3f}  {error:>14.2e}")
@@ -0,0 +1,201 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .transformadas import rfft
+from .espectro import medir_tonos
+from .series_fourier import analizar_gibbs, reconstrucciones_parciales
+from .analitica import analizar_analitica
+
+# =============================================================================
+# MÉTRICAS DE CADA EJERCICIO
+# =============================================================================
+# Cada función recibe la base de tiempo compartida t (muestras a fs, de
+# duración dada por el ejercicio) y los parámetros del punto de la grilla, y
+# devuelve un diccionario de métricas escalares
+def metricas_espectro(t, fs, T, tonos=(50, 120, 200), amplitudes=(1.0, 0.5, 0.3), fase=np.pi/2):
+    """
+    Ejercicio 1: fuga espectral y error de amplitud de una suma de tonos.
+
+    La fuga es la fracción de la energía del espectro que cae fuera de los
+    bins más cercanos a cada tono (cero si todos los tonos caen en un bin).
+    """
+    tonos, amplitudes = np.asarray(tonos, dtype=float), np.asarray(amplitudes, dtype=float)
+    x = np.sin(2*np.pi*np.outer(tonos, t) + fase).T @ amplitudes
+    N = len(x)
+    potencia = np.abs(rfft(x))**2
+    bins = np.unique(np.round(tonos * N / fs).astype(int))
+    amp, _ = medir_tonos(x, tonos, fs)
+    return {'fuga': 1 - potencia[bins].sum() / potencia.sum(),
+            'error_amplitud': np.max(np.abs(amp - amplitudes))}
+
+
+def metricas_fourier(t, fs, T, armonicos=50, A=1.0):
+    """
+    Ejercicio 2: MSE y sobrepico de la suma parcial de una onda cuadrada.
+
+    El MSE se mide sobre la grilla t; el sobrepico con analizar_gibbs junto
+    al salto de -A a A en t = 0, porque el máximo de la grilla no resuelve
+    el rizado cuando fs es baja frente a los armónicos.
+    """
+    f0 = 1 / T
+    cuadrada = A * np.sign(np.sin(2*np.pi*f0*t))
+    coeficientes = [(n, 4*A/(n*np.pi)) for n in range(1, armonicos + 1, 2)]
+    _, (mse,) = reconstrucciones_parciales(t, coeficientes, [armonicos], f0, original=cuadrada)
+    gibbs = analizar_gibbs(coeficientes, f0, (0.0, -A, A), [armonicos])
+    return {'mse': mse, 'sobrepico': float(gibbs['sobrepico'][0])}
+
+
+def metricas_hilbert(t, fs, T, f_sin=10):
+    """Ejercicio 3: error RMS de la transformada de Hilbert de sin(2πft) (= -cos)."""
+    resultado = analizar_analitica(np.sin(2*np.pi*f_sin*t), fs)
+    return {'rms_hilbert': np.sqrt(np.mean((resultado['hilbert'] + np.cos(2*np.pi*f_sin*t))**2)),
+            'rms_envolvente': np.sqrt(np.mean((resultado['envolvente'] - 1)**2))}
+
+
+# Métrica, duración de la base de tiempo y parámetros por defecto de cada ejercicio
+EJERCICIOS = {
+    'espectro': (metricas_espectro, lambda p: p['T'], {'fs': 1000, 'T': 1.0}),
+    'fourier': (metricas_fourier, lambda p: 2 * p['T'], {'fs': 500, 'T': 1.0}),
+    'hilbert': (metricas_hilbert, lambda p: p['T'], {'fs': 1000, 'T': 1.0}),
+}
+
+
+# =============================================================================
+# BASES DE TIEMPO EN MEMORIA COMPARTIDA
+# =============================================================================
+def _crear_base(fs, duracion):
+    """Crea la base de tiempo t = n/fs en un bloque de memoria compartida."""
+    n = int(round(fs * duracion))
+    bloque = shared_memory.SharedMemory(create=True, size=max(1, n * 8))
+    t = np.ndarray(n, dtype=np.float64, buffer=bloque.buf)
+    t[:] = np.arange(n) / fs
+    return bloque, (bloque.name, n)
+
+
+def _trabajo(tareas):
+    """
+    Trabajo de un proceso: evalúa las métricas de un lote de puntos de la grilla.
+
+    Las bases de tiempo se abren por nombre (vistas de solo lectura, sin
+    copiarlas) y se cierran al terminar el lote, para que los procesos del
+    pool no las mantengan mapeadas después de que el principal las borra.
+    """
+    abiertos = {}
+    try:
+        resultados = []
+        for indice, ejercicio, (nombre, n), parametros in tareas:
+            if nombre not in abiertos:
+                abiertos[nombre] = shared_memory.SharedMemory(name=nombre)
+            t = np.ndarray(n, dtype=np.float64, buffer=abiertos[nombre].buf)
+            t.setflags(write=False)
+            resultados.append((indice, EJERCICIOS[ejercicio][0](t, **parametros)))
+            del t   # close falla si quedan vistas del bloque
+        return resultados
+    finally:
+        for bloque in abiertos.values():
+            bloque.close()
+
+
+# =============================================================================
+# BARRIDO DE PARÁMETROS
+# =============================================================================
+def _columna(valores):
+    """Convierte una columna a un array numérico, o de texto si no es escalar."""
+    if all(np.isscalar(v) and not isinstance(v, str) for v in valores):
+        return np.asarray(valores)
+    return np.asarray([str(v) for v in valores])
+
+
+def barrido(ejercicio, grilla, procesos=None, lote=None):
+    """
+    Evalúa las métricas de un ejercicio en todas las combinaciones de una grilla.
+
+    Cada combinación distinta de (fs, duración) tiene una base de tiempo que
+    se crea una sola vez en memoria compartida; los procesos la abren por
+    nombre en lugar de recibir una copia con cada tarea. Las tareas se
+    reparten en lotes para que el costo de comunicación no limite la escala
+    con muchos núcleos.
+
+    Parámetros:
+    ejercicio: 'espectro', 'fourier' o 'hilbert' (ver EJERCICIOS)
+    grilla: Diccionario {parámetro: lista de valores}; los parámetros que no
+            aparecen toman el valor por defecto del ejercicio
+    procesos: Procesos del pool (por defecto os.cpu_count())
+    lote: Tareas por envío a cada proceso (por defecto ~4 lotes por proceso)
+
+    Retorna:
+    Array estructurado con una fila por combinación y una columna por
+    parámetro barrido y por métrica
+    """
+    _, duracion, defecto = EJERCICIOS[ejercicio]
+    nombres = list(grilla)
+    combinaciones = [dict(defecto, **dict(zip(nombres, valores)))
+                     for valores in itertools.product(*grilla.values())]
+    if not combinaciones:
+        return np.empty(0, dtype=[(n, np.float64) for n in nombres])
+    procesos = procesos or os.cpu_count()
+    lote = lote or max(1, len(combinaciones) // (4 * procesos))
+
+    bloques, descriptores = {}, {}
+    try:
+        tareas = []
+        for i, parametros in enumerate(combinaciones):
+            clave = (parametros['fs'], duracion(parametros))
+            if clave not in descriptores:
+                bloques[clave], descriptores[clave] = _crear_base(*clave)
+            tareas.append((i, ejercicio, descriptores[clave], parametros))
+        metricas = [None] * len(tareas)
+        lotes = [tareas[k:k + lote] for k in range(0, len(tareas), lote)]
+        with ProcessPoolExecutor(procesos) as pool:
+            for resultados in pool.map(_trabajo, lotes):
+                for i, resultado in resultados:
+                    metricas[i] = resultado
+    finally:
+        for bloque in bloques.values():
+            bloque.close()
+            bloque.unlink()
+
+    columnas = {n: _columna([p[n] for p in combinaciones]) for n in nombres}
+    columnas.update({m: np.asarray([r[m] for r in metricas]) for m in metricas[0]})
+    tabla = np.empty(len(combinaciones), dtype=[(n, c.dtype) for n, c in columnas.items()])
+    for n, c in columnas.items():
+        tabla[n] = c
+    return tabla
+
+
+def imprimir_tabla(tabla):
+    """Imprime un resultado de barrido como tabla de texto."""
+    nombres = tabla.dtype.names
+    filas = [[f'{v:.4g}' if np.issubdtype(type(v), np.floating) else str(v) for v in fila]
+             for fila in tabla]
+    anchos = [max([12, len(n)] + [len(f[j]) for f in filas]) for j, n in enumerate(nombres)]
+    print('  '.join(f'{n:>{a}}' for n, a in zip(nombres, anchos)))
+    for fila in filas:
+        print('  '.join(f'{v:>{a}}' for v, a in zip(fila, anchos)))
+
+
+# =============================================================================
+# EJEMPLO Y ESCALABILIDAD
+# =============================================================================
+if __name__ == "__main__":
+    # Tonos en bin y fuera de bin: la fuga aparece cuando f·T no es entero
+    imprimir_tabla(barrido('espectro', {'T': [1.0, 0.993], 'tonos': [(50, 120, 200), (50.5, 120, 200)]}))
+    print()
+    imprimir_tabla(barrido('fourier', {'armonicos': [1, 5, 21, 101], 'fs': [500, 5000]}))
+    print()
+    imprimir_tabla(barrido('hilbert', {'f_sin': [10, 10.5, 100]}))
+
+    # Escalabilidad: el mismo barrido con 1 proceso y con todos los núcleos
+    grilla = {'f_sin': np.linspace(1, 200, 256), 'fs': [1000, 4000]}
+    tiempos = {}
+    for procesos in sorted({1, os.cpu_count()}):
+        inicio = time.perf_counter()
+        barrido('hilbert', grilla, procesos=procesos)
+        tiempos[procesos] = time.perf_counter() - inicio
+        print(f"\n{procesos:>3} procesos: {tiempos[procesos]:.2f} s "
+              f"(aceleración {tiempos[1]/tiempos[procesos]:.1f}x)")
@@ -0,0 +1,72 @@
+import argparse
+import contextlib
+import os
+
+# =============================================================================
+# OPCIONES COMUNES DE LOS EJERCICIOS
+# =============================================================================
+# Este módulo no importa matplotlib ni scipy: una corrida con --no-plot solo
+# paga el import de numpy y de los módulos de cálculo que use el ejercicio
+def parsear_argumentos(descripcion, argv=None):
+    """
+    Interpreta las opciones de línea de comandos de un ejercicio.
+
+    Opciones:
+    --no-plot: Solo calcula e imprime resultados (no importa matplotlib)
+    --output DIR: Guarda las figuras en DIR sin abrir ventanas
+    --formatos: Extensiones de las figuras guardadas, por ejemplo png,pdf
+    --perfil ARCHIVO: Mide las funciones instrumentadas y guarda la traza
+
+    Parámetros:
+    descripcion: Texto de ayuda del ejercicio
+    argv: Lista de argumentos (por defecto sys.argv[1:])
+
+    Retorna:
+    Namespace con no_plot, output, formatos y perfil
+    """
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument('--no-plot', action='store_true',
+                        help="Solo calcula; no importa matplotlib ni genera figuras")
+    parser.add_argument('--output', metavar='DIR', default=None,
+                        help="Guarda las figuras en DIR en lugar de mostrarlas")
+    parser.add_argument('--formatos', default='png', help="Extensiones, por ejemplo png,pdf")
+    parser.add_argument('--perfil', metavar='ARCHIVO', default=None,
+                        help="Guarda una traza de tiempos (formato de Chrome/Perfetto) en "
+                             "ARCHIVO y las pilas plegadas para flame graph en .folded")
+    return parser.parse_args(argv)
+
+
+@contextlib.contextmanager
+def perfilar(opciones):
+    """
+    Enciende la instrumentación mientras corre el bloque si se pidió --perfil.
+
+    Al terminar escribe la traza, las pilas plegadas (mismo nombre con
+    extensión .folded) e imprime el resumen por función.
+    """
+    if opciones.perfil is None:
+        yield
+        return
+    from . import instrumentacion
+    instrumentacion.activar()
+    try:
+        yield
+    finally:
+        instrumentacion.desactivar()
+        instrumentacion.exportar_traza(opciones.perfil)
+        instrumentacion.exportar_pilas(os.path.splitext(opciones.perfil)[0] + '.folded')
+        print()
+        instrumentacion.imprimir_resumen()
+
+
+def preparar_salida(opciones):
+    """
+    Configura la capa de gráficos según las opciones (importa matplotlib).
+
+    Retorna:
+    La función graficos.mostrar, para terminar cada figura
+    """
+    from . import graficos
+    if opciones.output is not None:
+        graficos.configurar_salida(opciones.output, opciones.formatos.split(','))
+    return graficos.mostrar
@@ -0,0 +1,453 @@
+import heapq
+
+import numpy as np
+
+from .entropia import SIMBOLOS, _como_bytes, decodificar_utf8, entropia_conteos
+
+# =============================================================================
+# SÍMBOLOS DE UNA FUENTE
+# =============================================================================
+def simbolos_de_fuente(fuente, modo='utf8'):
+    """
+    Convierte una fuente en una secuencia de ids de símbolo densos.
+
+    Parámetros:
+    fuente: Texto, bytes, array uint8 o ruta a un archivo (pathlib.Path)
+    modo: 'bytes' o 'utf8' (un símbolo por carácter)
+
+    Retorna:
+    Tupla (simbolos, alfabeto, conteos): simbolos son ids 0..K-1, alfabeto el
+    byte o code point de cada id y conteos la cantidad de apariciones por id
+    """
+    datos = np.asarray(_como_bytes(fuente))
+    valores = datos if modo == 'bytes' else decodificar_utf8(datos)
+    conteos = np.bincount(valores, minlength=SIMBOLOS[modo])
+    alfabeto = np.flatnonzero(conteos)
+    ids = np.zeros(SIMBOLOS[modo], dtype=np.int32)
+    ids[alfabeto] = np.arange(len(alfabeto))
+    return ids[valores], alfabeto, conteos[alfabeto]
+
+
+# =============================================================================
+# CÓDIGO DE HUFFMAN
+# =============================================================================
+def _largos_limitados(pesos, largo_maximo):
+    """
+    Largos óptimos de un código prefijo con palabras de a lo sumo largo_maximo
+    bits (algoritmo package-merge de Larmore y Hirschberg).
+
+    Se repite largo_maximo - 1 veces: se agrupan de a pares los elementos de
+    la lista (paquetes) y se intercalan por peso con las hojas originales. El
+    largo de cada símbolo es la cantidad de veces que aparece entre los
+    primeros 2n - 2 elementos de la lista final.
+    """
+    n = len(pesos)
+    # Cada elemento es (peso, desempate, contenido): una hoja (id) o un par de elementos
+    hojas = sorted((int(w), i, i) for i, w in enumerate(pesos))
+    lista = list(hojas)
+    desempate = n
+    for _ in range(largo_maximo - 1):
+        paquetes = []
+        for a, b in zip(lista[0::2], lista[1::2]):
+            paquetes.append((a[0] + b[0], desempate, (a, b)))
+            desempate += 1
+        lista = list(heapq.merge(hojas, paquetes))
+    largos = np.zeros(n, dtype=np.int64)
+    pendientes = list(lista[:2 * n - 2])
+    while pendientes:
+        contenido = pendientes.pop()[2]
+        if isinstance(contenido, tuple):
+            pendientes.extend(contenido)
+        else:
+            largos[contenido] += 1
+    return largos
+
+
+def codigo_huffman(conteos, largo_maximo=20):
+    """
+    Construye un código de Huffman canónico a partir de los conteos.
+
+    Las longitudes salen del algoritmo clásico con un heap (se unen siempre
+    los dos nodos de menor conteo); los códigos se asignan en forma canónica
+    (ordenados por longitud y símbolo), que es lo que permite decodificar con
+    una tabla. Con distribuciones muy sesgadas (conteos que crecen como
+    potencias de 2) las palabras pueden superar largo_maximo bits: en ese caso
+    los largos se recalculan con package-merge, el código óptimo con ese
+    límite, para que la tabla del decodificador siga siendo chica.
+
+    Parámetros:
+    conteos: Array de conteos por id de símbolo, o un Counter/dict
+             {símbolo: conteo} (entonces los ids siguen el orden de sus claves)
+    largo_maximo: Largo máximo de palabra (None = sin límite)
+
+    Retorna:
+    Tupla (largos, codigos): arrays indexados por id de símbolo
+    """
+    if isinstance(conteos, dict):
+        conteos = list(conteos.values())
+    conteos = np.asarray(conteos)
+    K = len(conteos)
+    largos = np.zeros(K, dtype=np.int64)
+    presentes = [i for i in range(K) if conteos[i] > 0]
+    if largo_maximo is not None and len(presentes) > 1 << largo_maximo:
+        raise ValueError(f"{len(presentes)} símbolos no entran en palabras de {largo_maximo} bits")
+    if len(presentes) == 1:
+        largos[presentes[0]] = 1
+    elif presentes:
+        # Cada nodo del heap es (conteo, desempate, símbolos que contiene)
+        heap = [(int(conteos[i]), i, [i]) for i in presentes]
+        heapq.heapify(heap)
+        desempate = K
+        while len(heap) > 1:
+            c1, _, s1 = heapq.heappop(heap)
+            c2, _, s2 = heapq.heappop(heap)
+            largos[s1] += 1
+            largos[s2] += 1
+            heapq.heappush(heap, (c1 + c2, desempate, s1 + s2))
+            desempate += 1
+        if largo_maximo is not None and largos.max() > largo_maximo:
+            largos[presentes] = _largos_limitados(conteos[presentes], largo_maximo)
+
+    codigos = np.zeros(K, dtype=np.uint64)
+    codigo, largo_previo = 0, 0
+    for i in sorted(presentes, key=lambda i: (largos[i], i)):
+        codigo <<= int(largos[i]) - largo_previo
+        codigos[i] = codigo
+        codigo += 1
+        largo_previo = int(largos[i])
+    return largos, codigos
+
+
+def huffman_codificar(simbolos, largos, codigos, simbolos_por_bloque=4096,
+                      tam_tramo=1 << 20):
+    """
+    Codifica una secuencia de ids con un código de Huffman, sin bucle por símbolo.
+
+    Con las posiciones de inicio de cada palabra (suma acumulada de los
+    largos) cada bit de cada palabra se escribe con una asignación
+    vectorizada; hay tantas pasadas como el largo máximo del código. Los bits
+    se empaquetan con np.packbits. La secuencia se procesa por tramos para
+    acotar la memoria (los bits sobrantes de un tramo pasan al siguiente).
+
+    Además se guarda el desplazamiento en bits del comienzo de cada bloque de
+    simbolos_por_bloque símbolos, para poder decodificar todos los bloques en
+    paralelo.
+
+    Parámetros:
+    simbolos: Array de ids de símbolo
+    largos, codigos: Resultado de codigo_huffman
+    simbolos_por_bloque: Símbolos entre dos entradas del índice de bloques
+    tam_tramo: Símbolos procesados por tramo
+
+    Retorna:
+    Tupla (datos, desplazamientos, n_bits): bytes empaquetados (uint8), bit
+    de inicio de cada bloque y cantidad total de bits útiles
+    """
+    simbolos = np.asarray(simbolos)
+    largos = np.asarray(largos)
+    if len(simbolos) == 0:
+        return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.int64), 0
+    partes, desplazamientos = [], []
+    resto = np.empty(0, dtype=np.uint8)
+    total = 0
+    for inicio_tramo in range(0, len(simbolos), tam_tramo):
+        s = simbolos[inicio_tramo:inicio_tramo + tam_tramo]
+        L = largos[s]
+        C = codigos[s]
+        fin = np.cumsum(L)
+        inicio = fin - L
+        primeros = np.arange(-inicio_tramo % simbolos_por_bloque, len(s), simbolos_por_bloque)
+        desplazamientos.append(total + inicio[primeros])
+        bits = np.zeros(len(resto) + int(fin[-1]), dtype=np.uint8)
+        bits[:len(resto)] = resto
+        inicio += len(resto)
+        for j in range(int(L.max())):
+            m = L > j
+            bits[inicio[m] + j] = (C[m] >> (L[m] - 1 - j).astype(np.uint64)) & np.uint64(1)
+        total += int(fin[-1])
+        completos = len(bits) - len(bits) % 8
+        partes.append(np.packbits(bits[:completos]))
+        resto = bits[completos:]
+    partes.append(np.packbits(resto))
+    datos = np.concatenate(partes) if partes else np.empty(0, dtype=np.uint8)
+    desplazamientos = np.concatenate(desplazamientos) if desplazamientos else np.empty(0, dtype=np.int64)
+    return datos, desplazamientos, total
+
+
+def huffman_decodificar(datos, desplazamientos, n, largos, codigos, simbolos_por_bloque=4096):
+    """
+    Decodifica con una tabla de búsqueda, avanzando todos los bloques a la vez.
+
+    La tabla tiene 2^Lmax entradas: los Lmax bits siguientes a la posición
+    actual indican directamente el símbolo y su largo. Cada bloque del índice
+    es un carril independiente, así que cada paso del bucle decodifica un
+    símbolo de todos los bloques con operaciones vectorizadas.
+
+    Parámetros:
+    datos, desplazamientos: Resultado de huffman_codificar
+    n: Cantidad de símbolos codificados
+    largos, codigos: Código de Huffman usado
+    simbolos_por_bloque: El mismo valor usado al codificar
+
+    Retorna:
+    Array con los ids de símbolo
+    """
+    largos = np.asarray(largos)
+    if n == 0:
+        return np.empty(0, dtype=np.int32)
+    Lmax = int(largos.max())
+    if Lmax > 25:
+        raise ValueError("Código con palabras de más de 25 bits: no entra en la tabla "
+                         "(construirlo con codigo_huffman(conteos, largo_maximo<=25))")
+    tabla_simbolo = np.zeros(1 << Lmax, dtype=np.int32)
+    tabla_largo = np.zeros(1 << Lmax, dtype=np.int64)
+    for i in np.flatnonzero(largos):
+        desde = int(codigos[i]) << (Lmax - int(largos[i]))
+        hasta = (int(codigos[i]) + 1) << (Lmax - int(largos[i]))
+        tabla_simbolo[desde:hasta] = i
+        tabla_largo[desde:hasta] = largos[i]
+
+    relleno = np.concatenate((datos, np.zeros(4, dtype=np.uint8))).astype(np.uint32)
+    pos = np.asarray(desplazamientos, dtype=np.int64).copy()
+    carriles = len(pos)
+    ultimo = n - (carriles - 1) * simbolos_por_bloque
+    salida = np.empty(carriles * simbolos_por_bloque, dtype=np.int32)
+    base = np.arange(carriles) * simbolos_por_bloque
+    # El carril más largo tiene min(S, n) símbolos: con una fuente corta no se
+    # recorren los pasos vacíos del bloque
+    for paso in range(min(simbolos_por_bloque, n)):
+        k = carriles if paso < ultimo else carriles - 1
+        p = pos[:k]
+        b = p >> 3
+        palabra = (relleno[b] << 24) | (relleno[b + 1] << 16) | (relleno[b + 2] << 8) | relleno[b + 3]
+        indice = ((palabra << (p & 7).astype(np.uint32)) & np.uint32(0xFFFFFFFF)) >> np.uint32(32 - Lmax)
+        salida[base[:k] + paso] = tabla_simbolo[indice]
+        p += tabla_largo[indice]
+    return salida[:n]
+
+
+# =============================================================================
+# CODIFICADOR DE RANGO (rANS ENTRELAZADO)
+# =============================================================================
+RANS_L = 1 << 16  # Límite inferior del estado; se emiten palabras de 16 bits
+
+
+def cuantizar_frecuencias(conteos, bits_escala=16):
+    """
+    Escala los conteos a frecuencias enteras que suman 2^bits_escala.
+
+    Todo símbolo presente conserva al menos frecuencia 1; la diferencia de
+    redondeo se descuenta o suma a los símbolos más frecuentes.
+    """
+    conteos = np.asarray(conteos, dtype=float)
+    M = 1 << bits_escala
+    if np.count_nonzero(conteos) > M:
+        raise ValueError(f"{np.count_nonzero(conteos)} símbolos presentes no entran en una escala "
+                         f"de 2^{bits_escala}: cada uno necesita frecuencia >= 1")
+    f = np.where(conteos > 0, np.maximum(1, np.round(conteos * M / conteos.sum())), 0).astype(np.int64)
+    orden = np.argsort(-f)
+    i = 0
+    while f.sum() != M:
+        j = orden[i % len(orden)]
+        if f.sum() > M and f[j] > 1:
+            f[j] -= 1
+        elif f.sum() < M:
+            f[j] += 1
+        i += 1
+    return f
+
+
+def rans_codificar(simbolos, frecuencias, bits_escala=16, simbolos_por_carril=4096):
+    """
+    Codifica con rANS (codificador de rango asimétrico) en carriles entrelazados.
+
+    rANS codifica cada símbolo s en el estado entero x como
+        x' = (x // f_s)·2^bits_escala + x mod f_s + F_s
+    (F_s = frecuencia acumulada) y emite 16 bits cuando x supera el límite,
+    alcanzando la entropía del modelo salvo el redondeo de las frecuencias. El
+    estado es secuencial, así que la secuencia se divide en carriles de
+    simbolos_por_carril símbolos que se codifican a la vez con operaciones
+    vectorizadas (un símbolo de cada carril por paso).
+
+    Parámetros:
+    simbolos: Array de ids de símbolo
+    frecuencias: Resultado de cuantizar_frecuencias
+    bits_escala: Bits de la escala de frecuencias (<= 16)
+    simbolos_por_carril: Símbolos de cada carril
+
+    Retorna:
+    Tupla (palabras, largos): palabras uint16 de todos los carriles
+    concatenadas y cantidad de palabras de cada carril
+    """
+    simbolos = np.asarray(simbolos)
+    n = len(simbolos)
+    f = np.asarray(frecuencias, dtype=np.uint64)
+    F = np.concatenate(([0], np.cumsum(f)[:-1])).astype(np.uint64)
+    S = simbolos_por_carril
+    carriles = -(-n // S)
+    ultimo = n - (carriles - 1) * S
+    matriz = np.zeros(carriles * S, dtype=simbolos.dtype)
+    matriz[:n] = simbolos
+    matriz = matriz.reshape(carriles, S)
+
+    escala = np.uint64(bits_escala)
+    x = np.full(carriles, RANS_L, dtype=np.uint64)
+    palabras = np.zeros((carriles, S + 2), dtype=np.uint16)
+    ptr = np.zeros(carriles, dtype=np.int64)
+    limite = np.uint64((RANS_L >> bits_escala) << 16)
+    # Solo los pasos del carril más largo (min(S, n)), no los S del carril nominal
+    for paso in range(min(S, n) - 1, -1, -1):
+        k = carriles if paso < ultimo else carriles - 1
+        s = matriz[:k, paso]
+        fs = f[s]
+        xs = x[:k]
+        emite = np.flatnonzero(xs >= limite * fs)
+        palabras[emite, ptr[emite]] = xs[emite] & np.uint64(0xFFFF)
+        ptr[emite] += 1
+        xs[emite] >>= np.uint64(16)
+        x[:k] = ((xs // fs) << escala) + xs % fs + F[s]
+
+    filas = np.arange(carriles)
+    palabras[filas, ptr] = x & np.uint64(0xFFFF)
+    palabras[filas, ptr + 1] = x >> np.uint64(16)
+    ptr += 2
+    mascara = np.arange(S + 2) < ptr[:, None]
+    return palabras[mascara], ptr
+
+
+def rans_decodificar(palabras, largos, n, frecuencias, bits_escala=16, simbolos_por_carril=4096):
+    """
+    Decodifica rANS con una tabla de 2^bits_escala entradas (ranura -> símbolo),
+    avanzando todos los carriles a la vez.
+
+    Parámetros:
+    palabras, largos: Resultado de rans_codificar
+    n: Cantidad de símbolos codificados
+    frecuencias: Las mismas frecuencias usadas al codificar
+    bits_escala, simbolos_por_carril: Los mismos valores usados al codificar
+
+    Retorna:
+    Array con los ids de símbolo
+    """
+    f = np.asarray(frecuencias, dtype=np.uint64)
+    F = np.concatenate(([0], np.cumsum(f)[:-1])).astype(np.uint64)
+    tabla = np.repeat(np.arange(len(f), dtype=np.int32), f.astype(np.int64))
+    S = simbolos_por_carril
+    carriles = len(largos)
+    ultimo = n - (carriles - 1) * S
+    inicio = np.concatenate(([0], np.cumsum(largos)[:-1]))
+    palabras = np.asarray(palabras, dtype=np.uint64)
+
+    ptr = inicio + largos - 2
+    x = (palabras[ptr + 1] << np.uint64(16)) | palabras[ptr]
+    escala = np.uint64(bits_escala)
+    mascara = np.uint64((1 << bits_escala) - 1)
+    salida = np.empty((carriles, S), dtype=np.int32)
+    for paso in range(min(S, n)):
+        k = carriles if paso < ultimo else carriles - 1
+        xs = x[:k]
+        ranura = xs & mascara
+        s = tabla[ranura]
+        salida[:k, paso] = s
+        xs = f[s] * (xs >> escala) + ranura - F[s]
+        lee = np.flatnonzero(xs < RANS_L)
+        ptr[lee] -= 1
+        xs[lee] = (xs[lee] << np.uint64(16)) | palabras[ptr[lee]]
+        x[:k] = xs
+    return salida.ravel()[:n]
+
+
+# =============================================================================
+# COMPARACIÓN CON LA ENTROPÍA
+# =============================================================================
+def evaluar_codigos(fuente, modo='utf8', simbolos_por_bloque=4096, verificar=True):
+    """
+    Codifica una fuente con Huffman y rANS y compara los bits por símbolo con
+    la entropía de orden cero del modelo (los mismos conteos).
+
+    Parámetros:
+    fuente: Texto, bytes, array uint8 o ruta a un archivo (pathlib.Path)
+    modo: 'bytes' o 'utf8'
+    simbolos_por_bloque: Símbolos por bloque de Huffman y por carril de rANS
+    verificar: Si es True, decodifica ambos códigos y lanza RuntimeError si
+               no reproducen la fuente
+
+    Retorna:
+    Diccionario con 'entropia', 'huffman' y 'rans' (bits/símbolo de los datos
+    codificados), 'huffman_indice' y 'rans_indice' (incluyendo el índice de
+    bloques / largos de carril) y 'n' (símbolos)
+    """
+    simbolos, _, conteos = simbolos_de_fuente(fuente, modo)
+    n = len(simbolos)
+    if n == 0:
+        return {'n': 0, 'entropia': 0.0, 'huffman': 0.0, 'huffman_indice': 0.0,
+                'rans': 0.0, 'rans_indice': 0.0}
+    largos, codigos = codigo_huffman(conteos)
+    datos, desplazamientos, n_bits = huffman_codificar(simbolos, largos, codigos, simbolos_por_bloque)
+    if verificar and not np.array_equal(
+            huffman_decodificar(datos, desplazamientos, n, largos, codigos, simbolos_por_bloque),
+            simbolos):
+        raise RuntimeError("La decodificación de Huffman no reproduce la fuente")
+    f = cuantizar_frecuencias(conteos)
+    palabras, largos_carril = rans_codificar(simbolos, f, simbolos_por_carril=simbolos_por_bloque)
+    if verificar and not np.array_equal(
+            rans_decodificar(palabras, largos_carril, n, f, simbolos_por_carril=simbolos_por_bloque),
+            simbolos):
+        raise RuntimeError("La decodificación de rANS no reproduce la fuente")
+    return {
+        'n': n,
+        'entropia': entropia_conteos(conteos),
+        'huffman': n_bits / n,
+        'huffman_indice': (n_bits + 32 * len(desplazamientos)) / n,
+        'rans': 16 * len(palabras) / n,
+        'rans_indice': (16 * len(palabras) + 32 * len(largos_carril)) / n,
+    }
+
+
+# =============================================================================
+# BITS POR SÍMBOLO Y RENDIMIENTO
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    textos = {
+        'Texto en español': "el rapido zorro marron salta sobre el perro perezoso",
+        'Texto en inglés': "the quick brown fox jumps over the lazy dog",
+    }
+    print("Fuente              símbolos  entropía  Huffman  rANS  (bits/símbolo)")
+    for nombre, texto in textos.items():
+        r = evaluar_codigos(texto)
+        print(f"{nombre:<18} {r['n']:>9}  {r['entropia']:8.4f}  {r['huffman']:7.4f}  {r['rans']:6.4f}")
+
+    # Corpus más grande: palabras en español elegidas al azar
+    rng = np.random.default_rng(0)
+    palabras_es = ("el la de que y en un una los las se por con para como más pero "
+                   "señal espectro frecuencia armónico transformada información "
+                   "entropía código canal ruido muestreo período fase amplitud").split()
+    corpus = ' '.join(rng.choice(palabras_es, 2_000_000)).encode('utf-8')
+    megabytes = len(corpus) / 1e6
+    r = evaluar_codigos(corpus)
+    print(f"{'Corpus sintético':<18} {r['n']:>9}  {r['entropia']:8.4f}  {r['huffman']:7.4f}  "
+          f"{r['rans']:6.4f}")
+    print(f"  con índice de bloques: Huffman {r['huffman_indice']:.4f}, rANS {r['rans_indice']:.4f}")
+
+    simbolos, _, conteos = simbolos_de_fuente(corpus)
+    n = len(simbolos)
+    largos, codigos = codigo_huffman(conteos)
+    f = cuantizar_frecuencias(conteos)
+    tiempos = {}
+    inicio = time.perf_counter()
+    datos, desplazamientos, _ = huffman_codificar(simbolos, largos, codigos)
+    tiempos['Huffman codificar'] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    huffman_decodificar(datos, desplazamientos, n, largos, codigos)
+    tiempos['Huffman decodificar'] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    palabras, largos_carril = rans_codificar(simbolos, f)
+    tiempos['rANS codificar'] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    rans_decodificar(palabras, largos_carril, n, f)
+    tiempos['rANS decodificar'] = time.perf_counter() - inicio
+    print(f"\nRendimiento sobre {megabytes:.1f} MB:")
+    for nombre, duracion in tiempos.items():
+        print(f"  {nombre:<20} {megabytes/duracion:7.1f} MB/s")
@@ -0,0 +1,329 @@
+import ast
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .graficos import _correr_script, scripts_informe
+
+# =============================================================================
+# HUELLA DE UN SCRIPT: PARÁMETROS Y CÓDIGO FUENTE
+# =============================================================================
+CODIGOS = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(CODIGOS)
+CACHE = os.path.join(RAIZ, '.cache_informe')
+
+
+def _modulo_local(nombre):
+    """Ruta del módulo del proyecto con ese nombre, o None si es externo."""
+    partes = nombre.split('.')
+    if partes[0] == 'Codigos':
+        partes = partes[1:]
+    if not partes:
+        return None
+    ruta = os.path.join(CODIGOS, *partes) + '.py'
+    return ruta if os.path.exists(ruta) else None
+
+
+def dependencias(ruta):
+    """
+    Archivos fuente de los que depende un script (él mismo incluido).
+
+    Sigue recursivamente los import de módulos del proyecto; numpy, scipy y
+    matplotlib no se incluyen.
+
+    Retorna:
+    Lista ordenada de rutas absolutas
+    """
+    pendientes, vistas = [os.path.abspath(ruta)], set()
+    while pendientes:
+        actual = pendientes.pop()
+        if actual in vistas:
+            continue
+        vistas.add(actual)
+        with open(actual, encoding='utf-8') as archivo:
+            arbol = ast.parse(archivo.read())
+        for nodo in ast.walk(arbol):
+            if isinstance(nodo, ast.Import):
+                nombres = [a.name for a in nodo.names]
+            elif isinstance(nodo, ast.ImportFrom) and nodo.module:
+                nombres = [nodo.module] + [f'{nodo.module}.{a.name}' for a in nodo.names]
+            elif isinstance(nodo, ast.ImportFrom):
+                # from . import modulo
+                nombres = [a.name for a in nodo.names]
+            else:
+                continue
+            pendientes.extend(r for r in map(_modulo_local, nombres) if r)
+    return sorted(vistas)
+
+
+def parametros(ruta):
+    """
+    Parámetros de un script: asignaciones de primer nivel a constantes.
+
+    Se toman las asignaciones como fs = 1000, T = 1.0, harmonics = [...] o
+    f1, A1, phi1 = 50, 1.0, np.pi/2, cuyo valor no depende de otras variables
+    salvo np.pi. Sirven para informar qué cambió entre dos construcciones.
+
+    Retorna:
+    Diccionario {nombre: expresión como texto}
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        arbol = ast.parse(archivo.read())
+
+    def constante(nodo):
+        nombres = {n.id for n in ast.walk(nodo) if isinstance(n, ast.Name)}
+        return nombres <= {'np'} and not any(isinstance(n, ast.Call) for n in ast.walk(nodo))
+
+    resultado = {}
+    for nodo in arbol.body:
+        if not isinstance(nodo, ast.Assign) or len(nodo.targets) != 1:
+            continue
+        destino, valor = nodo.targets[0], nodo.value
+        if isinstance(destino, ast.Name) and constante(valor):
+            resultado[destino.id] = ast.unparse(valor)
+        elif isinstance(destino, ast.Tuple) and isinstance(valor, ast.Tuple) \
+                and len(destino.elts) == len(valor.elts):
+            for d, v in zip(destino.elts, valor.elts):
+                if isinstance(d, ast.Name) and constante(v):
+                    resultado[d.id] = ast.unparse(v)
+    return resultado
+
+
+def huella(ruta, formatos=('png',), dpi=150):
+    """
+    Hash SHA-256 del código del script, sus dependencias y la configuración de salida.
+
+    Como los parámetros están escritos en el propio script, cualquier cambio
+    en ellos cambia la huella.
+    """
+    h = hashlib.sha256()
+    for dependencia in dependencias(ruta):
+        h.update(os.path.relpath(dependencia, RAIZ).encode())
+        with open(dependencia, 'rb') as archivo:
+            h.update(archivo.read())
+    h.update(json.dumps({'formatos': list(formatos), 'dpi': dpi}).encode())
+    return h.hexdigest()[:16]
+
+
+# =============================================================================
+# EJECUCIÓN Y CACHÉ
+# =============================================================================
+# Las listas, tuplas y diccionarios se aplanan en claves del .npz con la ruta
+# de cada hoja, por ejemplo 'resultados/[0]/envolvente'; '[i]' es un índice de
+# lista, '(i)' de tupla y '#k' una clave entera de diccionario, para poder
+# reconstruir la misma estructura al leer
+_SEPARADOR = '/'
+
+
+def _aplanar(prefijo, valor, numericos):
+    """Agrega a numericos las hojas numéricas de valor (recorriendo contenedores)."""
+    if isinstance(valor, dict):
+        for clave, v in valor.items():
+            clave = f'#{clave}' if isinstance(clave, (int, np.integer)) else clave
+            _aplanar(f'{prefijo}{_SEPARADOR}{clave}', v, numericos)
+    elif isinstance(valor, (list, tuple)):
+        marca = '[{}]' if isinstance(valor, list) else '({})'
+        for i, v in enumerate(valor):
+            _aplanar(f'{prefijo}{_SEPARADOR}{marca.format(i)}', v, numericos)
+    elif isinstance(valor, (int, float, complex, np.number)) and not isinstance(valor, bool):
+        numericos[prefijo] = np.asarray(valor)
+    elif isinstance(valor, np.ndarray) and valor.dtype != object:
+        numericos[prefijo] = valor
+
+
+def _guardar_resultados(variables, ruta):
+    """Guarda en un .npz los arrays y números que devolvió (o dejó) el script."""
+    numericos = {}
+    for nombre, valor in variables.items():
+        if not nombre.startswith('_'):
+            _aplanar(nombre, valor, numericos)
+    np.savez_compressed(ruta, **numericos)
+
+
+def _reconstruir(numericos):
+    """Inversa de _aplanar: arma las listas, tuplas y diccionarios anidados."""
+    raiz = {}
+    for clave, valor in numericos.items():
+        partes = clave.split(_SEPARADOR)
+        nodo = raiz
+        for parte in partes[:-1]:
+            nodo = nodo.setdefault(parte, {})
+        nodo[partes[-1]] = valor[()] if valor.ndim == 0 else valor
+
+    def convertir(nodo):
+        if not isinstance(nodo, dict):
+            return nodo
+        hijos = {k: convertir(v) for k, v in nodo.items()}
+        if hijos and all(k[:1] in '[(' and k[1:-1].isdigit() for k in hijos):
+            orden = sorted(hijos, key=lambda k: int(k[1:-1]))
+            secuencia = [hijos[k] for k in orden]
+            return tuple(secuencia) if orden[0][0] == '(' else secuencia
+        return {int(k[1:]) if k[:1] == '#' and k[1:].lstrip('-').isdigit() else k: v
+                for k, v in hijos.items()}
+
+    return convertir(raiz)
+
+
+def _construir_entrada(ruta, entrada, formatos, dpi):
+    """Trabajo de un proceso: corre el script y llena una entrada de la caché."""
+    temporal = entrada + '.tmp'
+    shutil.rmtree(temporal, ignore_errors=True)
+    inicio = time.perf_counter()
+    variables, figuras = _correr_script(ruta, temporal, formatos, dpi)
+    _guardar_resultados(variables, os.path.join(temporal, 'resultados.npz'))
+    with open(os.path.join(temporal, 'manifiesto.json'), 'w', encoding='utf-8') as archivo:
+        json.dump({'script': os.path.relpath(ruta, RAIZ),
+                   'parametros': parametros(ruta),
+                   'figuras': [os.path.basename(f) for f in figuras],
+                   'segundos': time.perf_counter() - inicio}, archivo, indent=2, ensure_ascii=False)
+    # El renombrado es atómico: una ejecución interrumpida no deja entradas a medias
+    os.replace(temporal, entrada)
+    return entrada
+
+
+def _leer_manifiesto(entrada):
+    with open(os.path.join(entrada, 'manifiesto.json'), encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def _desalojar(carpeta, conservar, vigente):
+    """Borra las entradas viejas de un script, dejando las conservar más recientes."""
+    entradas = [os.path.join(carpeta, e) for e in os.listdir(carpeta)]
+    entradas.sort(key=os.path.getmtime, reverse=True)
+    borradas = 0
+    for entrada in entradas:
+        if entrada == vigente:
+            continue
+        if entrada.endswith('.tmp') or conservar <= 1:
+            shutil.rmtree(entrada, ignore_errors=True)
+            borradas += 1
+        else:
+            conservar -= 1
+    return borradas
+
+
+def cargar_resultados(script, cache=CACHE):
+    """
+    Resultados numéricos de la última construcción de un script.
+
+    Parámetros:
+    script: Nombre o ruta del script (por ejemplo 'ejercicio_2.py')
+    cache: Carpeta de la caché
+
+    Retorna:
+    Diccionario {variable: valor} con la misma estructura que devolvió el
+    script (listas, tuplas y diccionarios de arrays y números)
+    """
+    nombre = os.path.splitext(os.path.basename(script))[0]
+    carpeta = os.path.join(cache, nombre)
+    entradas = [os.path.join(carpeta, e) for e in os.listdir(carpeta) if not e.endswith('.tmp')]
+    entrada = max(entradas, key=os.path.getmtime)
+    with np.load(os.path.join(entrada, 'resultados.npz')) as datos:
+        return _reconstruir(dict(datos))
+
+
+def construir(scripts, salida, formatos=('png',), dpi=150, procesos=None, cache=CACHE,
+              conservar=2, forzar=False):
+    """
+    Construye las figuras y resultados del informe recalculando solo lo que cambió.
+
+    Para cada script se calcula la huella de su código, sus dependencias y la
+    configuración de salida. Si la caché ya tiene esa huella se reutilizan sus
+    figuras; si no, el script se corre (en paralelo con los demás pendientes)
+    y se guardan sus figuras, un resultados.npz con sus variables numéricas y
+    un manifiesto con los parámetros. Las figuras se copian a la salida solo
+    si su contenido cambió, para que LaTeX no vea archivos nuevos sin motivo.
+
+    Parámetros:
+    scripts: Rutas de los scripts
+    salida: Carpeta donde quedan las figuras del informe
+    formatos: Extensiones a escribir
+    dpi: Resolución de los archivos de mapa de bits
+    procesos: Procesos del pool (por defecto uno por script pendiente)
+    cache: Carpeta de la caché
+    conservar: Entradas por script que se guardan (la vigente y anteriores)
+    forzar: Si es True, recalcula todo
+
+    Retorna:
+    Lista de diccionarios por script con 'script', 'estado' ('caché' o
+    'recalculado'), 'cambios' (parámetros que difieren de la entrada
+    anterior), 'copiadas' (figuras actualizadas en la salida) y 'desalojadas'
+    """
+    os.makedirs(salida, exist_ok=True)
+    informes, pendientes = [], {}
+    for ruta in scripts:
+        carpeta = os.path.join(cache, os.path.splitext(os.path.basename(ruta))[0])
+        entrada = os.path.join(carpeta, huella(ruta, formatos, dpi))
+        anteriores = [os.path.join(carpeta, e) for e in os.listdir(carpeta)
+                      if not e.endswith('.tmp')] if os.path.isdir(carpeta) else []
+        previa = max(anteriores, key=os.path.getmtime) if anteriores else None
+        informe = {'script': os.path.relpath(ruta, RAIZ), 'entrada': entrada, 'carpeta': carpeta,
+                   'estado': 'caché', 'cambios': {}}
+        if forzar or not os.path.isdir(entrada):
+            informe['estado'] = 'recalculado'
+            if forzar:
+                shutil.rmtree(entrada, ignore_errors=True)
+            if previa and previa != entrada:
+                antes = _leer_manifiesto(previa)['parametros']
+                ahora = parametros(ruta)
+                informe['cambios'] = {k: (antes.get(k), ahora.get(k))
+                                      for k in sorted(set(antes) | set(ahora))
+                                      if antes.get(k) != ahora.get(k)}
+            pendientes[ruta] = entrada
+        informes.append(informe)
+
+    if pendientes:
+        os.makedirs(cache, exist_ok=True)
+        with ProcessPoolExecutor(procesos or len(pendientes), max_tasks_per_child=1) as pool:
+            futuros = [pool.submit(_construir_entrada, r, e, formatos, dpi)
+                       for r, e in pendientes.items()]
+            for futuro in futuros:
+                futuro.result()
+
+    for informe in informes:
+        entrada = informe.pop('entrada')
+        # Marca la entrada como la más reciente (para el desalojo y cargar_resultados)
+        os.utime(entrada)
+        informe['copiadas'] = []
+        for figura in _leer_manifiesto(entrada)['figuras']:
+            origen, destino = os.path.join(entrada, figura), os.path.join(salida, figura)
+            if not os.path.exists(destino) or not filecmp.cmp(origen, destino, shallow=False):
+                shutil.copy2(origen, destino)
+                informe['copiadas'].append(figura)
+        informe['desalojadas'] = _desalojar(informe.pop('carpeta'), conservar, entrada)
+    return informes
+
+
+# =============================================================================
+# CONSTRUCCIÓN INCREMENTAL DEL INFORME
+# =============================================================================
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Construye las figuras del informe con caché")
+    parser.add_argument('--salida', default=os.path.join(RAIZ, 'figuras'))
+    parser.add_argument('--formatos', default='png', help="Por ejemplo png,pdf")
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--forzar', action='store_true', help="Ignora la caché")
+    opciones = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    informes = construir(scripts_informe(), opciones.salida, opciones.formatos.split(','),
+                         procesos=opciones.procesos, forzar=opciones.forzar)
+    for informe in informes:
+        cambios = ', '.join(f'{k}: {a} -> {b}' for k, (a, b) in informe['cambios'].items())
+        print(f"{informe['script']:<28} {informe['estado']:<12} "
+              f"{len(informe['copiadas'])} figuras copiadas"
+              + (f" ({cambios})" if cambios else ''))
+    print(f"Construcción en {time.perf_counter() - inicio:.1f} s")
+    return informes
+
+
+if __name__ == "__main__":
+    main()
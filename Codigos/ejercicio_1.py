@@ -1,123 +1,155 @@
+# Ejecución directa (python Codigos/ejercicio_1.py, como los scripts originales
+# del curso): se importa como módulo del paquete para que funcionen los
+# imports relativos
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'Codigos'
+
 import numpy as np
-from scipy.fft import fft, fftfreq
-import matplotlib.pyplot as plt
+
+from .transformadas import rfft, frecuencias
+from .espectro import espectro_multicanal, medir_tonos, error_tonos
+from .cli import parsear_argumentos, preparar_salida, perfilar
+from .instrumentacion import instrumentar
 
 # Parámetros
 fs = 1000  # Frecuencia de muestreo (Hz)
 T = 1.0    # Duración (segundos)
-t = np.linspace(0, T, int(fs * T), endpoint=False)
 
 # Frecuencias, amplitudes y fases
 f1, A1, phi1 = 50, 1.0, np.pi/2
 f2, A2, phi2 = 120, 0.5, np.pi/2
 f3, A3, phi3 = 200, 0.3, np.pi/2
 
-# Señal compuesta
-signal = (A1 * np.sin(2 * np.pi * f1 * t + phi1) +
-          A2 * np.sin(2 * np.pi * f2 * t + phi2) +
-          A3 * np.sin(2 * np.pi * f3 * t + phi3))
-
-# Calcular FFT
-N = len(signal)
-fft_values = fft(signal)
-freq = fftfreq(N, 1/fs)
-magnitude = 2 * np.abs(fft_values) / N  # Magnitud normalizada
-
-# Frecuencias positivas y magnitudes
-positive_freq = freq[:N//2]
-positive_mag = magnitude[:N//2]
-
-# Espectro teórico
-theoretical_freqs = [f1, f2, f3]
-theoretical_amps = [A1, A2, A3]
-
-# Graficar señal compuesta y espectros
-fig, axs = plt.subplots(3, 1, figsize=(12, 7))
-
-# Señal compuesta en el tiempo
-axs[0].plot(t, signal, color='k')
-axs[0].set_title('Señal Compuesta', fontsize=12, pad=12)
-axs[0].set_xlabel('Tiempo (s)', fontsize=11, labelpad=8)
-axs[0].set_ylabel('Amplitud', fontsize=11)
-axs[0].grid(True)
-
-# Espectro FFT
-axs[1].stem(positive_freq, positive_mag, linefmt='b-', markerfmt='bo', basefmt='r-')
-axs[1].set_title('Espectro de Magnitud (FFT)', fontsize=12, pad=12)
-axs[1].set_xlabel('Frecuencia (Hz)', fontsize=11, labelpad=8)
-axs[1].set_ylabel('Magnitud', fontsize=11)
-axs[1].set_xlim(0, 250)
-axs[1].grid(True)
-
-# Espectro Teórico
-axs[2].stem(theoretical_freqs, theoretical_amps, linefmt='r-', markerfmt='ro', basefmt='r-')
-axs[2].set_title('Espectro Teórico (Ideal)', fontsize=12, pad=12)
-axs[2].set_xlabel('Frecuencia (Hz)', fontsize=11, labelpad=8)
-axs[2].set_ylabel('Amplitud', fontsize=11)
-axs[2].set_xlim(0, 250)
-axs[2].grid(True)
-
-#plt.tight_layout(rect=[0, 0, 1, 0.96])  # Más espacio arriba para el título general
-plt.subplots_adjust(hspace=1)         # Más espacio entre subplots
-plt.show()
-
-###################################################################################
-################## Análisis de espectros individuales y su suma ###################
-###################################################################################
-
-# Señales individuales
-s1 = A1 * np.sin(2 * np.pi * f1 * t + phi1)
-s2 = A2 * np.sin(2 * np.pi * f2 * t + phi2)
-s3 = A3 * np.sin(2 * np.pi * f3 * t + phi3)
-
-# FFT de cada señal individual
-fft_s1 = fft(s1)
-fft_s2 = fft(s2)
-fft_s3 = fft(s3)
-
-mag_s1 = 2 * np.abs(fft_s1) / N
-mag_s2 = 2 * np.abs(fft_s2) / N
-mag_s3 = 2 * np.abs(fft_s3) / N
-
-mag_s1_pos = mag_s1[:N//2]
-mag_s2_pos = mag_s2[:N//2]
-mag_s3_pos = mag_s3[:N//2]
-
-# Suma de los espectros individuales
-mag_sum = mag_s1_pos + mag_s2_pos + mag_s3_pos
-
-# Graficar espectros individuales y suma en una cuadrícula 2x2
-fig2, axs2 = plt.subplots(2, 2, figsize=(14, 8))
-#fig2.suptitle('Espectros individuales y suma de espectros', fontsize=15, y=1.03)
-
-axs2[0, 0].stem(positive_freq, mag_s1_pos, linefmt='b-', markerfmt='bo', basefmt='r-')
-axs2[0, 0].set_title('Espectro de señal de 50 Hz', fontsize=12, pad=10)
-axs2[0, 0].set_xlabel('Frecuencia (Hz)', fontsize=11)
-axs2[0, 0].set_ylabel('Magnitud', fontsize=11)
-axs2[0, 0].set_xlim(0, 250)
-axs2[0, 0].grid(True)
-
-axs2[0, 1].stem(positive_freq, mag_s2_pos, linefmt='g-', markerfmt='go', basefmt='r-')
-axs2[0, 1].set_title('Espectro de señal de 120 Hz', fontsize=12, pad=10)
-axs2[0, 1].set_xlabel('Frecuencia (Hz)', fontsize=11)
-axs2[0, 1].set_ylabel('Magnitud', fontsize=11)
-axs2[0, 1].set_xlim(0, 250)
-axs2[0, 1].grid(True)
-
-axs2[1, 0].stem(positive_freq, mag_s3_pos, linefmt='r-', markerfmt='ro', basefmt='r-')
-axs2[1, 0].set_title('Espectro de señal de 200 Hz', fontsize=12, pad=10)
-axs2[1, 0].set_xlabel('Frecuencia (Hz)', fontsize=11)
-axs2[1, 0].set_ylabel('Magnitud', fontsize=11)
-axs2[1, 0].set_xlim(0, 250)
-axs2[1, 0].grid(True)
-
-axs2[1, 1].stem(positive_freq, mag_sum, linefmt='m-', markerfmt='mo', basefmt='r-')
-axs2[1, 1].set_title('Suma de los tres espectros individuales', fontsize=12, pad=10)
-axs2[1, 1].set_xlabel('Frecuencia (Hz)', fontsize=11)
-axs2[1, 1].set_ylabel('Magnitud', fontsize=11)
-axs2[1, 1].set_xlim(0, 250)
-axs2[1, 1].grid(True)
-
-#plt.tight_layout(rect=[0, 0, 1, 0.97])
-plt.subplots_adjust(hspace=0.5, wspace=0.3)
-plt.show()
\ No newline at end of file
+
+@instrumentar
+def calcular(fs=fs, T=T, tonos=((f1, A1, phi1), (f2, A2, phi2), (f3, A3, phi3))):
+    """
+    Señal compuesta, su espectro y la medición de cada tono.
+
+    Parámetros:
+    fs: Frecuencia de muestreo (Hz)
+    T: Duración (s)
+    tonos: Tuplas (frecuencia, amplitud, fase) de cada componente
+
+    Retorna:
+    Diccionario con la señal, los espectros y los errores de cada tono
+    """
+    t = np.linspace(0, T, int(fs * T), endpoint=False)
+    theoretical_freqs, theoretical_amps, theoretical_phases = (list(c) for c in zip(*tonos))
+
+    # Señales individuales y señal compuesta
+    componentes = np.vstack([A * np.sin(2 * np.pi * f * t + phi) for f, A, phi in tonos])
+    signal = componentes.sum(axis=0)
+
+    # Calcular FFT (rfft: la señal es real, solo se calculan las frecuencias positivas)
+    N = len(signal)
+    fft_values = rfft(signal)
+    freq = frecuencias(N, fs)
+    magnitude = 2 * np.abs(fft_values) / N  # Magnitud normalizada
+
+    # Medición directa de los tonos y error respecto del espectro teórico
+    tone_amps, tone_phases = medir_tonos(signal, theoretical_freqs, fs)
+    err_amps, err_phases = error_tonos(tone_amps, tone_phases, theoretical_amps, theoretical_phases)
+
+    # FFT de las señales individuales en una sola llamada (canales × muestras)
+    _, mag_canales, _ = espectro_multicanal(componentes, fs)
+
+    return {
+        't': t, 'signal': signal,
+        # Frecuencias positivas y magnitudes
+        'positive_freq': freq[:N//2], 'positive_mag': magnitude[:N//2],
+        'theoretical_freqs': theoretical_freqs, 'theoretical_amps': theoretical_amps,
+        'tone_amps': tone_amps, 'tone_phases': tone_phases,
+        'err_amps': err_amps, 'err_phases': err_phases,
+        'mag_canales': mag_canales[:, :N//2],
+        # Suma de los espectros individuales
+        'mag_sum': mag_canales.sum(axis=0)[:N//2],
+    }
+
+
+def reportar(r):
+    """Imprime la medición de cada tono y su error."""
+    for f, a, ph, ea, ep in zip(r['theoretical_freqs'], r['tone_amps'], r['tone_phases'],
+                                r['err_amps'], r['err_phases']):
+        print(f"f={f} Hz: A={a:.4f} (error {ea:.2e}), fase={ph:.4f} rad (error {ep:.2e})")
+
+
+@instrumentar
+def graficar_resultados(r, mostrar):
+    """Figuras del ejercicio; mostrar termina cada figura (ver cli.preparar_salida)."""
+    import matplotlib.pyplot as plt
+    from .graficos import graficar, stem_rapido
+
+    positive_freq = r['positive_freq']
+
+    # Graficar señal compuesta y espectros
+    fig, axs = plt.subplots(3, 1, figsize=(12, 7))
+
+    # Señal compuesta en el tiempo
+    graficar(axs[0], r['t'], r['signal'], color='k')
+    axs[0].set_title('Señal Compuesta', fontsize=12, pad=12)
+    axs[0].set_xlabel('Tiempo (s)', fontsize=11, labelpad=8)
+    axs[0].set_ylabel('Amplitud', fontsize=11)
+    axs[0].grid(True)
+
+    # Espectro FFT
+    # Con cientos de bins se dibuja con una LineCollection en lugar de stem
+    stem_rapido(axs[1], positive_freq, r['positive_mag'], color='b')
+    axs[1].set_title('Espectro de Magnitud (FFT)', fontsize=12, pad=12)
+    axs[1].set_xlabel('Frecuencia (Hz)', fontsize=11, labelpad=8)
+    axs[1].set_ylabel('Magnitud', fontsize=11)
+    axs[1].set_xlim(0, 250)
+    axs[1].grid(True)
+
+    # Espectro Teórico
+    stem_rapido(axs[2], r['theoretical_freqs'], r['theoretical_amps'], color='r')
+    axs[2].set_title('Espectro Teórico (Ideal)', fontsize=12, pad=12)
+    axs[2].set_xlabel('Frecuencia (Hz)', fontsize=11, labelpad=8)
+    axs[2].set_ylabel('Amplitud', fontsize=11)
+    axs[2].set_xlim(0, 250)
+    axs[2].grid(True)
+
+    #plt.tight_layout(rect=[0, 0, 1, 0.96])  # Más espacio arriba para el título general
+    plt.subplots_adjust(hspace=1)         # Más espacio entre subplots
+    mostrar('ejercicio1_espectro', fig)
+
+    ###################################################################################
+    ################## Análisis de espectros individuales y su suma ###################
+    ###################################################################################
+
+    # Graficar espectros individuales y suma en una cuadrícula 2x2
+    fig2, axs2 = plt.subplots(2, 2, figsize=(14, 8))
+    #fig2.suptitle('Espectros individuales y suma de espectros', fontsize=15, y=1.03)
+
+    paneles = [(axs2[0, 0], r['mag_canales'][0], 'b', f'Espectro de señal de {f1} Hz'),
+               (axs2[0, 1], r['mag_canales'][1], 'g', f'Espectro de señal de {f2} Hz'),
+               (axs2[1, 0], r['mag_canales'][2], 'r', f'Espectro de señal de {f3} Hz'),
+               (axs2[1, 1], r['mag_sum'], 'm', 'Suma de los tres espectros individuales')]
+    for ax, magnitud, color, titulo in paneles:
+        stem_rapido(ax, positive_freq, magnitud, color=color)
+        ax.set_title(titulo, fontsize=12, pad=10)
+        ax.set_xlabel('Frecuencia (Hz)', fontsize=11)
+        ax.set_ylabel('Magnitud', fontsize=11)
+        ax.set_xlim(0, 250)
+        ax.grid(True)
+
+    #plt.tight_layout(rect=[0, 0, 1, 0.97])
+    plt.subplots_adjust(hspace=0.5, wspace=0.3)
+    mostrar('ejercicio1_espectros_individuales', fig2)
+
+
+def main(argv=None):
+    opciones = parsear_argumentos("Ejercicio 1: espectro de una suma de tonos", argv)
+    with perfilar(opciones):
+        r = calcular()
+        reportar(r)
+        if not opciones.no_plot:
+            graficar_resultados(r, preparar_salida(opciones))
+    return r
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,19 @@
+# Ejecución directa (python Codigos/ejercicio_2.py, como los scripts originales
+# del curso): se importa como módulo del paquete para que funcionen los
+# imports relativos
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'Codigos'
+
 # Importar librerías necesarias
 import numpy as np  # Para operaciones matemáticas y manejo de arrays
-import matplotlib.pyplot as plt  # Para crear gráficos y visualizaciones
+from .series_fourier import reconstrucciones_parciales  # Sumas parciales en una pasada
+from .series_fourier import estimar_coeficientes  # Coeficientes a partir de muestras
+from .series_fourier import detectar_discontinuidades, analizar_gibbs  # Fenómeno de Gibbs
+from .cli import parsear_argumentos, preparar_salida, perfilar  # Opciones --no-plot y --output
+from .instrumentacion import instrumentar  # Medición opcional (--perfil)
 
 # =============================================================================
 # PARÁMETROS DE CONFIGURACIÓN
@@ -10,16 +23,6 @@ A = 1.0      # Amplitud de la onda cuadrada
 T = 1.0      # Período de la onda en segundos
 f0 = 1/T     # Frecuencia fundamental (inversa del período)
 
-# =============================================================================
-# GENERACIÓN DE LA ONDA CUADRADA ORIGINAL
-# =============================================================================
-# Creamos un vector de tiempo que abarca dos períodos completos
-t = np.linspace(0, 2*T, 1000)  # 1000 puntos equidistantes entre 0 y 2T
-
-# Generamos la onda cuadrada usando la función signo aplicada a una senoidal
-# np.sign() devuelve -1 para valores negativos, 0 para cero y 1 para positivos
-square_wave = A * np.sign(np.sin(2*np.pi*f0*t))
-
 # =============================================================================
 # CONFIGURACIÓN DE ARMÓNICOS A ANALIZAR
 # =============================================================================
@@ -29,7 +32,8 @@ harmonics = [1, 3, 5, 10, 20, 50]  # Solo consideramos números impares
 # =============================================================================
 # FUNCIÓN PARA CALCULAR COEFICIENTES DE FOURIER
 # =============================================================================
-def fourier_coefficients(n_max):
+@instrumentar
+def fourier_coefficients(n_max, A=A):
     """
     Calcula los coeficientes de Fourier para una onda cuadrada.
     
@@ -38,6 +42,7 @@ def fourier_coefficients(n_max):
     
     Parámetros:
     n_max: Número máximo de armónicos a considerar
+    A: Amplitud de la onda cuadrada
     
     Retorna:
     Lista de tuplas (n, coeficiente) para cada armónico impar
@@ -56,13 +61,15 @@ def fourier_coefficients(n_max):
 # =============================================================================
 # FUNCIÓN PARA RECONSTRUIR SEÑAL CON SERIE DE FOURIER
 # =============================================================================
-def reconstruct_signal(t, coefficients):
+@instrumentar
+def reconstruct_signal(t, coefficients, f0=f0):
     """
     Reconstruye una señal sumando las contribuciones de los armónicos de Fourier.
     
     Parámetros:
     t: Vector de tiempo
     coefficients: Lista de coeficientes de Fourier (n, coeficiente)
+    f0: Frecuencia fundamental (Hz)
     
     Retorna:
     Señal reconstruida mediante la suma de los términos de la serie
@@ -72,14 +79,20 @@ def reconstruct_signal(t, coefficients):
     
     # Para cada armónico y su coeficiente
     for n, coeff in coefficients:
-        # Añadimos la contribución de este armónico: coeficiente * sin(2πn f0 t)
-        signal += coeff * np.sin(2*np.pi*n*f0*t)
+        # Añadimos la contribución de este armónico: coeficiente * sin(2πn f0 t).
+        # Un coeficiente complejo b_n + j·a_n (estimar_coeficientes) aporta
+        # |c|·sin(2πn f0 t + arg c) = b_n·sin(2πn f0 t) + a_n·cos(2πn f0 t)
+        if np.iscomplexobj(coeff):
+            signal += np.abs(coeff) * np.sin(2*np.pi*n*f0*t + np.angle(coeff))
+        else:
+            signal += coeff * np.sin(2*np.pi*n*f0*t)
     
     return signal
 
 # =============================================================================
 # FUNCIÓN PARA CALCULAR ERROR CUADRÁTICO MEDIO
 # =============================================================================
+@instrumentar
 def calculate_mse(original, reconstructed):
     """
     Calcula el Error Cuadrático Medio (MSE) entre la señal original y la reconstruida.
@@ -95,100 +108,181 @@ def calculate_mse(original, reconstructed):
     """
     return np.mean((original - reconstructed)**2)
 
+# =============================================================================
+# GENERACIÓN DE LA ONDA CUADRADA ORIGINAL
+# =============================================================================
+def onda_cuadrada(t, A=A, f0=f0):
+    """
+    Onda cuadrada de amplitud A generada con la función signo aplicada a una
+    senoidal (np.sign() devuelve -1 para valores negativos, 0 para cero y 1
+    para positivos).
+    """
+    return A * np.sign(np.sin(2*np.pi*f0*t))
+
 # =============================================================================
 # CÁLCULO DE RECONSTRUCCIONES Y ERRORES
 # =============================================================================
-# Listas para almacenar los resultados
-mse_values = []        # Almacenará los errores cuadráticos medios
-reconstructions = []   # Almacenará las señales reconstruidas
+@instrumentar
+def calcular(harmonics=harmonics):
+    """
+    Reconstrucciones parciales, errores, coeficientes numéricos y análisis de Gibbs.
 
-# Para cada cantidad de armónicos en nuestra lista
-for N in harmonics:
-    # 1. Calcular los coeficientes de Fourier para hasta N armónicos
-    coeffs = fourier_coefficients(N)
-    
-    # 2. Reconstruir la señal usando estos coeficientes
-    reconstructed = reconstruct_signal(t, coeffs)
-    
-    # 3. Almacenar la reconstrucción en la lista
-    reconstructions.append(reconstructed)
-    
-    # 4. Calcular el error entre la señal original y la reconstruida
-    mse = calculate_mse(square_wave, reconstructed)
-    mse_values.append(mse)
-    
-    # 5. Imprimir el resultado para este número de armónicos
-    print(f"N={N} armónicos, MSE={mse:.6f}")
+    Parámetros:
+    harmonics: Cantidades de armónicos a comparar
+
+    Retorna:
+    Diccionario con las señales, los errores y las mediciones
+    """
+    # Creamos un vector de tiempo que abarca dos períodos completos
+    t = np.linspace(0, 2*T, 1000)  # 1000 puntos equidistantes entre 0 y 2T
+    square_wave = onda_cuadrada(t)
+
+    # Calculamos los coeficientes una sola vez, hasta el mayor número de armónicos
+    coeffs = fourier_coefficients(max(harmonics))
+
+    # Todas las reconstrucciones y sus errores se obtienen en una sola pasada sobre
+    # los armónicos: cada término se evalúa una vez y se suma a todas las
+    # reconstrucciones que lo incluyen
+    reconstructions, mse_values = reconstrucciones_parciales(
+        t, coeffs, harmonics, f0, original=square_wave)
+
+    # Muestreamos un período de la onda cuadrada y estimamos sus coeficientes con
+    # una rfft; deben coincidir con la fórmula cerrada 4A/(nπ) para n impar
+    P = 1000  # Muestras por período
+    t_periodo = np.arange(P) * T / P
+    coeffs_num = dict(estimar_coeficientes(onda_cuadrada(t_periodo), P, n_max=9))
+
+    # Sobrepico y ancho del rizado junto a la discontinuidad de t = T/2, medidos
+    # con refinamiento local (ver analizar_gibbs)
+    discontinuidad = detectar_discontinuidades(t, square_wave)[0]
+    gibbs = {sumacion: analizar_gibbs(coeffs, f0, discontinuidad, harmonics, sumacion=sumacion)
+             for sumacion in ['dirichlet', 'fejer', 'lanczos']}
+
+    return {'t': t, 'square_wave': square_wave, 'harmonics': harmonics, 'coeffs': coeffs,
+            'reconstructions': reconstructions, 'mse_values': mse_values,
+            'coeffs_num': coeffs_num, 'gibbs': gibbs}
+
+
+def reportar(r):
+    """Imprime errores, coeficientes y mediciones del fenómeno de Gibbs."""
+    # Imprimimos el resultado para cada número de armónicos
+    for N, mse in zip(r['harmonics'], r['mse_values']):
+        print(f"N={N} armónicos, MSE={mse:.6f}")
+
+    # =============================================================================
+    # COEFICIENTES CALCULADOS NUMÉRICAMENTE
+    # =============================================================================
+    for n, coeff in fourier_coefficients(9):
+        print(f"n={n}: teórico={coeff:.6f}, numérico={r['coeffs_num'][n].real:.6f}")
+
+    for sumacion, gibbs in r['gibbs'].items():
+        for N, sobrepico, ancho, censurado, ventana in zip(
+                r['harmonics'], gibbs['sobrepico'], gibbs['ancho'], gibbs['censurado'],
+                gibbs['ventana']):
+            # Censurado: la suma no vuelve al nivel final dentro de la ventana medida
+            if censurado:
+                texto_ancho = f" > {1e3*ventana:.2f} ms (no vuelve al nivel en la ventana)"
+            elif sobrepico == 0:
+                texto_ancho = ": sin rizado"
+            else:
+                texto_ancho = f"={1e3*ancho:.2f} ms"
+            print(f"{sumacion}: N={N} armónicos, sobrepico={100*sobrepico:.2f}% del salto, "
+                  f"ancho del rizado{texto_ancho}")
 
 # =============================================================================
 # VISUALIZACIÓN DE RESULTADOS
 # =============================================================================
-# Configuramos colores diferentes para cada reconstrucción
-colors = ['r', 'g', 'b', 'c', 'm', 'y']
-
-# GRÁFICO 1: COMPARACIÓN DE RECONSTRUCCIONES
-plt.figure(figsize=(12, 8))
-
-# Subgráfico 1: Señal original y reconstrucciones
-plt.subplot(2, 1, 1)
-# Dibujamos la onda cuadrada original (línea negra continua)
-plt.plot(t, square_wave, 'k-', linewidth=2, label='Onda cuadrada original')
-
-# Dibujamos cada reconstrucción con un color diferente
-for i, N in enumerate(harmonics):
-    plt.plot(t, reconstructions[i], colors[i] + '--', 
-             linewidth=1, label=f'{N} armónicos')
-
-# Añadimos etiquetas, título y leyenda
-plt.xlabel('Tiempo (s)')
-plt.ylabel('Amplitud')
-plt.title('Reconstrucción de onda cuadrada con Series de Fourier')
-plt.legend()
-plt.grid(True)
-
-# GRÁFICO 2: ERROR CUADRÁTICO MEDIO VS NÚMERO DE ARMÓNICOS
-plt.subplot(2, 1, 2)
-# Dibujamos el error como función del número de armónicos
-plt.plot(harmonics, mse_values, 'bo-', linewidth=2)
-plt.xlabel('Número de armónicos')
-plt.ylabel('Error Cuadrático Medio (MSE)')
-plt.title('Error de reconstrucción vs Número de armónicos')
-plt.grid(True)
-plt.yscale('log')  # Usamos escala logarítmica para mejor visualización del error
-
-# Ajustamos el espaciado entre subgráficos y mostramos la figura
-plt.tight_layout()
-plt.show()
-
-# GRÁFICO 3: ZOOM PARA MOSTRAR EL FENÓMENO DE GIBBS
-plt.figure(figsize=(10, 6))
-# Seleccionamos un intervalo de tiempo cerca de una discontinuidad (entre 0.4 y 0.6 segundos)
-zoom_idx = (t > 0.4) & (t < 0.6)
-
-# Dibujamos la onda original en el intervalo de zoom
-plt.plot(t[zoom_idx], square_wave[zoom_idx], 'k-', linewidth=3, 
-         label='Onda cuadrada original')
-
-# Dibujamos solo las últimas 3 reconstrucciones (las más precisas) para mayor claridad
-for i, N in enumerate(harmonics[-3:]):
-    plt.plot(t[zoom_idx], reconstructions[-3+i][zoom_idx], 
-             colors[-3+i] + '--', linewidth=2, label=f'{N} armónicos')
-
-# Añadimos etiquetas, título y leyenda
-plt.xlabel('Tiempo (s)')
-plt.ylabel('Amplitud')
-plt.title('Fenómeno de Gibbs cerca de una discontinuidad')
-plt.legend()
-plt.grid(True)
-
-# Mostramos el gráfico
-plt.show()
-
-# GRÁFICO EXTRA: ONDA CUADRADA ORIGINAL
-plt.figure(figsize=(8, 4))
-plt.plot(t, square_wave, 'k-', linewidth=2)
-plt.xlabel('Tiempo (s)')
-plt.ylabel('Amplitud')
-plt.title('Onda cuadrada original')
-plt.grid(True)
-plt.show()
\ No newline at end of file
+@instrumentar
+def graficar_resultados(r, mostrar):
+    """Figuras del ejercicio; mostrar termina cada figura (ver cli.preparar_salida)."""
+    import matplotlib.pyplot as plt  # Para crear gráficos y visualizaciones
+
+    t, square_wave, harmonics = r['t'], r['square_wave'], r['harmonics']
+
+    # Configuramos colores diferentes para cada reconstrucción
+    colors = ['r', 'g', 'b', 'c', 'm', 'y']
+
+    # GRÁFICO 1: COMPARACIÓN DE RECONSTRUCCIONES
+    plt.figure(figsize=(12, 8))
+
+    # Subgráfico 1: Señal original y reconstrucciones
+    plt.subplot(2, 1, 1)
+    # Dibujamos la onda cuadrada original (línea negra continua)
+    plt.plot(t, square_wave, 'k-', linewidth=2, label='Onda cuadrada original')
+
+    # Dibujamos cada reconstrucción con un color diferente
+    for i, N in enumerate(harmonics):
+        plt.plot(t, r['reconstructions'][i], colors[i] + '--', 
+                 linewidth=1, label=f'{N} armónicos')
+
+    # Añadimos etiquetas, título y leyenda
+    plt.xlabel('Tiempo (s)')
+    plt.ylabel('Amplitud')
+    plt.title('Reconstrucción de onda cuadrada con Series de Fourier')
+    plt.legend()
+    plt.grid(True)
+
+    # GRÁFICO 2: ERROR CUADRÁTICO MEDIO VS NÚMERO DE ARMÓNICOS
+    plt.subplot(2, 1, 2)
+    # Dibujamos el error como función del número de armónicos
+    plt.plot(harmonics, r['mse_values'], 'bo-', linewidth=2)
+    plt.xlabel('Número de armónicos')
+    plt.ylabel('Error Cuadrático Medio (MSE)')
+    plt.title('Error de reconstrucción vs Número de armónicos')
+    plt.grid(True)
+    plt.yscale('log')  # Usamos escala logarítmica para mejor visualización del error
+
+    # Ajustamos el espaciado entre subgráficos y mostramos la figura
+    plt.tight_layout()
+    mostrar('ejercicio2_reconstruccion')
+
+    # GRÁFICO 3: ZOOM PARA MOSTRAR EL FENÓMENO DE GIBBS
+    plt.figure(figsize=(10, 6))
+    # En lugar de recortar la grilla global con una máscara, evaluamos las
+    # reconstrucciones solo en el intervalo de zoom (entre 0.4 y 0.6 segundos) con
+    # una grilla fina propia, que resuelve el sobrepico de los armónicos altos
+    t_zoom = np.linspace(0.4, 0.6, 2000)
+    square_zoom = onda_cuadrada(t_zoom)
+    reconstructions_zoom, _ = reconstrucciones_parciales(t_zoom, r['coeffs'], harmonics[-3:], f0)
+
+    # Dibujamos la onda original en el intervalo de zoom
+    plt.plot(t_zoom, square_zoom, 'k-', linewidth=3, 
+             label='Onda cuadrada original')
+
+    # Dibujamos solo las últimas 3 reconstrucciones (las más precisas) para mayor claridad
+    for i, N in enumerate(harmonics[-3:]):
+        plt.plot(t_zoom, reconstructions_zoom[i], 
+                 colors[-3+i] + '--', linewidth=2, label=f'{N} armónicos')
+
+    # Añadimos etiquetas, título y leyenda
+    plt.xlabel('Tiempo (s)')
+    plt.ylabel('Amplitud')
+    plt.title('Fenómeno de Gibbs cerca de una discontinuidad')
+    plt.legend()
+    plt.grid(True)
+
+    # Mostramos el gráfico
+    mostrar('ejercicio2_gibbs')
+
+    # GRÁFICO EXTRA: ONDA CUADRADA ORIGINAL
+    plt.figure(figsize=(8, 4))
+    plt.plot(t, square_wave, 'k-', linewidth=2)
+    plt.xlabel('Tiempo (s)')
+    plt.ylabel('Amplitud')
+    plt.title('Onda cuadrada original')
+    plt.grid(True)
+    mostrar('ejercicio2_onda_cuadrada')
+
+
+def main(argv=None):
+    opciones = parsear_argumentos("Ejercicio 2: serie de Fourier de una onda cuadrada", argv)
+    with perfilar(opciones):
+        r = calcular()
+        reportar(r)
+        if not opciones.no_plot:
+            graficar_resultados(r, preparar_salida(opciones))
+    return r
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,34 @@
+# Ejecución directa (python Codigos/ejercicio_3.py, como los scripts originales
+# del curso): se importa como módulo del paquete para que funcionen los
+# imports relativos
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'Codigos'
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
+from .transformadas import fft, ifft, filtro_hilbert
+from .analitica import analizar_analitica
+from .cli import parsear_argumentos, preparar_salida, perfilar
+from .instrumentacion import instrumentar
 
+@instrumentar
 def hilbert_transform_fft(x):
     """
     Calcula la Transformada de Hilbert usando FFT
     """
     N = len(x)
-    X = np.fft.fft(x)
+    X = fft(x)
     
-    # Crear el filtro de Hilbert: -j * sign(f)
-    frequencies = np.fft.fftfreq(N)
-    hilbert_filter = -1j * np.sign(frequencies)
+    # Filtro de Hilbert: -j * sign(f) (se reutiliza desde la caché para cada N)
+    hilbert_filter = filtro_hilbert(N)
     
     # Aplicar el filtro en el dominio de la frecuencia
-    X_hat = X * hilbert_filter
+    X *= hilbert_filter
     
-    # Transformada inversa para obtener la señal en tiempo
-    x_hat = np.fft.ifft(X_hat)
+    # Transformada inversa para obtener la señal en tiempo (X es temporal)
+    x_hat = ifft(X, sobrescribir=True)
     
     return np.real(x_hat)
 
@@ -36,108 +47,151 @@ def envolvente_compleja(x_analitica):
 
 # Parámetros de las señales de prueba
 fs = 1000  # Frecuencia de muestreo
-t = np.linspace(0, 1, fs, endpoint=False)
-
-# 3.2a) Señal sinusoidal pura
-f_sin = 10  # Hz
-senal_sin = np.sin(2 * np.pi * f_sin * t)
-# ---
-# Análisis:
-# La señal original es una onda sinusoidal suave y periódica.
-# La Transformada de Hilbert debería ser una onda cosenoidal desplazada 90°.
-# La envolvente compleja es constante, indicando amplitud constante.
-# ---
-
-# 3.2b) Pulso rectangular único
-pulso_rect = np.zeros_like(t)
-pulso_rect[400:600] = 1  # Pulso de 200 ms
-# ---
-# Análisis:
-# El pulso tiene bordes abruptos, por lo que la Transformada de Hilbert muestra picos en los bordes.
-# La envolvente compleja tiene máximos en las transiciones, mostrando concentración de energía.
-# ---
-
-# 3.2c) Producto de los casos anteriores
-senal_producto = senal_sin * pulso_rect
-# ---
-# Análisis:
-# La señal es sinusoidal solo durante el pulso.
-# La Transformada de Hilbert muestra distorsiones en los bordes por la ventana.
-# La envolvente compleja varía y se concentra donde existe el pulso.
-# ---
-
-# Lista de señales para analizar
-senales = [senal_sin, pulso_rect, senal_producto]
+f_sin = 10  # Hz, frecuencia de la señal sinusoidal
 nombres = ['Señal Sinusoidal', 'Pulso Rectangular', 'Producto Seno × Pulso']
 
-# Análisis para cada señal
-for i, (x, nombre) in enumerate(zip(senales, nombres)):
-    print(f"\nAnalizando: {nombre}")
-    
-    # Calcular Transformada de Hilbert
-    x_hat = hilbert_transform_fft(x)
-    
-    # Calcular señal analítica
-    x_analitica = señal_analítica(x)
-    
-    # Calcular envolvente compleja
-    envolvente = envolvente_compleja(x_analitica)
-    
-    # 3.3) Graficar resultados
-    plt.figure(figsize=(15, 8))
-    
-    # Señal original
-    plt.subplot(3, 1, 1)
-    plt.plot(t, x, 'b-', linewidth=2, label='Señal original')
-    plt.title(f'{nombre} - Señal Original')
-    plt.xlabel('Tiempo (s)')
-    plt.ylabel('Amplitud')
-    plt.grid(True)
-    plt.legend()
+
+def señales_de_prueba(fs=fs, f_sin=f_sin):
+    """
+    Señales del punto 3.2 sobre un segundo muestreado a fs.
+
+    Retorna:
+    Tupla (t, señales) con señales = [seno, pulso, producto]
+    """
+    t = np.linspace(0, 1, fs, endpoint=False)
+
+    # 3.2a) Señal sinusoidal pura
+    senal_sin = np.sin(2 * np.pi * f_sin * t)
     # ---
-    # Interpretación:
-    # Muestra la forma de la señal en el tiempo.
+    # Análisis:
+    # La señal original es una onda sinusoidal suave y periódica.
+    # La Transformada de Hilbert debería ser una onda cosenoidal desplazada 90°.
+    # La envolvente compleja es constante, indicando amplitud constante.
     # ---
-    
-    # Transformada de Hilbert
-    plt.subplot(3, 1, 2)
-    plt.plot(t, x_hat, 'r-', linewidth=2, label='Transformada de Hilbert')
-    plt.title('Transformada de Hilbert')
-    plt.xlabel('Tiempo (s)')
-    plt.ylabel('Amplitud')
-    plt.grid(True)
-    plt.legend()
+
+    # 3.2b) Pulso rectangular único
+    pulso_rect = np.zeros_like(t)
+    pulso_rect[int(0.4*fs):int(0.6*fs)] = 1  # Pulso de 200 ms
     # ---
-    # Interpretación:
-    # Permite observar el desfase y los efectos de los bordes en cada señal.
+    # Análisis:
+    # El pulso tiene bordes abruptos, por lo que la Transformada de Hilbert muestra picos en los bordes.
+    # La envolvente compleja tiene máximos en las transiciones, mostrando concentración de energía.
     # ---
-    
-    # Señal analítica y envolvente
-    plt.subplot(3, 1, 3)
-    plt.plot(t, np.real(x_analitica), 'b-', linewidth=1, label='Parte real')
-    plt.plot(t, np.imag(x_analitica), 'g-', linewidth=1, label='Parte imaginaria')
-    plt.plot(t, envolvente, 'k--', linewidth=2, label='Envolvente compleja')
-    plt.title('Señal Analítica y Envolvente Compleja')
-    plt.xlabel('Tiempo (s)')
-    plt.ylabel('Amplitud')
-    plt.grid(True)
-    plt.legend()
+
+    # 3.2c) Producto de los casos anteriores
+    senal_producto = senal_sin * pulso_rect
     # ---
-    # Interpretación:
-    # La parte real es la señal original, la imaginaria es la transformada de Hilbert.
-    # La envolvente muestra la amplitud instantánea de la señal.
+    # Análisis:
+    # La señal es sinusoidal solo durante el pulso.
+    # La Transformada de Hilbert muestra distorsiones en los bordes por la ventana.
+    # La envolvente compleja varía y se concentra donde existe el pulso.
     # ---
-    
-    plt.tight_layout()
-    plt.show()
-    
-    # Análisis adicional para la señal sinusoidal
-    if i == 0:
-        print("\nAnálisis para señal sinusoidal:")
-        print(f"La Transformada de Hilbert de sin(2πft) debería ser -cos(2πft)")
-        print(f"Error RMS: {np.sqrt(np.mean((x_hat + np.cos(2*np.pi*f_sin*t))**2)):.6f}")
+    return t, [senal_sin, pulso_rect, senal_producto]
+
+
+@instrumentar
+def calcular(fs=fs, f_sin=f_sin):
+    """
+    Señal analítica, Transformada de Hilbert y envolvente de cada señal de prueba.
+
+    Retorna:
+    Diccionario con t, las señales, sus resultados de analizar_analitica y el
+    error RMS de la Transformada de Hilbert del seno respecto de -cos(2πft)
+    """
+    t, senales = señales_de_prueba(fs, f_sin)
+    # Señal analítica, Transformada de Hilbert y envolvente compleja con una
+    # sola transformada directa (en lugar de llamar dos veces a
+    # hilbert_transform_fft)
+    resultados = [analizar_analitica(x, fs) for x in senales]
+    error_rms = np.sqrt(np.mean((resultados[0]['hilbert'] + np.cos(2*np.pi*f_sin*t))**2))
+    return {'t': t, 'senales': senales, 'resultados': resultados, 'error_rms': error_rms}
+
+
+def reportar(r):
+    """Imprime el análisis de cada señal (y el error RMS de la sinusoidal)."""
+    for i, nombre in enumerate(nombres):
+        print(f"\nAnalizando: {nombre}")
+        # Análisis adicional para la señal sinusoidal
+        if i == 0:
+            print("\nAnálisis para señal sinusoidal:")
+            print(f"La Transformada de Hilbert de sin(2πft) debería ser -cos(2πft)")
+            print(f"Error RMS: {r['error_rms']:.6f}")
+            # ---
+            # Interpretación:
+            # El error RMS indica qué tan precisa es la implementación respecto al resultado teórico.
+            # ---
+
+
+@instrumentar
+def graficar_resultados(r, mostrar):
+    """Figuras del ejercicio; mostrar termina cada figura (ver cli.preparar_salida)."""
+    import matplotlib.pyplot as plt
+
+    t = r['t']
+    # Análisis para cada señal
+    for i, (x, nombre, resultado) in enumerate(zip(r['senales'], nombres, r['resultados'])):
+        x_hat = resultado['hilbert']
+        x_analitica = resultado['analitica']
+        envolvente = resultado['envolvente']
+
+        # 3.3) Graficar resultados
+        plt.figure(figsize=(15, 8))
+
+        # Señal original
+        plt.subplot(3, 1, 1)
+        plt.plot(t, x, 'b-', linewidth=2, label='Señal original')
+        plt.title(f'{nombre} - Señal Original')
+        plt.xlabel('Tiempo (s)')
+        plt.ylabel('Amplitud')
+        plt.grid(True)
+        plt.legend()
         # ---
         # Interpretación:
-        # El error RMS indica qué tan precisa es la implementación respecto al resultado teórico.
+        # Muestra la forma de la señal en el tiempo.
+        # ---
+
+        # Transformada de Hilbert
+        plt.subplot(3, 1, 2)
+        plt.plot(t, x_hat, 'r-', linewidth=2, label='Transformada de Hilbert')
+        plt.title('Transformada de Hilbert')
+        plt.xlabel('Tiempo (s)')
+        plt.ylabel('Amplitud')
+        plt.grid(True)
+        plt.legend()
         # ---
+        # Interpretación:
+        # Permite observar el desfase y los efectos de los bordes en cada señal.
+        # ---
+
+        # Señal analítica y envolvente
+        plt.subplot(3, 1, 3)
+        plt.plot(t, np.real(x_analitica), 'b-', linewidth=1, label='Parte real')
+        plt.plot(t, np.imag(x_analitica), 'g-', linewidth=1, label='Parte imaginaria')
+        plt.plot(t, envolvente, 'k--', linewidth=2, label='Envolvente compleja')
+        plt.title('Señal Analítica y Envolvente Compleja')
+        plt.xlabel('Tiempo (s)')
+        plt.ylabel('Amplitud')
+        plt.grid(True)
+        plt.legend()
+        # ---
+        # Interpretación:
+        # La parte real es la señal original, la imaginaria es la transformada de Hilbert.
+        # La envolvente muestra la amplitud instantánea de la señal.
+        # ---
+
+        plt.tight_layout()
+        mostrar(f'ejercicio3_senal_{i + 1}')
+
+
+def main(argv=None):
+    opciones = parsear_argumentos("Ejercicio 3: Transformada de Hilbert y señal analítica", argv)
+    with perfilar(opciones):
+        r = calcular()
+        reportar(r)
+        if not opciones.no_plot:
+            graficar_resultados(r, preparar_salida(opciones))
+    return r
+
 
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,129 @@
+# Ejecución directa (python Codigos/ejercicio_4.py, como los scripts originales
+# del curso): se importa como módulo del paquete para que funcionen los
+# imports relativos
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'Codigos'
+
 import numpy as np
-from collections import Counter
-from scipy.stats import entropy
+from .entropia import contar_simbolos, entropia_conteos, entropia_condicional, entropia_deslizante
+from .entropia import entropia_binaria, entropia_uniforme, autoinformacion
+from .entropia import autoinformacion_complemento
+from .codificacion import evaluar_codigos
+from .cli import parsear_argumentos, perfilar
+from .instrumentacion import instrumentar
+
+# Parámetros
+texto = "El rapido zorro marron salta sobre el perro perezoso"
+texto_en = "The quick brown fox jumps over the lazy dog"
+caras = [1,2,3,4,5,6]
+p_sismo = 150/31536000  # por ejemplo, 5 eventos mayores a 4 por año de 30seg
+
 
 # -------------------------
 # a) Texto en español
 # -------------------------
-print("------------------------- \n Texto en español \n-------------------------")
+@instrumentar
+def texto_espanol(texto=texto):
+    print("------------------------- \n Texto en español \n-------------------------")
 
-texto = "El rapido zorro marron salta sobre el perro perezoso"
-texto = texto.lower()
-print("\n",texto)
-conteo = Counter(texto)
-total = sum(conteo.values())
-probs = np.array([c/total for c in conteo.values()]) #
-H = entropy(probs, base=2)
-print(f"\nEntropía texto en español: {H:.4f} bits/caracter")
+    texto = texto.lower()
+    print("\n",texto)
+    # Conteo por carácter (code points UTF-8) con np.bincount, en lugar de Counter
+    conteo = contar_simbolos(texto, modo='utf8')
+    H = entropia_conteos(conteo)
+    print(f"\nEntropía texto en español: {H:.4f} bits/caracter")
+    # Bits por carácter que alcanza un código real con el mismo modelo
+    cod = evaluar_codigos(texto)
+    print(f"Huffman: {cod['huffman']:.4f} bits/caracter, rANS: {cod['rans']:.4f} bits/caracter")
 
+    # Entropía condicional H(Xn | X1..Xn-1): con contexto la información por
+    # carácter baja (en un texto tan corto la estimación es muy optimista)
+    H_cond = entropia_condicional(texto, orden_max=3, modo='utf8')
+    for n, h in enumerate(H_cond, start=1):
+        print(f"Entropía condicional de orden {n}: {h:.4f} bits/caracter")
+    return {'H': H, 'H_cond': np.asarray(H_cond),
+            'huffman': cod['huffman'], 'rans': cod['rans']}
 
 
 # -------------------------
 # b) Texto en ingles
 # -------------------------
-print("\n-------------------------\n Texto en ingles \n-------------------------")
+@instrumentar
+def texto_ingles(texto_en=texto_en):
+    print("\n-------------------------\n Texto en ingles \n-------------------------")
 
-texto_en = "The quick brown fox jumps over the lazy dog"
-texto_en = texto_en.lower()
-print("\n",texto_en)
+    texto_en = texto_en.lower()
+    print("\n",texto_en)
+
+    conteo_en = contar_simbolos(texto_en, modo='utf8')
+    H_en = entropia_conteos(conteo_en)
+    print(f"\nEntropía texto en inglés: {H_en:.4f} bits/caracter")
+    cod_en = evaluar_codigos(texto_en)
+    print(f"Huffman: {cod_en['huffman']:.4f} bits/caracter, rANS: {cod_en['rans']:.4f} bits/caracter")
+    return {'H_en': H_en, 'huffman_en': cod_en['huffman'], 'rans_en': cod_en['rans']}
 
-conteo_en = Counter(texto_en)
-total_en = sum(conteo_en.values())
-probs_en = np.array([c/total_en for c in conteo_en.values()])
-H_en = entropy(probs_en, base=2)
-print(f"\nEntropía texto en inglés: {H_en:.4f} bits/caracter")
 
 # -------------------------
 # c) Proceso aleatorio discreto simple
 # Ejemplo: dado de 6 caras
 # -------------------------
-print("\n-------------------------\n Dado 6 caras \n-------------------------")
+@instrumentar
+def dados(caras=caras):
+    print("\n-------------------------\n Dado 6 caras \n-------------------------")
 
-caras = [1,2,3,4,5,6]
-prob_dado = np.array([1/6]*6)  # dado justo
-H_dado = entropy(prob_dado, base=2)
-print(f"\nEntropía dado 6 caras: {H_dado:.4f} bits/tiro")
+    H_dado = entropia_uniforme(len(caras))  # dado justo: log2(6)
+    print(f"\nEntropía dado 6 caras: {H_dado:.4f} bits/tiro")
 
-print("\n-------------------------\n Dado 20 caras \n-------------------------")
+    print("\n-------------------------\n Dado 20 caras \n-------------------------")
+
+    # Ejemplo: dado de 20 caras
+    H_d20 = entropia_uniforme(20)
+    print(f"Entropía dado 20 caras: {H_d20:.4f} bits/tiro")
+    return {'H_dado': H_dado, 'H_d20': H_d20}
 
-# Ejemplo: dado de 20 caras
-prob_d20 = np.array([1/20]*20)
-H_d20 = entropy(prob_d20, base=2)
-print(f"Entropía dado 20 caras: {H_d20:.4f} bits/tiro")
 
 # -------------------------
 # d) Sismógrafo
 # Evento: sismo >= 4  "sismo", otro caso "no sismo"
 # Supongamos 30 segundos al año
 # -------------------------
+@instrumentar
+def sismografo(p_sismo=p_sismo):
+    print("\n-------------------------\n Sismografo \n-------------------------")
 
-print("\n-------------------------\n Sismografo \n-------------------------")
+    p_no_sismo = 1 - p_sismo
+    # Forma cerrada con log1p: precisa aunque p_sismo sea del orden de 5e-6
+    H_sismo = entropia_binaria(p_sismo)
+    print(f"\nEntropía evento sismo: {H_sismo:.8f} bits/evento")
+
+    print(f"\nProbabilidad de sismo por segundo: {p_sismo:.8f}")
+    print(f"Probabilidad de no sismo por segundo: {p_no_sismo:.8f}")
+    print(f"Autoinformación de un sismo: {autoinformacion(p_sismo):.4f} bits, "
+          f"de un segundo sin sismo: {autoinformacion_complemento(p_sismo):.8f} bits")
+
+    # Entropía empírica en una ventana deslizante de un día sobre un registro
+    # simulado de 30 días (una bandera sismo/no sismo por segundo)
+    rng = np.random.default_rng(0)
+    banderas = (rng.random(30 * 86400) < p_sismo).astype(np.int64)
+    H_ventana = np.concatenate(list(entropia_deslizante(np.array_split(banderas, 30), 86400, 2)))
+    print(f"\nEntropía en ventana de 1 día: media {H_ventana.mean():.8f}, "
+          f"máxima {H_ventana.max():.8f} bits/evento")
+    return {'H_sismo': H_sismo, 'H_ventana': H_ventana}
+
+
+def main(argv=None):
+    # Este ejercicio no tiene figuras: --no-plot y --output se aceptan igual
+    # para que todos los ejercicios compartan la misma línea de comandos
+    opciones = parsear_argumentos("Ejercicio 4: entropía de fuentes discretas", argv)
+    r = {}
+    with perfilar(opciones):
+        for parte in (texto_espanol, texto_ingles, dados, sismografo):
+            r.update(parte())
+    return r
 
-p_sismo = 150/31536000  # por ejemplo, 5 eventos mayores a 4 por año de 30seg
-p_no_sismo = 1 - p_sismo
-probs_sismo = np.array([p_sismo, p_no_sismo])
-H_sismo = entropy(probs_sismo, base=2)
-print(f"\nEntropía evento sismo: {H_sismo:.8f} bits/evento")
 
-print(f"\nProbabilidad de sismo por segundo: {p_sismo:.8f}") 
-print(f"Probabilidad de no sismo por segundo: {p_no_sismo:.8f}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+import numpy as np
+
+from .transformadas import rfft, frecuencias
+from .instrumentacion import instrumentar
+
+
+def _ventana(ventana, nperseg):
+    """scipy.signal.get_window, importado recién en el primer uso (arranque más rápido)."""
+    from scipy.signal import get_window
+    return get_window(ventana, nperseg)
+
+
+# =============================================================================
+# ESPECTRO DE VARIOS CANALES EN UNA SOLA LLAMADA
+# =============================================================================
+@instrumentar
+def espectro_multicanal(señales, fs):
+    """
+    Calcula magnitud y fase de todos los canales con una única rfft por eje.
+
+    La cantidad de hilos de la transformada se ajusta con
+    transformadas.configurar(workers=...).
+
+    Parámetros:
+    señales: Array 2-D (canales × muestras); un array 1-D se trata como un canal
+    fs: Frecuencia de muestreo (Hz)
+
+    Retorna:
+    Tupla (freq, magnitud, fase) con magnitud normalizada 2*|X|/N y fase en
+    radianes, ambas de forma (canales, N//2 + 1)
+    """
+    señales = np.atleast_2d(señales)
+    N = señales.shape[-1]
+    X = rfft(señales, axis=-1)
+    fase = np.angle(X)
+    magnitud = np.abs(X)
+    magnitud *= 2 / N
+    return frecuencias(N, fs), magnitud, fase
+
+
+def espectro_suma(señales, fs, por_linealidad=True):
+    """
+    Calcula el espectro de magnitud de la suma de los canales.
+
+    Por linealidad de la transformada, FFT(s1 + s2 + ...) = FFT(s1) + FFT(s2) + ...,
+    así que basta con sumar los canales en el tiempo y hacer una sola rfft en
+    lugar de transformar cada canal. Cuando los tonos de cada canal ocupan
+    bins distintos (como en ejercicio_1.py) el resultado coincide con la suma
+    de las magnitudes individuales.
+
+    Parámetros:
+    señales: Array 2-D (canales × muestras)
+    fs: Frecuencia de muestreo (Hz)
+    por_linealidad: Si es False, suma las magnitudes de cada canal (camino
+                    directo, una rfft por lote de canales)
+
+    Retorna:
+    Tupla (freq, magnitud) con magnitud normalizada 2*|X|/N
+    """
+    señales = np.atleast_2d(señales)
+    N = señales.shape[-1]
+    if not por_linealidad:
+        freq, magnitud, _ = espectro_multicanal(señales, fs)
+        return freq, magnitud.sum(axis=0)
+    compuesta = señales.sum(axis=0)
+    magnitud = np.abs(rfft(compuesta))
+    magnitud *= 2 / N
+    return frecuencias(N, fs), magnitud
+
+
+# =============================================================================
+# MEDICIÓN DE TONOS CONOCIDOS (DTFT PUNTUAL, TIPO GOERTZEL)
+# =============================================================================
+@instrumentar
+def medir_tonos(x, freqs, fs, tam_bloque=4096):
+    """
+    Mide amplitud y fase de una lista de frecuencias sin calcular la FFT completa.
+
+    Evalúa la DTFT X(f) = Σ x[n]·exp(-j2πfn/fs) solo en las K frecuencias
+    pedidas, en O(N·K), igual que un banco de filtros de Goertzel. La matriz de
+    exponenciales se calcula una vez para un bloque de tam_bloque muestras
+    (queda en caché) y cada bloque siguiente solo se corrige con el factor de
+    fase exp(-j2πf·n0/fs). Las frecuencias no necesitan caer en un bin.
+
+    Parámetros:
+    x: Señal 1-D o array 2-D (canales × muestras)
+    freqs: Frecuencias a medir (Hz)
+    fs: Frecuencia de muestreo (Hz)
+    tam_bloque: Muestras por bloque del producto matricial
+
+    Retorna:
+    Tupla (amplitud, fase) con la amplitud normalizada 2*|X|/N y la fase en la
+    convención de ejercicio_1.py, A·sin(2πft + φ); forma (..., K)
+    """
+    x = np.asarray(x, dtype=float)
+    freqs = np.atleast_1d(np.asarray(freqs, dtype=float))
+    N = x.shape[-1]
+    tam_bloque = min(tam_bloque, N)
+    omega = 2 * np.pi * freqs / fs
+    base = np.exp(-1j * np.outer(np.arange(tam_bloque), omega))
+    X = np.zeros(x.shape[:-1] + (len(freqs),), dtype=complex)
+    for inicio in range(0, N, tam_bloque):
+        bloque = x[..., inicio:inicio + tam_bloque]
+        parcial = bloque @ base[:bloque.shape[-1]]
+        X += parcial * np.exp(-1j * omega * inicio)
+    amplitud = 2 * np.abs(X) / N
+    fase = np.angle(X * 1j)
+    return amplitud, fase
+
+
+def error_tonos(amplitud, fase, amps_teoricas, fases_teoricas):
+    """
+    Compara amplitudes y fases medidas con la tabla teórica.
+
+    Parámetros:
+    amplitud, fase: Resultado de medir_tonos
+    amps_teoricas, fases_teoricas: Valores ideales de cada tono
+
+    Retorna:
+    Tupla (error_amplitud, error_fase) con la fase envuelta a (-π, π]
+    """
+    error_amp = amplitud - np.asarray(amps_teoricas)
+    error_fase = np.angle(np.exp(1j * (fase - np.asarray(fases_teoricas))))
+    return error_amp, error_fase
+
+
+# =============================================================================
+# LECTURA POR BLOQUES
+# =============================================================================
+def leer_bloques(fuente, tam_bloque=1 << 16, dtype=np.float64):
+    """
+    Genera bloques consecutivos de una señal sin cargarla completa en memoria.
+
+    Parámetros:
+    fuente: Array de NumPy, ruta a un archivo (.npy o binario crudo, que se
+            abre con memmap) o iterable que ya entrega bloques
+    tam_bloque: Cantidad de muestras por bloque (para arrays y archivos)
+    dtype: Tipo de dato de las muestras en archivos binarios crudos
+
+    Retorna:
+    Generador de arrays 1-D (vistas del memmap cuando es posible)
+    """
+    if isinstance(fuente, (str, bytes)) or hasattr(fuente, '__fspath__'):
+        ruta = str(fuente)
+        if ruta.endswith('.npy'):
+            fuente = np.load(ruta, mmap_mode='r')
+        else:
+            fuente = np.memmap(ruta, dtype=dtype, mode='r')
+
+    if isinstance(fuente, np.ndarray):
+        for inicio in range(0, len(fuente), tam_bloque):
+            yield fuente[inicio:inicio + tam_bloque]
+    else:
+        for bloque in fuente:
+            yield np.asarray(bloque)
+
+
+def _tramas(bloques, nperseg, salto, tramas_por_lote):
+    """
+    Agrupa un flujo de bloques en lotes de tramas solapadas (lote × nperseg).
+
+    Conserva entre bloques solo las muestras que todavía no formaron una trama
+    completa, de modo que la memoria queda acotada por el tamaño del lote.
+    """
+    resto = np.empty(0)
+    for bloque in bloques:
+        datos = np.concatenate((resto, bloque)) if len(resto) else np.asarray(bloque, dtype=float)
+        n_tramas = 0 if len(datos) < nperseg else (len(datos) - nperseg) // salto + 1
+        for inicio in range(0, n_tramas, tramas_por_lote):
+            fin = min(inicio + tramas_por_lote, n_tramas)
+            trozo = datos[inicio*salto:(fin - 1)*salto + nperseg]
+            yield np.lib.stride_tricks.sliding_window_view(trozo, nperseg)[::salto]
+        resto = datos[n_tramas*salto:]
+
+
+# =============================================================================
+# PSD DE WELCH INCREMENTAL
+# =============================================================================
+class EspectroWelch:
+    """
+    Acumula la PSD de Welch de una señal que llega por bloques.
+
+    La PSD se escala como densidad unilateral (igual que scipy.signal.welch con
+    scaling='density' y detrend=False); la magnitud usa la misma normalización
+    2*|X|/N de ejercicio_1.py, corregida por la ganancia coherente de la
+    ventana, para poder compararla con el espectro teórico.
+    """
+
+    def __init__(self, fs, nperseg=1024, noverlap=None, ventana='hann',
+                 tramas_por_lote=256):
+        self.fs = fs
+        self.nperseg = nperseg
+        self.noverlap = nperseg // 2 if noverlap is None else noverlap
+        self.salto = nperseg - self.noverlap
+        self.tramas_por_lote = tramas_por_lote
+        self.ventana = _ventana(ventana, nperseg)
+        self.freq = frecuencias(nperseg, fs)
+        self.n_tramas = 0
+        self._suma_potencia = np.zeros(len(self.freq))
+        self._resto = np.empty(0)
+
+    def actualizar(self, bloque):
+        """
+        Incorpora un nuevo bloque de muestras a la estimación.
+
+        Parámetros:
+        bloque: Array 1-D con las muestras nuevas
+
+        Retorna:
+        La propia instancia, para encadenar llamadas
+        """
+        datos = np.concatenate((self._resto, bloque))
+        for lote in _tramas([datos], self.nperseg, self.salto, self.tramas_por_lote):
+            X = rfft(lote * self.ventana, axis=-1)
+            self._suma_potencia += np.sum(X.real**2 + X.imag**2, axis=0)
+            self.n_tramas += len(lote)
+        n_usadas = 0 if len(datos) < self.nperseg else \
+            ((len(datos) - self.nperseg) // self.salto + 1) * self.salto
+        self._resto = datos[n_usadas:].copy()
+        return self
+
+    def _potencia_media(self):
+        if self.n_tramas == 0:
+            raise ValueError("Todavía no hay tramas completas para estimar el espectro")
+        return self._suma_potencia / self.n_tramas
+
+    @property
+    def psd(self):
+        """Densidad espectral de potencia unilateral (unidades²/Hz)."""
+        psd = self._potencia_media() / (self.fs * np.sum(self.ventana**2))
+        psd[1:] *= 2
+        if self.nperseg % 2 == 0:
+            psd[-1] /= 2
+        return psd
+
+    @property
+    def magnitud(self):
+        """Magnitud normalizada 2*|X|/N (promedio RMS sobre las tramas)."""
+        return 2 * np.sqrt(self._potencia_media()) / np.sum(self.ventana)
+
+
+def welch_streaming(fuente, fs, nperseg=1024, noverlap=None, ventana='hann',
+                    tam_bloque=1 << 16, dtype=np.float64):
+    """
+    Calcula la PSD de Welch de una fuente de cualquier longitud con memoria acotada.
+
+    Parámetros:
+    fuente: Array, ruta a archivo o iterable de bloques (ver leer_bloques)
+    fs: Frecuencia de muestreo (Hz)
+    nperseg: Longitud de cada segmento
+    noverlap: Muestras de solapamiento (por defecto nperseg // 2)
+    ventana: Nombre de la ventana (scipy.signal.get_window)
+    tam_bloque: Muestras leídas por bloque
+    dtype: Tipo de dato para archivos binarios crudos
+
+    Retorna:
+    Instancia de EspectroWelch con freq, psd y magnitud
+    """
+    estimador = EspectroWelch(fs, nperseg, noverlap, ventana)
+    for bloque in leer_bloques(fuente, tam_bloque, dtype):
+        estimador.actualizar(bloque)
+    return estimador
+
+
+# =============================================================================
+# ESPECTROGRAMA (STFT) POR BLOQUES
+# =============================================================================
+def stft_streaming(fuente, fs, nperseg=1024, noverlap=None, ventana='hann',
+                   tam_bloque=1 << 16, tramas_por_lote=256, dtype=np.float64):
+    """
+    Genera el espectrograma de magnitud de una fuente por lotes de tramas.
+
+    Cada lote se calcula con una única rfft vectorizada sobre las tramas, y solo
+    se mantiene en memoria un lote a la vez.
+
+    Parámetros:
+    fuente: Array, ruta a archivo o iterable de bloques (ver leer_bloques)
+    fs: Frecuencia de muestreo (Hz)
+    nperseg: Longitud de cada trama
+    noverlap: Muestras de solapamiento (por defecto nperseg // 2)
+    ventana: Nombre de la ventana (scipy.signal.get_window)
+    tam_bloque: Muestras leídas por bloque
+    tramas_por_lote: Cantidad máxima de tramas por lote
+    dtype: Tipo de dato para archivos binarios crudos
+
+    Retorna:
+    Generador de tuplas (tiempos, magnitudes), donde tiempos son los centros
+    de las tramas (s) y magnitudes tiene forma (tramas, nperseg//2 + 1)
+    """
+    noverlap = nperseg // 2 if noverlap is None else noverlap
+    salto = nperseg - noverlap
+    w = _ventana(ventana, nperseg)
+    escala = 2 / np.sum(w)
+    n_trama = 0
+    bloques = leer_bloques(fuente, tam_bloque, dtype)
+    for lote in _tramas(bloques, nperseg, salto, tramas_por_lote):
+        magnitudes = escala * np.abs(rfft(lote * w, axis=-1))
+        tiempos = ((n_trama + np.arange(len(lote))) * salto + nperseg / 2) / fs
+        n_trama += len(lote)
+        yield tiempos, magnitudes
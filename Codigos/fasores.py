@@ -0,0 +1,300 @@
+import numpy as np
+
+# matplotlib se importa solo en las funciones que dibujan: el álgebra de
+# fasores no lo necesita
+
+# =============================================================================
+# CONJUNTO DE FASORES EN UN ARRAY COMPLEJO
+# =============================================================================
+class Fasores:
+    """
+    Conjunto de fasores guardados en un único array complejo.
+
+    Cada fasor A∠φ se guarda como A·exp(jφ); la señal asociada es
+    x(t) = Re{A·exp(jφ)·exp(j2πft)} = A·cos(2πft + φ). Todas las operaciones
+    (suma, producto, rotación, conversión) son vectorizadas sobre el array.
+
+    Parámetros:
+    valores: Array (o escalar) complejo con los fasores
+    colores: Color de cada fasor (uno solo se repite para todos)
+    etiquetas: Texto de cada fasor (por defecto A∠φ°)
+    frecuencias: Frecuencia de rotación de cada fasor (Hz)
+    """
+
+    def __init__(self, valores, colores='tab:blue', etiquetas=None, frecuencias=1.0):
+        self.z = np.atleast_1d(np.asarray(valores, dtype=complex))
+        self.colores = [colores] * len(self.z) if isinstance(colores, str) else list(colores)
+        self.etiquetas = etiquetas
+        self.frecuencias = np.broadcast_to(np.asarray(frecuencias, dtype=float), self.z.shape)
+
+    @classmethod
+    def desde_polar(cls, amp, fase, **kwargs):
+        """Crea los fasores a partir de amplitudes y fases (rad)."""
+        return cls(np.asarray(amp) * np.exp(1j * np.asarray(fase)), **kwargs)
+
+    def __len__(self):
+        return len(self.z)
+
+    def _con(self, z):
+        return Fasores(z, self.colores, None, self.frecuencias)
+
+    def __add__(self, otro):
+        return self._con(self.z + getattr(otro, 'z', otro))
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        return self._con(self.z - getattr(otro, 'z', otro))
+
+    def __mul__(self, otro):
+        return self._con(self.z * getattr(otro, 'z', otro))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        return self._con(self.z / getattr(otro, 'z', otro))
+
+    def rotar(self, angulo):
+        """Rota todos los fasores el ángulo indicado (rad, escalar o array)."""
+        return self._con(self.z * np.exp(1j * np.asarray(angulo)))
+
+    def resultante(self):
+        """Suma de todos los fasores del conjunto (un solo fasor)."""
+        return Fasores(self.z.sum(), 'black', frecuencias=self.frecuencias[0])
+
+    @property
+    def amplitud(self):
+        return np.abs(self.z)
+
+    @property
+    def fase(self):
+        return np.angle(self.z)
+
+    def polar(self):
+        """Tupla (amplitudes, fases en rad)."""
+        return self.amplitud, self.fase
+
+    def cartesiano(self):
+        """Tupla (partes reales, partes imaginarias)."""
+        return self.z.real, self.z.imag
+
+    def textos(self):
+        """Etiquetas de cada fasor (las dadas o A∠φ° calculadas)."""
+        if self.etiquetas is not None:
+            return list(self.etiquetas)
+        return [f'{a:g}∠{g:.1f}°' for a, g in zip(np.round(self.amplitud, 3), np.degrees(self.fase))]
+
+    def en_instante(self, t):
+        """Fasores rotados al instante t (s): z·exp(j2πft)."""
+        return self.z * np.exp(2j * np.pi * self.frecuencias * t)
+
+    def senal(self, t):
+        """
+        Señales en el tiempo de cada fasor, Re{z·exp(j2πft)}.
+
+        Retorna:
+        Array de forma (fasores, len(t))
+        """
+        t = np.asarray(t, dtype=float)
+        return np.real(self.z[:, None] * np.exp(2j * np.pi * np.outer(self.frecuencias, t)))
+
+
+def _origenes(z, encadenar):
+    """Punto de partida de cada flecha: el origen, o la punta de la anterior."""
+    if not encadenar:
+        return np.zeros_like(z)
+    return np.concatenate(([0], np.cumsum(z)[:-1]))
+
+
+# =============================================================================
+# DIAGRAMA FASORIAL
+# =============================================================================
+def preparar_plano(ax, radio, circulos=None):
+    """Ejes, cuadrícula y círculos de referencia del plano complejo."""
+    import matplotlib.pyplot as plt
+    ax.axhline(y=0, color='black', linewidth=0.5)
+    ax.axvline(x=0, color='black', linewidth=0.5)
+    ax.set_xlim(-radio, radio)
+    ax.set_ylim(-radio, radio)
+    ax.set_xlabel('Eje Real', fontsize=12)
+    ax.set_ylabel('Eje Imaginario', fontsize=12)
+    ax.grid(True, alpha=0.5)
+    ax.set_aspect('equal')
+    for r in (circulos or []):
+        ax.add_patch(plt.Circle((0, 0), r, fill=False, color='gray', linestyle='--', alpha=0.3))
+
+
+def dibujar_fasores(ax, fasores, encadenar=False, etiquetas=True, ancho=0.005):
+    """
+    Dibuja todos los fasores con una sola llamada a quiver.
+
+    Parámetros:
+    ax: Ejes de matplotlib
+    fasores: Instancia de Fasores
+    encadenar: Si es True, cada fasor parte de la punta del anterior
+    etiquetas: Si es True, escribe la etiqueta de cada fasor junto a su punta
+    ancho: Ancho de las flechas (fracción del ancho de los ejes)
+
+    Retorna:
+    El objeto Quiver creado
+    """
+    z = fasores.z
+    o = _origenes(z, encadenar)
+    flechas = ax.quiver(o.real, o.imag, z.real, z.imag, color=fasores.colores,
+                        width=ancho, scale=1, angles='xy', scale_units='xy')
+    if etiquetas:
+        puntas = o + 1.1 * z
+        for x, y, texto, color in zip(puntas.real, puntas.imag, fasores.textos(), fasores.colores):
+            ax.text(x, y, texto, color=color, fontsize=12, ha='center', va='center')
+    return flechas
+
+
+def dibujar_suma(ax, fasor1, fasor2):
+    """
+    Dibuja fasor1, fasor2 y su resultante fasor1 + fasor2.
+
+    Los dos sumandos salen del origen; el segundo se repite punteado desde la
+    punta del primero (regla del paralelogramo) y la resultante va en negro.
+
+    Retorna:
+    La resultante como instancia de Fasores
+    """
+    sumandos = Fasores(np.concatenate((fasor1.z, fasor2.z)),
+                       fasor1.colores + fasor2.colores,
+                       fasor1.textos() + fasor2.textos())
+    resultante = Fasores((fasor1 + fasor2).z, 'black')
+    dibujar_fasores(ax, sumandos)
+    dibujar_fasores(ax, resultante)
+    ax.quiver(fasor1.z.real, fasor1.z.imag, fasor2.z.real, fasor2.z.imag,
+              color=fasor2.colores, alpha=0.4, linestyle='--', width=0.003,
+              scale=1, angles='xy', scale_units='xy')
+    return resultante
+
+
+# =============================================================================
+# ANIMACIÓN DE FASORES GIRATORIOS
+# =============================================================================
+def animar_fasores(fasores, duracion=None, cuadros=200, intervalo=20, encadenar=True,
+                   mostrar_componentes=8, radio=None):
+    """
+    Anima los fasores girando junto con la señal resultante en el tiempo.
+
+    Usa blitting: en cada cuadro solo se actualizan las flechas (un único
+    Quiver, con set_offsets y set_UVC) y las curvas del panel temporal, sin
+    redibujar ejes ni textos, de modo que cientos de fasores se animan a
+    velocidad interactiva.
+
+    Parámetros:
+    fasores: Instancia de Fasores (con sus frecuencias)
+    duracion: Tiempo simulado (s); por defecto dos períodos del más lento
+    cuadros: Cantidad de cuadros de la animación
+    intervalo: Milisegundos entre cuadros
+    encadenar: Si es True, los fasores se dibujan uno a continuación del otro
+               y la punta del último recorre la resultante
+    mostrar_componentes: Cantidad de componentes dibujadas en el panel temporal
+                         además de la resultante
+    radio: Semiancho del plano complejo (por defecto la suma de amplitudes)
+
+    Retorna:
+    Tupla (fig, animación); hay que conservar la animación mientras se muestra
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    frec = np.abs(fasores.frecuencias)
+    if duracion is None:
+        duracion = 2 / frec[frec > 0].min() if np.any(frec > 0) else 1.0
+    t = np.linspace(0, duracion, cuadros)
+    senales = fasores.senal(t)
+    total = senales.sum(axis=0)
+    radio = radio or 1.1 * fasores.amplitud.sum()
+
+    fig, (ax_plano, ax_tiempo) = plt.subplots(1, 2, figsize=(13, 6),
+                                              gridspec_kw={'width_ratios': [1, 1.6]})
+    preparar_plano(ax_plano, radio)
+    ax_plano.set_title('Fasores giratorios')
+    z0 = fasores.en_instante(0)
+    o0 = _origenes(z0, encadenar)
+    flechas = ax_plano.quiver(o0.real, o0.imag, z0.real, z0.imag, color=fasores.colores,
+                              width=0.004, scale=1, angles='xy', scale_units='xy')
+    punta, = ax_plano.plot([], [], 'ko', markersize=4)
+    proyeccion, = ax_plano.plot([], [], 'k:', linewidth=0.8)
+
+    ax_tiempo.set_xlim(0, duracion)
+    ax_tiempo.set_ylim(-radio, radio)
+    ax_tiempo.set_xlabel('Tiempo (s)')
+    ax_tiempo.set_ylabel('Re{Σ fasores}')
+    ax_tiempo.set_title('Señal en el tiempo')
+    ax_tiempo.grid(True, alpha=0.3)
+    componentes = [ax_tiempo.plot([], [], color=c, alpha=0.4, linewidth=0.8)[0]
+                   for c in fasores.colores[:mostrar_componentes]]
+    curva, = ax_tiempo.plot([], [], 'k', linewidth=1.5, label='Resultante')
+    ax_tiempo.legend(loc='upper right')
+    artistas = [flechas, punta, proyeccion, curva] + componentes
+
+    def iniciar():
+        punta.set_data([], [])
+        proyeccion.set_data([], [])
+        curva.set_data([], [])
+        for linea in componentes:
+            linea.set_data([], [])
+        return artistas
+
+    def actualizar(i):
+        z = fasores.en_instante(t[i])
+        o = _origenes(z, encadenar)
+        flechas.set_offsets(np.column_stack((o.real, o.imag)))
+        flechas.set_UVC(z.real, z.imag)
+        extremo = z.sum() if encadenar else z[-1]
+        punta.set_data([extremo.real], [extremo.imag])
+        proyeccion.set_data([extremo.real, extremo.real], [extremo.imag, 0])
+        curva.set_data(t[:i + 1], total[:i + 1])
+        for linea, s in zip(componentes, senales):
+            linea.set_data(t[:i + 1], s[:i + 1])
+        return artistas
+
+    animacion = FuncAnimation(fig, actualizar, frames=cuadros, init_func=iniciar,
+                              interval=intervalo, blit=True)
+    return fig, animacion
+
+
+# =============================================================================
+# RENDIMIENTO: OPERACIONES VECTORIZADAS CONTRA DICCIONARIOS
+# =============================================================================
+if __name__ == "__main__":
+    import timeit
+
+    n = 100_000
+    rng = np.random.default_rng(0)
+    amp, fase = rng.uniform(0, 5, n), rng.uniform(-np.pi, np.pi, n)
+    dicts = [{'amp': a, 'fase': f} for a, f in zip(amp, fase)]
+    fasores = Fasores.desde_polar(amp, fase)
+
+    def con_diccionarios():
+        xs = [d['amp'] * np.cos(d['fase']) for d in dicts]
+        ys = [d['amp'] * np.sin(d['fase']) for d in dicts]
+        return sum(xs), sum(ys)
+
+    t_dict = timeit.timeit(con_diccionarios, number=3) / 3
+    t_vec = timeit.timeit(lambda: (fasores.cartesiano(), fasores.resultante()), number=3) / 3
+    print(f"Conversión y suma de {n} fasores: diccionarios {1e3*t_dict:.1f} ms, "
+          f"vectorizado {1e3*t_vec:.2f} ms ({t_dict/t_vec:.0f}x)")
+
+    # Animación: tiempo por cuadro con blitting para 500 fasores (serie de una cuadrada)
+    import matplotlib
+    import matplotlib.pyplot as plt
+    k = np.arange(1, 1000, 2)
+    cuadrada = Fasores(4 / (np.pi * k) * np.exp(-1j * np.pi / 2),
+                       colores=plt.cm.viridis(np.linspace(0, 1, len(k))), frecuencias=k)
+    fig, animacion = animar_fasores(cuadrada, duracion=2, cuadros=100)
+    if matplotlib.get_backend().lower() == 'agg':
+        fig.canvas.draw()
+        inicio = timeit.default_timer()
+        for i in range(100):
+            for artista in animacion._func(i):
+                artista.axes.draw_artist(artista)
+            fig.canvas.blit(fig.bbox)
+        print(f"Animación de {len(k)} fasores: "
+              f"{1e3*(timeit.default_timer() - inicio)/100:.2f} ms por cuadro")
+    else:
+        plt.show()
@@ -0,0 +1,294 @@
+import contextlib
+import importlib
+import io
+import os
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+# =============================================================================
+# CONFIGURACIÓN DE SALIDA
+# =============================================================================
+# Si 'directorio' está definido, las figuras se guardan en lugar de mostrarse
+# (también se puede fijar con las variables de entorno FIGURAS_SALIDA y
+# FIGURAS_FORMATOS, por ejemplo FIGURAS_FORMATOS=png,pdf)
+_salida = {
+    'directorio': os.environ.get('FIGURAS_SALIDA') or None,
+    'formatos': tuple(os.environ.get('FIGURAS_FORMATOS', 'png').split(',')),
+    'dpi': int(os.environ.get('FIGURAS_DPI', 150)),
+    'guardadas': [],
+}
+
+
+def configurar_salida(directorio=None, formatos=None, dpi=None):
+    """
+    Elige entre mostrar las figuras (interactivo) o guardarlas sin ventana.
+
+    Parámetros:
+    directorio: Carpeta donde guardar las figuras; None vuelve al modo
+                interactivo con plt.show()
+    formatos: Extensiones a escribir, por ejemplo ('png', 'pdf')
+    dpi: Resolución de los archivos de mapa de bits
+    """
+    _salida['directorio'] = directorio
+    if formatos is not None:
+        _salida['formatos'] = tuple(formatos)
+    if dpi is not None:
+        _salida['dpi'] = dpi
+    if directorio is not None:
+        os.makedirs(directorio, exist_ok=True)
+        plt.switch_backend('Agg')
+
+
+if _salida['directorio']:
+    configurar_salida(_salida['directorio'])
+
+
+def mostrar(nombre, fig=None):
+    """
+    Reemplazo de plt.show(): guarda la figura si hay un directorio de salida.
+
+    En modo sin ventana escribe nombre.<formato> para cada formato y cierra la
+    figura; en modo interactivo llama a plt.show() como antes.
+
+    Parámetros:
+    nombre: Nombre de archivo sin extensión
+    fig: Figura a guardar (por defecto la figura actual)
+
+    Retorna:
+    Lista de rutas escritas (vacía en modo interactivo)
+    """
+    fig = plt.gcf() if fig is None else fig
+    if _salida['directorio'] is None:
+        plt.show()
+        return []
+    rutas = []
+    for formato in _salida['formatos']:
+        ruta = os.path.join(_salida['directorio'], f'{nombre}.{formato}')
+        fig.savefig(ruta, dpi=_salida['dpi'])
+        rutas.append(ruta)
+    plt.close(fig)
+    _salida['guardadas'].extend(rutas)
+    return rutas
+
+
+# =============================================================================
+# DIEZMADO POR PÍXEL
+# =============================================================================
+def _pixeles(ax):
+    """Ancho en píxeles de los ejes a la resolución de salida."""
+    return max(1, int(ax.get_position().width * ax.figure.get_figwidth() * _salida['dpi']))
+
+
+def diezmar_minmax(x, y, pixeles):
+    """
+    Reduce una serie densa a su mínimo y máximo por columna de píxeles.
+
+    Las muestras se reparten en grupos consecutivos (uno por píxel) y de cada
+    grupo se conservan solo las posiciones del mínimo y del máximo, en su
+    orden original. El trazo resultante es visualmente idéntico al completo.
+
+    Parámetros:
+    x, y: Serie a diezmar (x ordenado)
+    pixeles: Cantidad de columnas disponibles
+
+    Retorna:
+    Tupla (x, y) con a lo sumo 2·pixeles puntos
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    N = len(y)
+    if N <= 2 * pixeles:
+        return x, y
+    grupo = -(-N // pixeles)
+    filas = -(-N // grupo)
+    relleno = np.concatenate((y, np.full(filas * grupo - N, y[-1])))
+    matriz = relleno.reshape(filas, grupo)
+    base = np.arange(filas)[:, None] * grupo
+    indices = np.sort(np.hstack((matriz.argmin(axis=1)[:, None],
+                                 matriz.argmax(axis=1)[:, None])) + base, axis=1).ravel()
+    indices = np.minimum(indices, N - 1)
+    return x[indices], y[indices]
+
+
+def graficar(ax, x, y, *args, pixeles=None, **kwargs):
+    """
+    ax.plot con diezmado mínimo/máximo por píxel para series densas.
+
+    Parámetros:
+    ax: Ejes de matplotlib
+    x, y: Datos a graficar
+    pixeles: Columnas a usar (por defecto el ancho de los ejes)
+    *args, **kwargs: Se pasan a ax.plot
+
+    Retorna:
+    Lista de líneas creadas por ax.plot
+    """
+    pixeles = _pixeles(ax) if pixeles is None else pixeles
+    return ax.plot(*diezmar_minmax(x, y, pixeles), *args, **kwargs)
+
+
+def stem_rapido(ax, x, y, color='b', color_base='r', umbral=200, pixeles=None):
+    """
+    Gráfico de tallos con una sola LineCollection cuando hay muchos puntos.
+
+    Hasta umbral puntos usa ax.stem con el mismo estilo de siempre. Por encima
+    dibuja todos los tallos como una LineCollection y los marcadores como una
+    única línea sin trazo; si además hay más puntos que píxeles, cada columna
+    conserva solo el tallo de mayor |y| (el que se ve).
+
+    Parámetros:
+    ax: Ejes de matplotlib
+    x, y: Posiciones y alturas de los tallos
+    color: Color de tallos y marcadores
+    color_base: Color de la línea de base
+    umbral: Cantidad de puntos a partir de la cual se usa LineCollection
+    pixeles: Columnas a usar (por defecto el ancho de los ejes)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) <= umbral:
+        return ax.stem(x, y, linefmt=f'{color}-', markerfmt=f'{color}o', basefmt=f'{color_base}-')
+    pixeles = _pixeles(ax) if pixeles is None else pixeles
+    if len(y) > pixeles:
+        grupo = -(-len(y) // pixeles)
+        filas = -(-len(y) // grupo)
+        relleno = np.concatenate((np.abs(y), np.full(filas * grupo - len(y), -1.0)))
+        indices = relleno.reshape(filas, grupo).argmax(axis=1) + np.arange(filas) * grupo
+        x, y = x[indices], y[indices]
+    segmentos = np.stack((np.column_stack((x, np.zeros_like(y))), np.column_stack((x, y))), axis=1)
+    tallos = LineCollection(segmentos, colors=color)
+    ax.add_collection(tallos)
+    ax.plot(x, y, linestyle='none', marker='o', color=color)
+    ax.plot([x[0], x[-1]], [0, 0], color=color_base)
+    ax.autoscale_view()
+    return tallos
+
+
+# =============================================================================
+# GENERACIÓN DE FIGURAS EN PARALELO
+# =============================================================================
+def _renderizar(tarea, directorio, formatos, dpi):
+    """Trabajo de un proceso: construye una figura y la guarda."""
+    nombre, funcion, args = tarea
+    configurar_salida(directorio, formatos, dpi)
+    return mostrar(nombre, funcion(*args))
+
+
+def renderizar_paralelo(tareas, directorio, formatos=('png',), dpi=150, procesos=None):
+    """
+    Construye y guarda figuras independientes en un pool de procesos.
+
+    Parámetros:
+    tareas: Lista de (nombre, funcion, args); funcion(*args) devuelve la
+            figura y debe poder serializarse (definida a nivel de módulo)
+    directorio: Carpeta de salida
+    formatos: Extensiones a escribir
+    dpi: Resolución de los archivos de mapa de bits
+    procesos: Procesos del pool (por defecto os.cpu_count())
+
+    Retorna:
+    Lista de rutas escritas
+    """
+    with ProcessPoolExecutor(procesos) as pool:
+        futuros = [pool.submit(_renderizar, t, directorio, formatos, dpi) for t in tareas]
+        return [ruta for f in futuros for ruta in f.result()]
+
+
+def _correr_script(ruta, directorio, formatos, dpi):
+    """
+    Corre un script sin ventanas en el proceso actual.
+
+    Los ejercicios del paquete se importan como módulos y se corre su main();
+    los scripts sueltos (como diagramafasorial_eje_2.py) se ejecutan con runpy.
+
+    Retorna:
+    Tupla (variables, figuras): resultados de main() o variables globales del
+    script al terminar, y rutas de las figuras que guardó
+    """
+    # Si el script importa este módulo por otro nombre obtiene una copia
+    # nueva, que toma la configuración de las variables de entorno
+    os.environ.update(FIGURAS_SALIDA=directorio, FIGURAS_FORMATOS=','.join(formatos),
+                      FIGURAS_DPI=str(dpi))
+    configurar_salida(directorio, formatos, dpi)
+    paquete = os.path.dirname(os.path.abspath(__file__))
+    carpeta = os.path.dirname(os.path.abspath(ruta))
+    sys.path.insert(0, os.path.dirname(paquete))
+    sys.argv = [ruta]
+    with contextlib.redirect_stdout(io.StringIO()):
+        if carpeta == paquete:
+            nombre = os.path.basename(paquete)
+            modulo = importlib.import_module(f'{nombre}.{os.path.splitext(os.path.basename(ruta))[0]}')
+            variables = modulo.main([])
+            graficos = importlib.import_module(f'{nombre}.graficos')
+        else:
+            variables = runpy.run_path(ruta, run_name='__main__')
+            graficos = sys.modules[variables['mostrar'].__module__]
+    return variables, graficos._salida['guardadas']
+
+
+def _ejecutar_script(ruta, directorio, formatos, dpi):
+    """Trabajo de un proceso: corre un script sin ventanas y junta sus figuras."""
+    return _correr_script(ruta, directorio, formatos, dpi)[1]
+
+
+def scripts_informe():
+    """Rutas de los scripts que generan las figuras del informe."""
+    aqui = os.path.dirname(os.path.abspath(__file__))
+    scripts = [os.path.join(aqui, f'ejercicio_{i}.py') for i in (1, 2, 3)]
+    scripts.append(os.path.join(os.path.dirname(aqui), 'diagramafasorial_eje_2.py'))
+    return scripts
+
+
+def generar_figuras(scripts, directorio, formatos=('png',), dpi=150, procesos=None):
+    """
+    Corre cada script en su propio proceso, guardando sus figuras sin mostrarlas.
+
+    Los scripts solo tienen que terminar cada figura con mostrar(nombre) en
+    lugar de plt.show(); la salida de texto de cada script se descarta. Cada
+    script corre en un proceso nuevo para no heredar estado de otro.
+
+    Parámetros:
+    scripts: Rutas de los scripts a ejecutar
+    directorio: Carpeta de salida
+    formatos: Extensiones a escribir
+    dpi: Resolución de los archivos de mapa de bits
+    procesos: Procesos del pool (por defecto uno por script)
+
+    Retorna:
+    Lista de rutas escritas
+    """
+    with ProcessPoolExecutor(procesos or len(scripts), max_tasks_per_child=1) as pool:
+        futuros = [pool.submit(_ejecutar_script, s, directorio, formatos, dpi) for s in scripts]
+        return [ruta for f in futuros for ruta in f.result()]
+
+
+# =============================================================================
+# FIGURAS DEL INFORME
+# =============================================================================
+def main(argv=None):
+    import argparse
+
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Regenera las figuras del informe sin ventanas")
+    parser.add_argument('--salida', default=os.path.join(raiz, 'figuras'))
+    parser.add_argument('--formatos', default='png', help="Por ejemplo png,pdf")
+    parser.add_argument('--procesos', type=int, default=None)
+    opciones = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    rutas = generar_figuras(scripts_informe(), opciones.salida, opciones.formatos.split(','),
+                            procesos=opciones.procesos)
+    for ruta in rutas:
+        print(os.path.relpath(ruta, raiz))
+    print(f"{len(rutas)} archivos en {time.perf_counter() - inicio:.1f} s")
+    return rutas
+
+
+if __name__ == "__main__":
+    main()
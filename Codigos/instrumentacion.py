@@ -0,0 +1,375 @@
+import atexit
+import collections
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import warnings
+
+# =============================================================================
+# ESTADO
+# =============================================================================
+# La instrumentación está apagada por defecto. Con la variable de entorno
+# CODIGOS_PERFIL=archivo.json se enciende al importar el paquete y al salir
+# se escriben la traza y el resumen. Este módulo no importa numpy: los
+# arrays se reconocen por sus atributos size y nbytes
+#
+# Cada llamada terminada se suma a los totales por pila (_agregados, de
+# tamaño acotado por la cantidad de pilas distintas) y se guarda en un anillo
+# con las últimas max_registros llamadas, que es lo que se exporta como
+# traza. Así un proceso largo con la instrumentación encendida no crece sin
+# límite: el resumen y las pilas plegadas cubren toda la corrida y la traza
+# las llamadas más recientes
+# 'traza_propia': tracemalloc lo inició activar, así que le toca detenerlo
+_estado = {'activo': False, 'memoria': False, 'hilo_memoria': None, 'traza_propia': False,
+           'max_registros': int(os.environ.get('CODIGOS_PERFIL_MAX', 100_000))}
+_registros = collections.deque(maxlen=_estado['max_registros'])
+_agregados = {}          # pila -> totales
+_cerrojo = threading.Lock()
+_local = threading.local()
+_inicio_ns = time.perf_counter_ns()
+
+
+def activar(memoria=False, max_registros=None):
+    """
+    Enciende la instrumentación.
+
+    Parámetros:
+    memoria: Si es True, mide también la memoria pico de cada tramo con
+             tracemalloc (numpy informa sus buffers ahí). Es mucho más lento,
+             así que por defecto solo se registran los bytes de las entradas
+             y los resultados. El pico de tracemalloc es global al proceso,
+             así que solo tiene sentido con un único hilo: si un segundo
+             hilo abre un tramo la medición de memoria se apaga (con un
+             aviso) y los tramos siguientes no llevan 'pico_bytes'. Si
+             tracemalloc ya estaba activo (rendimiento.medir, el usuario) se
+             usa sin detenerlo nunca
+    max_registros: Llamadas individuales que se conservan para la traza
+                   (las más recientes); por defecto 100000 o la variable de
+                   entorno CODIGOS_PERFIL_MAX
+    """
+    global _registros
+    if max_registros is not None and max_registros != _estado['max_registros']:
+        _estado['max_registros'] = max_registros
+        _registros = collections.deque(_registros, maxlen=max_registros)
+    _estado['activo'] = True
+    _estado['memoria'] = memoria
+    _estado['hilo_memoria'] = None
+    if memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _estado['traza_propia'] = True
+
+
+def _detener_traza():
+    """Detiene tracemalloc solo si lo inició activar."""
+    if _estado['traza_propia']:
+        _estado['traza_propia'] = False
+        tracemalloc.stop()
+
+
+def desactivar():
+    """Apaga la instrumentación (los registros ya tomados se conservan)."""
+    _estado['activo'] = False
+    _estado['memoria'] = False
+    _estado['hilo_memoria'] = None
+    _detener_traza()
+
+
+def activa():
+    return _estado['activo']
+
+
+def reiniciar():
+    """Borra los registros y los totales tomados hasta ahora."""
+    with _cerrojo:
+        _registros.clear()
+        _agregados.clear()
+
+
+def registros():
+    """
+    Copia de los registros de las últimas llamadas (a lo sumo max_registros):
+    nombre, pila, hilo, tiempos y tamaños de cada una.
+    """
+    with _cerrojo:
+        return list(_registros)
+
+
+def _acumular(agregados, registro):
+    """Suma un registro a los totales de su pila."""
+    a = agregados.get(registro['pila'])
+    if a is None:
+        a = agregados[registro['pila']] = {'llamadas': 0, 'duracion_ns': 0, 'propio_ns': 0,
+                                           'cpu_ns': 0, 'max_elementos': 0, 'bytes_salida': 0}
+    a['llamadas'] += 1
+    a['duracion_ns'] += registro['duracion_ns']
+    a['propio_ns'] += registro['propio_ns']
+    a['cpu_ns'] += registro['cpu_ns']
+    a['max_elementos'] = max(a['max_elementos'], registro.get('elementos', 0))
+    a['bytes_salida'] += registro.get('bytes_salida', 0)
+    if 'pico_bytes' in registro:
+        a['pico_bytes'] = max(a.get('pico_bytes', 0), registro['pico_bytes'])
+
+
+def _totales(lista):
+    """Totales por pila de toda la corrida, o de una lista de registros."""
+    if lista is None:
+        with _cerrojo:
+            return {pila: dict(a) for pila, a in _agregados.items()}
+    agregados = {}
+    for registro in lista:
+        _acumular(agregados, registro)
+    return agregados
+
+
+# =============================================================================
+# TRAMOS
+# =============================================================================
+def _pila():
+    pila = getattr(_local, 'pila', None)
+    if pila is None:
+        pila = _local.pila = []
+    return pila
+
+
+def _tamaño(valores):
+    """Elementos y bytes de los arrays entre los valores (recorre tuplas y listas)."""
+    elementos = nbytes = 0
+    for valor in valores:
+        if hasattr(valor, 'nbytes') and hasattr(valor, 'size'):
+            elementos += valor.size
+            nbytes += valor.nbytes
+        elif isinstance(valor, (tuple, list)) and len(valor) <= 8:
+            e, b = _tamaño(valor)
+            elementos += e
+            nbytes += b
+    return elementos, nbytes
+
+
+def _hilo_de_memoria():
+    """True si el hilo actual es el único que midió memoria hasta ahora."""
+    actual = threading.get_ident()
+    with _cerrojo:
+        if _estado['hilo_memoria'] is None:
+            _estado['hilo_memoria'] = actual
+        return _estado['hilo_memoria'] == actual
+
+
+def _apagar_memoria():
+    """Apaga la medición de memoria: tracemalloc.reset_peak afecta a todos los hilos."""
+    with _cerrojo:
+        if not _estado['memoria']:
+            return
+        _estado['memoria'] = False
+        # Sin medición de memoria la traza solo haría más lenta la corrida
+        _detener_traza()
+    warnings.warn("instrumentación: la memoria pico solo se mide con un único hilo; "
+                  "se desactiva la medición de memoria", RuntimeWarning, stacklevel=3)
+
+
+class _Tramo:
+    """Un tramo medido: se abre al entrar y se registra al salir."""
+
+    __slots__ = ('nombre', 'datos', 'inicio', 'cpu', 'hijos', 'memoria', 'pico')
+
+    def __init__(self, nombre, datos):
+        self.nombre = nombre
+        self.datos = datos
+
+    def __enter__(self):
+        pila = _pila()
+        if _estado['memoria'] and not _hilo_de_memoria():
+            _apagar_memoria()
+        if _estado['memoria']:
+            actual, pico = tracemalloc.get_traced_memory()
+            if pila:
+                pila[-1].pico = max(pila[-1].pico, pico)
+            tracemalloc.reset_peak()
+            self.memoria, self.pico = actual, actual
+        else:
+            self.memoria = None
+        pila.append(self)
+        self.hijos = 0
+        self.cpu = time.thread_time_ns()
+        self.inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *excepcion):
+        fin = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self.cpu
+        pila = _pila()
+        pila.pop()
+        duracion = fin - self.inicio
+        registro = {'nombre': self.nombre, 'pila': tuple(t.nombre for t in pila) + (self.nombre,),
+                    'hilo': threading.get_ident(), 'inicio_ns': self.inicio - _inicio_ns,
+                    'duracion_ns': duracion, 'propio_ns': duracion - self.hijos, 'cpu_ns': cpu}
+        registro.update(self.datos)
+        if self.memoria is not None and _estado['memoria'] and tracemalloc.is_tracing():
+            _, pico = tracemalloc.get_traced_memory()
+            self.pico = max(self.pico, pico)
+            registro['pico_bytes'] = self.pico - self.memoria
+            if pila:
+                pila[-1].pico = max(pila[-1].pico, self.pico)
+        if pila:
+            pila[-1].hijos += duracion
+        with _cerrojo:
+            _registros.append(registro)
+            _acumular(_agregados, registro)
+        return False
+
+
+class _TramoNulo:
+    """Tramo de la instrumentación apagada: no mide nada."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        return False
+
+
+_NULO = _TramoNulo()
+
+
+def tramo(nombre, **datos):
+    """
+    Context manager que mide un bloque de código.
+
+    Con la instrumentación apagada devuelve un objeto vacío compartido, así
+    que el costo es el de una llamada. Los datos extra (por ejemplo n=len(x))
+    se guardan en el registro.
+
+    Ejemplo:
+    with tramo('espectro', n=len(x)):
+        X = rfft(x)
+    """
+    if not _estado['activo']:
+        return _NULO
+    return _Tramo(nombre, datos)
+
+
+def instrumentar(funcion=None, *, nombre=None):
+    """
+    Decorador que mide cada llamada a la función.
+
+    Registra tiempo de pared y de CPU del hilo, elementos y bytes de los
+    arrays de entrada y del resultado. Apagado, agrega solo la consulta de
+    una bandera. Se usa como @instrumentar o @instrumentar(nombre='...').
+    """
+    if funcion is None:
+        return functools.partial(instrumentar, nombre=nombre)
+    etiqueta = nombre or f'{funcion.__module__.rsplit(".", 1)[-1]}.{funcion.__qualname__}'
+    estado = _estado
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not estado['activo']:
+            return funcion(*args, **kwargs)
+        elementos, nbytes = _tamaño(args)
+        with _Tramo(etiqueta, {'elementos': elementos, 'bytes_entrada': nbytes}) as t:
+            resultado = funcion(*args, **kwargs)
+            t.datos['bytes_salida'] = _tamaño((resultado,))[1]
+        return resultado
+
+    return envoltura
+
+
+# =============================================================================
+# RESUMEN Y EXPORTACIÓN
+# =============================================================================
+def resumen(lista=None):
+    """
+    Totales por nombre de tramo, ordenados por tiempo propio.
+
+    Sin lista cubre toda la corrida (aunque el anillo de registros ya haya
+    descartado las llamadas más viejas); con una lista de registros resume
+    solo esos.
+
+    Retorna:
+    Lista de diccionarios con 'nombre', 'llamadas', 'total_s' (pared, con
+    los tramos anidados), 'propio_s' (sin ellos), 'cpu_s', 'media_ms',
+    'max_elementos', 'bytes_salida' y, si se midió, 'pico_bytes' (máximo)
+    """
+    totales = {}
+    for pila, a in _totales(lista).items():
+        t = totales.setdefault(pila[-1], {'nombre': pila[-1], 'llamadas': 0, 'total_s': 0.0,
+                                          'propio_s': 0.0, 'cpu_s': 0.0, 'max_elementos': 0,
+                                          'bytes_salida': 0})
+        t['llamadas'] += a['llamadas']
+        # Una función recursiva aparece en varias pilas anidadas: su tiempo total
+        # se cuenta solo en la pila más externa para no sumarlo dos veces
+        if pila[-1] not in pila[:-1]:
+            t['total_s'] += a['duracion_ns'] * 1e-9
+        t['propio_s'] += a['propio_ns'] * 1e-9
+        t['cpu_s'] += a['cpu_ns'] * 1e-9
+        t['max_elementos'] = max(t['max_elementos'], a['max_elementos'])
+        t['bytes_salida'] += a['bytes_salida']
+        if 'pico_bytes' in a:
+            t['pico_bytes'] = max(t.get('pico_bytes', 0), a['pico_bytes'])
+    filas = sorted(totales.values(), key=lambda t: t['propio_s'], reverse=True)
+    for t in filas:
+        t['media_ms'] = 1e3 * t['total_s'] / t['llamadas']
+    return filas
+
+
+def imprimir_resumen(lista=None, archivo=None):
+    """Imprime el resumen como tabla; la última columna es el % del tiempo propio."""
+    filas = resumen(lista)
+    total = sum(t['propio_s'] for t in filas) or 1.0
+    ancho = max([5] + [len(t['nombre']) for t in filas])
+    print(f"{'tramo':<{ancho}} {'llamadas':>8} {'total s':>9} {'propio s':>9} {'cpu s':>9} "
+          f"{'media ms':>9} {'max elem':>10} {'MiB sal.':>9} {'%':>6}", file=archivo)
+    for t in filas:
+        print(f"{t['nombre']:<{ancho}} {t['llamadas']:>8} {t['total_s']:9.4f} {t['propio_s']:9.4f} "
+              f"{t['cpu_s']:9.4f} {t['media_ms']:9.3f} {t['max_elementos']:>10} "
+              f"{t['bytes_salida']/2**20:9.1f} {100*t['propio_s']/total:6.1f}", file=archivo)
+
+
+def exportar_traza(ruta, lista=None):
+    """
+    Escribe los tramos en el formato de eventos de Chrome (JSON).
+
+    Se abre con Perfetto (ui.perfetto.dev), chrome://tracing o speedscope,
+    que lo muestran como flame graph por hilo. Sin lista se exportan las
+    últimas max_registros llamadas; 'otherData' indica cuántas se descartaron.
+    """
+    lista = registros() if lista is None else lista
+    llamadas = sum(a['llamadas'] for a in _totales(None).values())
+    eventos = [{'name': r['nombre'], 'ph': 'X', 'pid': os.getpid(), 'tid': r['hilo'],
+                'ts': r['inicio_ns'] / 1e3, 'dur': r['duracion_ns'] / 1e3,
+                'args': {k: v for k, v in r.items()
+                         if k not in ('nombre', 'pila', 'hilo', 'inicio_ns', 'duracion_ns')}}
+               for r in lista]
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms',
+                   'otherData': {'descartados': max(llamadas - len(lista), 0)}}, archivo)
+
+
+def exportar_pilas(ruta, lista=None):
+    """
+    Escribe las pilas plegadas (una línea 'a;b;c microsegundos' por pila).
+
+    Es el formato de entrada de flamegraph.pl y de speedscope; el peso de
+    cada pila es su tiempo propio. Sale de los totales, así que cubre toda la
+    corrida.
+    """
+    pesos = {';'.join(pila): a['propio_ns'] for pila, a in _totales(lista).items()}
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        for clave, peso in sorted(pesos.items()):
+            archivo.write(f'{clave} {max(1, peso // 1000)}\n')
+
+
+def _exportar_al_salir(ruta):
+    exportar_traza(ruta)
+    exportar_pilas(os.path.splitext(ruta)[0] + '.folded')
+    imprimir_resumen(archivo=sys.stderr)
+
+
+if os.environ.get('CODIGOS_PERFIL'):
+    activar(memoria=os.environ.get('CODIGOS_PERFIL_MEMORIA') == '1')
+    atexit.register(_exportar_al_salir, os.environ['CODIGOS_PERFIL'])
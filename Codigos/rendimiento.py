@@ -0,0 +1,303 @@
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+
+from .transformadas import rfft
+from .espectro import medir_tonos
+from .entropia import contar_simbolos, entropia_conteos
+from .ejercicio_2 import fourier_coefficients, reconstruct_signal, calculate_mse
+from .ejercicio_3 import hilbert_transform_fft
+
+# =============================================================================
+# NÚCLEOS A MEDIR
+# =============================================================================
+# Cada núcleo tiene una función preparar(n, rng) que arma las entradas (fuera
+# de la medición) y la función medida, que recibe esas entradas. bytes_muestra
+# estima la memoria de trabajo por muestra para saltear los tamaños que no
+# entran en la RAM disponible
+FS = 1000.0
+TEXTO = "El rapido zorro marron salta sobre el perro perezoso".lower().encode('utf-8')
+
+
+def _señal(n, rng):
+    """Suma de tonos del ejercicio 1 más ruido, de n muestras."""
+    t = np.arange(n) / FS
+    x = (np.sin(2*np.pi*50*t + np.pi/2) + 0.5*np.sin(2*np.pi*120*t + np.pi/2)
+         + 0.3*np.sin(2*np.pi*200*t + np.pi/2))
+    x += 0.01 * rng.standard_normal(n)
+    return x
+
+
+def _texto(n, rng):
+    """n caracteres tomados al azar del texto del ejercicio 4."""
+    return np.frombuffer(TEXTO, dtype=np.uint8)[rng.integers(0, len(TEXTO), n)].tobytes()
+
+
+def _entropia_counter(texto):
+    """Entropía con collections.Counter, como la calculaba ejercicio_4.py originalmente."""
+    conteo = Counter(texto)
+    total = len(texto)
+    return -sum((c/total) * math.log2(c/total) for c in conteo.values())
+
+
+NUCLEOS = {
+    'ejercicio1_rfft': {
+        'preparar': lambda n, rng: (_señal(n, rng),),
+        'funcion': rfft,
+        'bytes_muestra': 48,
+    },
+    'ejercicio1_tonos': {
+        'preparar': lambda n, rng: (_señal(n, rng), [50, 120, 200], FS),
+        'funcion': medir_tonos,
+        'bytes_muestra': 16,
+    },
+    'ejercicio2_reconstruccion': {
+        'preparar': lambda n, rng: (np.arange(n) / FS, fourier_coefficients(50)),
+        'funcion': reconstruct_signal,
+        'bytes_muestra': 40,
+    },
+    'ejercicio2_mse': {
+        'preparar': lambda n, rng: (np.sign(np.sin(2*np.pi*np.arange(n)/FS)),
+                                    _señal(n, rng)),
+        'funcion': calculate_mse,
+        'bytes_muestra': 32,
+    },
+    'ejercicio3_hilbert': {
+        'preparar': lambda n, rng: (_señal(n, rng),),
+        'funcion': hilbert_transform_fft,
+        'bytes_muestra': 72,
+    },
+    'ejercicio4_entropia': {
+        'preparar': lambda n, rng: (_texto(n, rng),),
+        'funcion': lambda texto: entropia_conteos(contar_simbolos(texto)),
+        'bytes_muestra': 16,
+    },
+    # Referencia: la versión original con Counter, para seguir la aceleración
+    'ejercicio4_counter': {
+        'preparar': lambda n, rng: (_texto(n, rng).decode('ascii'),),
+        'funcion': _entropia_counter,
+        'bytes_muestra': 4,
+    },
+}
+
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+def memoria_disponible():
+    """Bytes de RAM disponibles (MemAvailable de Linux, o la RAM física)."""
+    try:
+        with open('/proc/meminfo') as archivo:
+            for linea in archivo:
+                if linea.startswith('MemAvailable:'):
+                    return int(linea.split()[1]) * 1024
+    except OSError:
+        pass
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+
+def medir(funcion, argumentos, presupuesto=0.5, max_repeticiones=100):
+    """
+    Mide tiempo, memoria pico y bloques asignados de una llamada.
+
+    La primera llamada se descarta como calentamiento (planes de FFT,
+    cachés) salvo que tarde más que el presupuesto, en cuyo caso ya cuenta
+    como medición. Después se repite hasta gastar el presupuesto, con el
+    recolector de basura desactivado como hace timeit. La memoria se mide
+    en una llamada aparte con tracemalloc (que numpy también informa), porque
+    trazar las asignaciones hace más lenta la ejecución.
+
+    Parámetros:
+    funcion: Función a medir
+    argumentos: Tupla de argumentos
+    presupuesto: Segundos de medición por núcleo y tamaño
+    max_repeticiones: Tope de repeticiones
+
+    Retorna:
+    Diccionario con 'segundos' (mínimo), 'mediana', 'repeticiones',
+    'pico_bytes' (memoria pico por encima de la inicial), 'retenido_bytes'
+    y 'bloques' (asignaciones que siguen vivas al terminar, por ejemplo el
+    resultado)
+    """
+    tiempos = []
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        funcion(*argumentos)
+        primera = time.perf_counter() - inicio
+        if primera >= presupuesto:
+            tiempos.append(primera)
+        while len(tiempos) < max_repeticiones and (not tiempos or sum(tiempos) < presupuesto):
+            inicio = time.perf_counter()
+            funcion(*argumentos)
+            tiempos.append(time.perf_counter() - inicio)
+    finally:
+        if gc_activo:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        resultado = funcion(*argumentos)
+        actual, pico = tracemalloc.get_traced_memory()
+        despues = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del resultado
+    bloques = sum(max(d.count_diff, 0) for d in despues.compare_to(antes, 'filename'))
+    return {'segundos': min(tiempos), 'mediana': float(np.median(tiempos)),
+            'repeticiones': len(tiempos), 'pico_bytes': pico - base,
+            'retenido_bytes': actual - base, 'bloques': bloques}
+
+
+def metadatos():
+    """Datos del entorno para que los resultados sean comparables."""
+    return {'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'plataforma': platform.platform(), 'procesador': platform.processor(),
+            'nucleos': os.cpu_count(), 'memoria_bytes': memoria_disponible()}
+
+
+def correr(nucleos=None, tamanos=None, presupuesto=0.5, semilla=0, informar=print):
+    """
+    Corre los núcleos en cada tamaño y devuelve los resultados.
+
+    Las entradas se generan con una semilla fija, así que dos corridas miden
+    exactamente lo mismo. Los tamaños cuya memoria de trabajo estimada supera
+    el 80 % de la RAM disponible se registran como omitidos.
+
+    Parámetros:
+    nucleos: Nombres de NUCLEOS a correr (por defecto todos)
+    tamanos: Cantidades de muestras/caracteres (por defecto 10^3 a 10^8)
+    presupuesto: Segundos de medición por núcleo y tamaño
+    semilla: Semilla de las entradas
+    informar: Función que recibe una línea de progreso (None para silenciar)
+
+    Retorna:
+    Diccionario {'metadatos': ..., 'resultados': [...]} listo para JSON
+    """
+    nucleos = list(NUCLEOS) if nucleos is None else list(nucleos)
+    tamanos = [10**k for k in range(3, 9)] if tamanos is None else [int(n) for n in tamanos]
+    resultados = []
+    for nombre in nucleos:
+        nucleo = NUCLEOS[nombre]
+        # Una llamada chica paga los imports diferidos antes de medir
+        nucleo['funcion'](*nucleo['preparar'](1000, np.random.default_rng(semilla)))
+        for n in tamanos:
+            fila = {'nucleo': nombre, 'n': n}
+            if n * nucleo['bytes_muestra'] > 0.8 * memoria_disponible():
+                fila['omitido'] = 'memoria insuficiente'
+            else:
+                argumentos = nucleo['preparar'](n, np.random.default_rng(semilla))
+                fila.update(medir(nucleo['funcion'], argumentos, presupuesto))
+                fila['muestras_por_segundo'] = n / fila['segundos']
+                del argumentos
+            resultados.append(fila)
+            if informar:
+                informar(_linea(fila))
+    return {'metadatos': metadatos(), 'resultados': resultados}
+
+
+def _linea(fila):
+    if 'omitido' in fila:
+        return f"{fila['nucleo']:<26} {fila['n']:>10.0e}  omitido: {fila['omitido']}"
+    return (f"{fila['nucleo']:<26} {fila['n']:>10.0e} {1e3*fila['segundos']:11.3f} ms "
+            f"{fila['muestras_por_segundo']/1e6:9.1f} M/s {fila['pico_bytes']/2**20:10.1f} MiB "
+            f"{fila['bloques']:7d} bloques")
+
+
+# =============================================================================
+# COMPARACIÓN CON UNA LÍNEA DE BASE
+# =============================================================================
+def comparar(actual, base, umbral=0.10, minimo=5e-5):
+    """
+    Compara dos corridas y marca las regresiones.
+
+    Un núcleo retrocede si su tiempo mínimo crece más que el umbral relativo
+    (y más que minimo segundos, para no marcar ruido en tamaños chicos) o si
+    su memoria pico crece más que el umbral.
+
+    Parámetros:
+    actual, base: Resultados de correr() (o leídos del JSON)
+    umbral: Tolerancia relativa, por ejemplo 0.10 = 10 %
+    minimo: Diferencia absoluta de tiempo por debajo de la cual se ignora
+
+    Retorna:
+    Lista de diccionarios por núcleo y tamaño presentes en ambas corridas,
+    con 'razon_tiempo', 'razon_memoria' y 'regresion' (lista de motivos)
+    """
+    previos = {(f['nucleo'], f['n']): f for f in base['resultados'] if 'omitido' not in f}
+    comparacion = []
+    for fila in actual['resultados']:
+        previa = previos.get((fila['nucleo'], fila['n']))
+        if previa is None or 'omitido' in fila:
+            continue
+        razon_tiempo = fila['segundos'] / previa['segundos']
+        razon_memoria = (fila['pico_bytes'] + 1) / (previa['pico_bytes'] + 1)
+        motivos = []
+        if razon_tiempo > 1 + umbral and fila['segundos'] - previa['segundos'] > minimo:
+            motivos.append('tiempo')
+        if razon_memoria > 1 + umbral and fila['pico_bytes'] - previa['pico_bytes'] > 4096:
+            motivos.append('memoria')
+        comparacion.append({'nucleo': fila['nucleo'], 'n': fila['n'],
+                            'razon_tiempo': razon_tiempo, 'razon_memoria': razon_memoria,
+                            'regresion': motivos})
+    return comparacion
+
+
+def imprimir_comparacion(comparacion):
+    """Imprime la comparación; las regresiones se marcan con '<<'."""
+    print(f"{'núcleo':<26} {'n':>10} {'tiempo':>9} {'memoria':>9}")
+    for c in comparacion:
+        marca = f"  << {', '.join(c['regresion'])}" if c['regresion'] else ''
+        print(f"{c['nucleo']:<26} {c['n']:>10.0e} {c['razon_tiempo']:8.2f}x "
+              f"{c['razon_memoria']:8.2f}x{marca}")
+
+
+# =============================================================================
+# LÍNEA DE COMANDOS
+# =============================================================================
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Mide tiempo y memoria de los núcleos numéricos de los ejercicios")
+    parser.add_argument('--nucleos', nargs='+', choices=list(NUCLEOS), default=None)
+    parser.add_argument('--desde', type=int, default=3, help="Exponente del tamaño menor (10^k)")
+    parser.add_argument('--hasta', type=int, default=8, help="Exponente del tamaño mayor (10^k)")
+    parser.add_argument('--presupuesto', type=float, default=0.5,
+                        help="Segundos de medición por núcleo y tamaño")
+    parser.add_argument('--salida', default=None, help="Archivo JSON donde guardar los resultados")
+    parser.add_argument('--base', default=None, help="JSON de una corrida anterior a comparar")
+    parser.add_argument('--umbral', type=float, default=0.10,
+                        help="Crecimiento relativo que cuenta como regresión")
+    opciones = parser.parse_args(argv)
+
+    resultados = correr(opciones.nucleos, [10**k for k in range(opciones.desde, opciones.hasta + 1)],
+                        opciones.presupuesto)
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+    if opciones.base:
+        with open(opciones.base, encoding='utf-8') as archivo:
+            comparacion = comparar(resultados, json.load(archivo), opciones.umbral)
+        print()
+        imprimir_comparacion(comparacion)
+        if any(c['regresion'] for c in comparacion):
+            sys.exit(1)
+    return resultados
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+import numpy as np
+
+from .transformadas import ifft, rfft
+from .instrumentacion import instrumentar
+
+# Convención de coeficientes: cada término de la serie es Im(c · exp(j2πn f0 t)).
+# Un coeficiente real c es entonces c·sin(2πn f0 t), igual que en
+# reconstruct_signal de ejercicio_2.py; uno complejo b_n + j·a_n representa
+# b_n·sin(2πn f0 t) + a_n·cos(2πn f0 t).
+
+# =============================================================================
+# GENERACIÓN DE LOS TÉRMINOS ARMÓNICOS
+# =============================================================================
+def _matriz_armonicos(omega_t, n, resincronizar):
+    """
+    Devuelve la matriz exp(j·n_k·ω t) (armónicos × muestras) por recurrencia.
+
+    Cada fila se obtiene de la anterior con la suma de ángulos
+    exp(j·n_k·ωt) = exp(j·n_{k-1}·ωt) · exp(j·(n_k - n_{k-1})·ωt), es decir, un
+    producto complejo en lugar de una función trascendente. Los factores de
+    paso se calculan una vez por cada salto distinto (para armónicos impares
+    hay uno solo). Cada resincronizar filas se vuelve a evaluar la exponencial
+    directamente para que el error de redondeo no se acumule.
+    """
+    Z = np.empty((len(n), len(omega_t)), dtype=complex)
+    pasos = {}
+    for k, nk in enumerate(n):
+        if k % resincronizar == 0:
+            np.exp(1j * nk * omega_t, out=Z[k])
+            continue
+        d = nk - n[k - 1]
+        if d not in pasos:
+            pasos[d] = np.exp(1j * d * omega_t)
+        np.multiply(Z[k - 1], pasos[d], out=Z[k])
+    return Z
+
+
+def _muestras_por_periodo(t, f0):
+    """
+    Devuelve las muestras por período si t es uniforme y el período es un
+    número entero de muestras; en otro caso None.
+    """
+    if len(t) < 2:
+        return None
+    dt = t[1] - t[0]
+    if not np.allclose(np.diff(t), dt, rtol=1e-9, atol=0):
+        return None
+    P = 1 / (f0 * dt)
+    if round(P) < 1 or abs(P - round(P)) > 1e-9 * P:
+        return None
+    return int(round(P))
+
+
+def _periodo_ifft(t0, n, coef, f0, P):
+    """
+    Sintetiza un período de P muestras de la serie con una sola IFFT.
+
+    Sobre una grilla uniforme con P muestras por período,
+    exp(j2πn f0 t_k) = exp(j2πn f0 t0)·exp(j2π n k / P), así que cada
+    coeficiente cae en el bin n mod P de una IFFT de P puntos.
+    """
+    S = np.zeros(P, dtype=complex)
+    np.add.at(S, n.astype(int) % P, coef * np.exp(2j*np.pi*f0*n*t0))
+    return np.imag(ifft(S, sobrescribir=True)) * P
+
+
+def _separar(coefficients):
+    """Convierte la lista de tuplas (n, coeficiente) en dos arrays."""
+    if not len(coefficients):
+        return np.empty(0), np.empty(0)
+    n, coef = zip(*coefficients)
+    coef = np.asarray(coef)
+    if not np.iscomplexobj(coef):
+        coef = coef.astype(float)
+    return np.asarray(n, dtype=float), coef
+
+
+# =============================================================================
+# ESTIMACIÓN NUMÉRICA DE COEFICIENTES
+# =============================================================================
+def coeficientes_por_periodo(x, muestras_por_periodo, n_max=None, f0=1.0, t0=0.0):
+    """
+    Estima los coeficientes de Fourier de cada período de una señal muestreada.
+
+    Todos los períodos y todos los armónicos salen de una única rfft sobre el
+    array (períodos × muestras_por_periodo). Con X = rfft de un período de P
+    muestras, c_n = 2j·X[n]/P (j·X[n]/P para la continua y el bin de
+    Nyquist), en la convención Im(c_n·exp(j2πn f0 t)) de este módulo:
+    a_n = Im(c_n) y b_n = Re(c_n).
+
+    Parámetros:
+    x: Señal muestreada (1-D); se descartan las muestras del último período
+       incompleto
+    muestras_por_periodo: Muestras P de cada período
+    n_max: Mayor armónico a devolver (por defecto P//2)
+    f0: Frecuencia fundamental (Hz), solo para referir las fases a t0
+    t0: Instante de la primera muestra (s)
+
+    Retorna:
+    Tupla (n, C): n son los armónicos 0..n_max y C un array complejo
+    (períodos, n_max + 1)
+    """
+    P = int(muestras_por_periodo)
+    x = np.asarray(x, dtype=float)
+    n_periodos = x.shape[-1] // P
+    if n_periodos == 0:
+        raise ValueError("La señal no contiene ningún período completo")
+    periodos = x[..., :n_periodos * P].reshape(x.shape[:-1] + (n_periodos, P))
+    n_max = P // 2 if n_max is None else min(n_max, P // 2)
+    C = rfft(periodos, axis=-1)[..., :n_max + 1] * (2j / P)
+    C[..., 0] /= 2
+    if P % 2 == 0 and n_max == P // 2:
+        C[..., -1] /= 2
+    n = np.arange(n_max + 1)
+    if t0:
+        C *= np.exp(-2j*np.pi*f0*n*t0)
+    return n, C
+
+
+@instrumentar
+def estimar_coeficientes(x, muestras_por_periodo, n_max=None, f0=1.0, t0=0.0,
+                         tolerancia=0.0):
+    """
+    Estima los coeficientes de Fourier de una señal periódica muestreada.
+
+    Promedia los períodos en el tiempo (equivale a promediar coherentemente
+    sus espectros) y transforma el período medio con una sola rfft.
+
+    Parámetros:
+    x: Señal muestreada que abarca uno o más períodos completos
+    muestras_por_periodo: Muestras de cada período
+    n_max: Mayor armónico a devolver (por defecto muestras_por_periodo//2)
+    f0: Frecuencia fundamental (Hz), solo para referir las fases a t0
+    t0: Instante de la primera muestra (s)
+    tolerancia: Se descartan los coeficientes con |c_n| <= tolerancia
+
+    Retorna:
+    Lista de tuplas (n, coeficiente), lista para reconstruct_signal o
+    sintetizar (coeficientes complejos b_n + j·a_n)
+    """
+    P = int(muestras_por_periodo)
+    x = np.asarray(x, dtype=float)
+    n_periodos = len(x) // P
+    if n_periodos == 0:
+        raise ValueError("La señal no contiene ningún período completo")
+    periodo_medio = x[:n_periodos * P].reshape(n_periodos, P).mean(axis=0)
+    n, C = coeficientes_por_periodo(periodo_medio, P, n_max, f0, t0)
+    return [(int(k), c) for k, c in zip(n, C[0]) if abs(c) > tolerancia]
+
+
+# =============================================================================
+# NÚCLEOS DE SUMACIÓN
+# =============================================================================
+def factores_sigma(n, n_max, sumacion='dirichlet'):
+    """
+    Factores σ_n que multiplican cada coeficiente de una suma parcial hasta n_max.
+
+    'dirichlet': σ = 1 (suma parcial común, muestra el fenómeno de Gibbs)
+    'fejer':     σ = 1 - n/(n_max + 1) (promedio de Cesàro, sin sobrepico)
+    'lanczos':   σ = sinc(n/(n_max + 1)) (reduce el sobrepico a ~1% del salto)
+
+    Los armónicos con n > n_max reciben σ = 0. Admite broadcasting entre n y
+    n_max.
+    """
+    n = np.asarray(n, dtype=float)
+    n_max = np.asarray(n_max, dtype=float)
+    incluido = n <= n_max
+    if sumacion == 'dirichlet':
+        return incluido * 1.0
+    if sumacion == 'fejer':
+        return incluido * (1 - n / (n_max + 1))
+    if sumacion == 'lanczos':
+        return incluido * np.sinc(n / (n_max + 1))
+    raise ValueError(f"Núcleo de sumación desconocido: {sumacion}")
+
+
+def aplicar_sumacion(coefficients, sumacion, n_max=None):
+    """
+    Aplica un núcleo de sumación a una lista de coeficientes (n, coeficiente).
+
+    Parámetros:
+    coefficients: Lista de tuplas (n, coeficiente)
+    sumacion: 'dirichlet', 'fejer' o 'lanczos'
+    n_max: Orden de la suma parcial (por defecto el mayor n de la lista)
+
+    Retorna:
+    Nueva lista de tuplas con los coeficientes ponderados
+    """
+    if n_max is None:
+        n_max = max((n for n, _ in coefficients), default=0)
+    return [(n, c * factores_sigma(n, n_max, sumacion)) for n, c in coefficients
+            if n <= n_max]
+
+
+# =============================================================================
+# SUMAS PARCIALES INCREMENTALES
+# =============================================================================
+@instrumentar
+def reconstrucciones_parciales(t, coefficients, cantidades, f0, original=None,
+                               guardar=True, metodo='recurrencia', resincronizar=32,
+                               tam_bloque=4096, tam_grupo=128, sumacion='dirichlet'):
+    """
+    Calcula las sumas parciales de la serie para varias cantidades de armónicos
+    en una sola pasada sobre los armónicos.
+
+    En lugar de reconstruir la señal desde cero para cada entrada de
+    cantidades, cada término se evalúa una única vez y se suma a todas las
+    reconstrucciones que lo incluyen. Para un bloque de tiempo y un grupo de
+    armónicos eso es un solo producto matricial:
+
+        bloque_recon += Im(pesos.T @ exp(j2π f0 · n ⊗ t)),  pesos = coef · [n <= cantidad]
+
+    El tiempo se recorre por bloques de tam_bloque muestras y los armónicos
+    por grupos de tam_grupo, así que la memoria de trabajo no depende del
+    largo de la señal ni de la cantidad de armónicos.
+
+    Parámetros:
+    t: Vector de tiempo
+    coefficients: Lista de tuplas (n, coeficiente) hasta el mayor armónico
+                  pedido (por ejemplo fourier_coefficients(max(cantidades)))
+    cantidades: Cantidades de armónicos a reconstruir (n máximo incluido)
+    f0: Frecuencia fundamental (Hz)
+    original: Señal original; si se indica se calcula el MSE de cada
+              reconstrucción (mismo criterio que calculate_mse)
+    guardar: Si es False no se guardan las reconstrucciones (solo el MSE),
+             útil para barridos muy grandes
+    metodo: Cómo se generan los términos (ver sintetizar): 'recurrencia',
+            'directo' o 'ifft'
+    resincronizar: Cada cuántos armónicos se reevalúa la exponencial
+                   (método 'recurrencia')
+    tam_bloque: Muestras de tiempo por bloque
+    tam_grupo: Armónicos por grupo
+    sumacion: Núcleo de sumación aplicado a cada suma parcial ('dirichlet',
+              'fejer' o 'lanczos', ver factores_sigma)
+
+    Retorna:
+    Tupla (reconstrucciones, mse): reconstrucciones es un array
+    (len(cantidades), len(t)) o None, y mse un array de len(cantidades) o None
+    """
+    t = np.asarray(t, dtype=float)
+    cantidades = np.asarray(cantidades)
+    n, coef = _separar(coefficients)
+
+    # pesos[k, j] = coeficiente del armónico k (con su factor σ) si entra en la
+    # reconstrucción j
+    pesos = coef[:, None] * factores_sigma(n[:, None], cantidades[None, :], sumacion)
+
+    reconstrucciones = np.zeros((len(cantidades), len(t))) if guardar else None
+    suma_error = np.zeros(len(cantidades)) if original is not None else None
+
+    if metodo == 'ifft':
+        P = _muestras_por_periodo(t, f0)
+        if P is None:
+            raise ValueError("El método 'ifft' requiere una grilla uniforme con "
+                             "un número entero de muestras por período")
+        periodos = np.array([_periodo_ifft(t[0], n, pesos[:, j], f0, P)
+                             for j in range(len(cantidades))])
+
+    for inicio in range(0, len(t), tam_bloque):
+        tb = t[inicio:inicio + tam_bloque]
+        if metodo == 'ifft':
+            bloque = periodos[:, np.arange(inicio, inicio + len(tb)) % P]
+        else:
+            bloque = np.zeros((len(cantidades), len(tb)))
+            for g in range(0, len(n), tam_grupo):
+                ng = n[g:g + tam_grupo]
+                if metodo == 'directo' and not np.iscomplexobj(pesos):
+                    bloque += pesos[g:g + tam_grupo].T @ np.sin(np.outer(2*np.pi*f0*ng, tb))
+                    continue
+                if metodo == 'directo':
+                    Z = np.exp(1j * np.outer(2*np.pi*f0*ng, tb))
+                elif metodo == 'recurrencia':
+                    Z = _matriz_armonicos(2*np.pi*f0*tb, ng, resincronizar)
+                else:
+                    raise ValueError(f"Método de síntesis desconocido: {metodo}")
+                bloque += np.imag(pesos[g:g + tam_grupo].T @ Z)
+        if guardar:
+            reconstrucciones[:, inicio:inicio + len(tb)] = bloque
+        if original is not None:
+            error = np.asarray(original[inicio:inicio + len(tb)]) - bloque
+            suma_error += np.einsum('ij,ij->i', error, error)
+
+    mse = suma_error / len(t) if original is not None else None
+    return reconstrucciones, mse
+
+
+# =============================================================================
+# SÍNTESIS DE FORMAS DE ONDA MULTIARMÓNICAS
+# =============================================================================
+def sintetizar(t, coefficients, f0, metodo='auto', resincronizar=32,
+               tam_bloque=4096, tam_grupo=128):
+    """
+    Sintetiza Σ Im(c_n · exp(j2πn f0 t)) para una lista arbitraria de coeficientes.
+
+    Métodos:
+    'directo':     evalúa sin(2πn f0 t) para cada armónico (camino de
+                   reconstruct_signal). Referencia de exactitud.
+    'recurrencia': obtiene cada armónico del anterior con un producto complejo
+                   (suma de ángulos) y resincroniza con la exponencial exacta
+                   cada resincronizar armónicos, así que el error no crece con
+                   la cantidad de armónicos sino con resincronizar.
+    'ifft':        para grillas uniformes con un número entero de muestras
+                   por período calcula un período con una IFFT y lo repite.
+
+    Exactitud medida frente a 'directo' (1000 armónicos impares de la onda
+    cuadrada, 2·10^5 muestras, resincronizar=32): diferencia máxima ~1e-12
+    para 'recurrencia' e 'ifft'. Es del mismo orden que el error del propio
+    camino directo, dominado por el redondeo del argumento 2πn f0 t.
+    'auto':        usa 'ifft' cuando la grilla lo permite y 'recurrencia' si no.
+
+    Parámetros:
+    t: Vector de tiempo
+    coefficients: Lista de tuplas (n, coeficiente), por ejemplo la salida de
+                  fourier_coefficients; los coeficientes pueden ser complejos
+    f0: Frecuencia fundamental (Hz)
+    metodo: 'auto', 'recurrencia', 'ifft' o 'directo'
+    resincronizar: Cada cuántos armónicos se reevalúa la exponencial
+    tam_bloque: Muestras de tiempo por bloque
+    tam_grupo: Armónicos por grupo
+
+    Retorna:
+    Señal sintetizada, con la misma forma que t
+    """
+    t = np.asarray(t, dtype=float)
+    if metodo == 'auto':
+        enteros = all(float(n).is_integer() for n, _ in coefficients)
+        metodo = 'ifft' if enteros and _muestras_por_periodo(t, f0) else 'recurrencia'
+    n = [c[0] for c in coefficients]
+    recon, _ = reconstrucciones_parciales(
+        t, coefficients, [max(n, default=0)], f0, metodo=metodo,
+        resincronizar=resincronizar, tam_bloque=tam_bloque, tam_grupo=tam_grupo)
+    return recon[0]
+
+
+# =============================================================================
+# ANÁLISIS DEL FENÓMENO DE GIBBS
+# =============================================================================
+def detectar_discontinuidades(t, x, umbral=0.25):
+    """
+    Ubica los saltos de una señal muestreada.
+
+    Se marcan las muestras cuya diferencia supera umbral veces la amplitud
+    pico a pico; las marcas consecutivas (un salto que pasa por un valor
+    intermedio, como el 0 de np.sign) se agrupan en una sola discontinuidad.
+    Los saltos que tocan el primer o el último intervalo se descartan porque
+    no se distinguen de un borde de la ventana.
+
+    Parámetros:
+    t: Vector de tiempo
+    x: Señal muestreada
+    umbral: Fracción de la amplitud pico a pico que se considera salto
+
+    Retorna:
+    Lista de tuplas (t_d, nivel_antes, nivel_despues, incertidumbre), donde
+    la discontinuidad está en t_d ± incertidumbre
+    """
+    x = np.asarray(x, dtype=float)
+    d = np.diff(x)
+    marcas = np.flatnonzero(np.abs(d) > umbral * np.ptp(x))
+    if len(marcas) == 0:
+        return []
+    grupos = np.split(marcas, np.flatnonzero(np.diff(marcas) > 1) + 1)
+    return [(0.5 * (t[g[0]] + t[g[-1] + 1]), x[g[0]], x[g[-1] + 1],
+             0.5 * (t[g[-1] + 1] - t[g[0]]))
+            for g in grupos if g[0] > 0 and g[-1] + 1 < len(x) - 1]
+
+
+def _evaluar(tt, n, coef, f0):
+    """Evalúa la serie en pocos puntos con un único producto matriz-vector."""
+    tt = np.atleast_1d(tt)
+    return np.imag(np.exp(2j*np.pi*f0*np.outer(tt, n)) @ coef)
+
+
+def _seccion_aurea(f, a, b, tolerancia):
+    """Maximiza f en [a, b] por sección áurea."""
+    r = (np.sqrt(5) - 1) / 2
+    c, d = b - r*(b - a), a + r*(b - a)
+    fc, fd = f(c), f(d)
+    while b - a > tolerancia:
+        if fc > fd:
+            b, d, fd = d, c, fc
+            c = b - r*(b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + r*(b - a)
+            fd = f(d)
+    return 0.5 * (a + b)
+
+
+def analizar_gibbs(coefficients, f0, discontinuidad, cantidades, sumacion='dirichlet',
+                   puntos_por_ciclo=16, ciclos=40, ventana_max=None):
+    """
+    Mide el sobrepico y el ancho del rizado de las sumas parciales junto a un salto.
+
+    La serie se evalúa solo en una ventana local a la derecha de la
+    discontinuidad cuyo ancho escala con 1/(N f0), en lugar de hacerlo sobre
+    toda una grilla global densa. Para cada N la posición del salto se
+    refina primero por bisección (cruce de la suma parcial por el nivel
+    medio dentro de t_d ± incertidumbre), ya que la grilla original no
+    alcanza a resolver el rizado de los armónicos altos. El máximo del sobrepico se ubica primero en
+    esa grilla local y luego se refina por sección áurea. El ancho del
+    rizado es la distancia del salto al primer cruce por el nivel final
+    después del pico (el fin del lóbulo principal de Gibbs, ~1/(N f0)), que se
+    refina por bisección. Un criterio de asentamiento (|error| < 1 % del
+    salto) casi nunca se cumpliría dentro de la ventana, porque el rizado de
+    Dirichlet decae como 1/(N f0 t).
+
+    Parámetros:
+    coefficients: Lista de tuplas (n, coeficiente) hasta max(cantidades)
+    f0: Frecuencia fundamental (Hz)
+    discontinuidad: Tupla (t_d, nivel_antes, nivel_despues[, incertidumbre]),
+                    por ejemplo de detectar_discontinuidades
+    cantidades: Cantidades de armónicos a analizar
+    sumacion: Núcleo de sumación ('dirichlet', 'fejer' o 'lanczos')
+    puntos_por_ciclo: Resolución de la grilla local por ciclo del armónico N
+    ciclos: Ancho de la ventana local en ciclos del armónico N
+    ventana_max: Ancho máximo de la ventana (s); por defecto un cuarto de
+                 período, para no alcanzar la discontinuidad siguiente
+
+    Retorna:
+    Diccionario con arrays (uno por cantidad): 'cantidades', 't_salto',
+    't_pico', 'sobrepico' (fracción del salto), 'ancho' (s; 0 si no hay
+    sobrepico, como con Fejér), 'censurado' (True si la suma no vuelve al
+    nivel final dentro de la ventana; entonces 'ancho' es NaN y solo se sabe
+    que supera 'ventana') y 'ventana' (s)
+    """
+    t_salto, antes, despues = discontinuidad[:3]
+    incertidumbre = discontinuidad[3] if len(discontinuidad) > 3 else 0.0
+    medio = 0.5 * (antes + despues)
+    salto = despues - antes
+    signo = np.sign(salto)
+    ventana_max = 0.25 / f0 if ventana_max is None else ventana_max
+    n_todos, coef_todos = _separar(coefficients)
+
+    resultado = {'cantidades': np.asarray(cantidades), 't_salto': [], 't_pico': [],
+                 'sobrepico': [], 'ancho': [], 'censurado': [], 'ventana': []}
+    for N in cantidades:
+        incluidos = n_todos <= N
+        n = n_todos[incluidos]
+        coef = coef_todos[incluidos] * factores_sigma(n, N, sumacion)
+        desvio = lambda tt: signo * (_evaluar(tt, n, coef, f0) - despues)
+
+        ciclo = 1 / (N * f0)
+
+        # Posición del salto: cruce de la suma parcial por el nivel medio
+        cruce = lambda x: signo * (_evaluar(x, n, coef, f0)[0] - medio)
+        a, b = t_salto - incertidumbre, t_salto + incertidumbre
+        if incertidumbre > 0 and cruce(a) < 0 <= cruce(b):
+            while b - a > 1e-6 * ciclo:
+                m = 0.5 * (a + b)
+                if cruce(m) < 0:
+                    a = m
+                else:
+                    b = m
+        t_d = 0.5 * (a + b)
+        ancho_ventana = min(ciclos * ciclo, ventana_max)
+        tt = t_d + np.linspace(0, ancho_ventana, int(ciclos * puntos_por_ciclo) + 1)
+        e = desvio(tt)
+
+        # Pico del sobrepico: máximo de la grilla local refinado por sección áurea
+        k = int(np.argmax(e))
+        a, b = tt[max(k - 1, 0)], tt[min(k + 1, len(tt) - 1)]
+        t_pico = _seccion_aurea(lambda x: desvio(x)[0], a, b, 1e-6 * ciclo)
+        sobrepico = max(desvio(t_pico)[0], 0.0) / abs(salto)
+
+        # Ancho del rizado: primer cruce del error por cero después del pico.
+        # Si la suma no vuelve al nivel final dentro de la ventana el ancho no
+        # se puede medir: queda en NaN y se marca como censurado
+        cruces = np.flatnonzero((tt > t_pico) & (e <= 0))
+        censurado = sobrepico > 0 and len(cruces) == 0
+        if sobrepico == 0:
+            ancho = 0.0
+        elif censurado:
+            ancho = np.nan
+        else:
+            a, b = max(t_pico, tt[cruces[0] - 1]), tt[cruces[0]]
+            while b - a > 1e-6 * ciclo:
+                m = 0.5 * (a + b)
+                if desvio(m)[0] > 0:
+                    a = m
+                else:
+                    b = m
+            ancho = 0.5 * (a + b) - t_d
+
+        resultado['t_salto'].append(t_d)
+        resultado['t_pico'].append(t_pico)
+        resultado['sobrepico'].append(sobrepico)
+        resultado['ancho'].append(ancho)
+        resultado['censurado'].append(censurado)
+        resultado['ventana'].append(ancho_ventana)
+
+    for clave in ('t_salto', 't_pico', 'sobrepico', 'ancho', 'censurado', 'ventana'):
+        resultado[clave] = np.asarray(resultado[clave])
+    return resultado
+
+
+# =============================================================================
+# COMPARACIÓN DE MÉTODOS DE SÍNTESIS
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    f0 = 1.0
+    coeffs = [(n, 4/(n*np.pi)) for n in range(1, 2000, 2)]
+    grillas = {
+        'no uniforme en períodos': np.linspace(0, 2, 200_000),
+        'período entero': np.arange(200_000) / 100_000,
+    }
+    for nombre, t in grillas.items():
+        inicio = time.perf_counter()
+        referencia = sintetizar(t, coeffs, f0, metodo='directo')
+        t_directo = time.perf_counter() - inicio
+        print(f"\nGrilla {nombre}: directo {t_directo:.3f} s")
+        metodos = ['recurrencia'] + (['ifft'] if nombre == 'período entero' else [])
+        for metodo in metodos:
+            inicio = time.perf_counter()
+            x = sintetizar(t, coeffs, f0, metodo=metodo)
+            duracion = time.perf_counter() - inicio
+            error = np.max(np.abs(x - referencia))
+            print(f"  {metodo:<12} {duracion:.3f} s  ({t_directo/duracion:.1f}x)  "
+                  f"error máx {error:.2e}")
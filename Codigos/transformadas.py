@@ -0,0 +1,265 @@
+import importlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+from .instrumentacion import instrumentar
+
+
+class _ModuloPerezoso:
+    """Módulo que se importa recién en el primer acceso a uno de sus atributos."""
+
+    def __init__(self, nombre):
+        self._nombre = nombre
+        self._modulo = None
+
+    def __getattr__(self, atributo):
+        if self._modulo is None:
+            self._modulo = importlib.import_module(self._nombre)
+        return getattr(self._modulo, atributo)
+
+
+# scipy.fft se importa en la primera transformada, no al importar el paquete
+sp_fft = _ModuloPerezoso('scipy.fft')
+
+# =============================================================================
+# CONFIGURACIÓN COMPARTIDA
+# =============================================================================
+# Hilos usados por scipy.fft en todas las transformadas de este módulo
+# (None = valor por defecto de scipy, -1 = todos los núcleos)
+_config = {'workers': None, 'max_buffers': 8}
+
+# Buffers de entrada reutilizables, uno por hilo para no compartir memoria
+_local = threading.local()
+
+
+def configurar(workers=None, max_buffers=None):
+    """
+    Ajusta los parámetros globales de la capa de transformadas.
+
+    Parámetros:
+    workers: Hilos para scipy.fft (None = defecto de scipy, -1 = todos)
+    max_buffers: Cantidad máxima de buffers reutilizables por hilo
+    """
+    _config['workers'] = workers
+    if max_buffers is not None:
+        _config['max_buffers'] = max_buffers
+
+
+def longitud_rapida(n, real=True):
+    """Menor longitud >= n que la FFT resuelve eficientemente (next_fast_len)."""
+    return sp_fft.next_fast_len(n, real=real)
+
+
+def _buffer(forma, dtype):
+    """
+    Devuelve un buffer de la forma pedida, reutilizando los anteriores.
+
+    Se guardan los últimos max_buffers buffers de cada hilo (LRU) para que las
+    llamadas repetidas con la misma longitud no vuelvan a reservar memoria.
+    El contenido es el de la llamada anterior: quien lo pide lo sobrescribe.
+    """
+    buffers = getattr(_local, 'buffers', None)
+    if buffers is None:
+        buffers = _local.buffers = OrderedDict()
+    clave = (forma, np.dtype(dtype).str)
+    buf = buffers.pop(clave, None)
+    if buf is None:
+        buf = np.empty(forma, dtype=dtype)
+        while len(buffers) >= _config['max_buffers']:
+            buffers.popitem(last=False)
+    buffers[clave] = buf
+    return buf
+
+
+def _entregar(buf):
+    """
+    Quita un buffer del conjunto reutilizable.
+
+    Las FFT complejas con overwrite_x pueden devolver el propio buffer como
+    resultado (transformada en el lugar); en ese caso pasa a ser del usuario y
+    no debe volver a usarse.
+    """
+    buffers = getattr(_local, 'buffers', {})
+    for clave, otro in list(buffers.items()):
+        if otro is buf:
+            del buffers[clave]
+
+
+def _preparar(x, n, axis, dtype):
+    """
+    Lleva x a la longitud n sobre el eje indicado dentro de un buffer propio.
+
+    Retorna (array, sobrescribible): si x ya tiene la longitud y el tipo
+    correctos se usa tal cual y no se permite sobrescribirlo.
+    """
+    x = np.asarray(x)
+    axis = axis % x.ndim
+    N = x.shape[axis]
+    if n == N and x.dtype == dtype:
+        return x, False
+    forma = x.shape[:axis] + (n,) + x.shape[axis + 1:]
+    buf = _buffer(forma, dtype)
+    m = min(n, N)
+    destino = [slice(None)] * x.ndim
+    origen = [slice(None)] * x.ndim
+    destino[axis] = slice(0, m)
+    origen[axis] = slice(0, m)
+    buf[tuple(destino)] = x[tuple(origen)]
+    # Solo el relleno necesita ceros: el resto se acaba de copiar
+    if m < n:
+        destino[axis] = slice(m, n)
+        buf[tuple(destino)] = 0
+    return buf, True
+
+
+def _longitud(x, n, axis, rellenar, real):
+    n = np.shape(x)[axis] if n is None else n
+    return longitud_rapida(n, real) if rellenar else n
+
+
+# =============================================================================
+# TRANSFORMADAS
+# =============================================================================
+@instrumentar
+def rfft(x, n=None, axis=-1, rellenar=False):
+    """
+    FFT de una señal real (solo frecuencias positivas).
+
+    Parámetros:
+    x: Señal real
+    n: Longitud de la transformada (por defecto la de x)
+    axis: Eje sobre el que se transforma
+    rellenar: Si es True, completa con ceros hasta longitud_rapida(n)
+
+    Retorna:
+    Espectro complejo de longitud n//2 + 1 sobre el eje indicado
+    """
+    n = _longitud(x, n, axis, rellenar, True)
+    datos, propio = _preparar(x, n, axis, np.float64)
+    return sp_fft.rfft(datos, axis=axis, overwrite_x=propio,
+                       workers=_config['workers'])
+
+
+@instrumentar
+def fft(x, n=None, axis=-1, rellenar=False):
+    """
+    FFT compleja con relleno opcional a una longitud rápida.
+
+    Parámetros:
+    x: Señal (real o compleja)
+    n: Longitud de la transformada (por defecto la de x)
+    axis: Eje sobre el que se transforma
+    rellenar: Si es True, completa con ceros hasta longitud_rapida(n)
+
+    Retorna:
+    Espectro complejo de longitud n
+    """
+    n = _longitud(x, n, axis, rellenar, False)
+    datos, propio = _preparar(x, n, axis, np.complex128)
+    X = sp_fft.fft(datos, axis=axis, overwrite_x=propio,
+                   workers=_config['workers'])
+    if propio and np.shares_memory(X, datos):
+        _entregar(datos)
+    return X
+
+
+@instrumentar
+def ifft(X, n=None, axis=-1, sobrescribir=False):
+    """
+    FFT inversa compleja.
+
+    Parámetros:
+    X: Espectro complejo
+    n: Longitud de la transformada (por defecto la de X)
+    axis: Eje sobre el que se transforma
+    sobrescribir: Permite usar X como memoria de trabajo (X es temporal)
+
+    Retorna:
+    Señal compleja de longitud n
+    """
+    n = np.shape(X)[axis] if n is None else n
+    datos, propio = _preparar(X, n, axis, np.complex128)
+    x = sp_fft.ifft(datos, axis=axis, overwrite_x=propio or sobrescribir,
+                    workers=_config['workers'])
+    if propio and np.shares_memory(x, datos):
+        _entregar(datos)
+    return x
+
+
+@instrumentar
+def irfft(X, n, axis=-1):
+    """FFT inversa de un espectro unilateral (resultado real de longitud n)."""
+    return sp_fft.irfft(X, n, axis=axis, workers=_config['workers'])
+
+
+# =============================================================================
+# EJES DE FRECUENCIA Y FILTROS EN CACHÉ
+# =============================================================================
+def _solo_lectura(arr):
+    arr.setflags(write=False)
+    return arr
+
+
+@lru_cache(maxsize=64)
+def frecuencias(N, fs=1.0, real=True):
+    """
+    Eje de frecuencias de una transformada de N puntos, guardado en caché.
+
+    Parámetros:
+    N: Longitud de la transformada
+    fs: Frecuencia de muestreo (Hz)
+    real: True para rfftfreq (N//2 + 1 bins), False para fftfreq
+
+    Retorna:
+    Array de solo lectura con las frecuencias (Hz)
+    """
+    f = sp_fft.rfftfreq(N, 1/fs) if real else sp_fft.fftfreq(N, 1/fs)
+    return _solo_lectura(f)
+
+
+@lru_cache(maxsize=64)
+def filtro_hilbert(N):
+    """
+    Respuesta en frecuencia -j·sign(f) del transformador de Hilbert de N puntos.
+
+    Retorna:
+    Array complejo de solo lectura de longitud N
+    """
+    return _solo_lectura(-1j * np.sign(sp_fft.fftfreq(N)))
+
+
+@lru_cache(maxsize=64)
+def mascara_analitica(N):
+    """
+    Máscara unilateral de la señal analítica para los N//2 + 1 bins de una rfft.
+
+    Vale 1 en la continua, 2 en las frecuencias positivas y 1 en el bin de
+    Nyquist cuando N es par (igual que scipy.signal.hilbert); las frecuencias
+    negativas quedan en cero al completar la IFFT con ceros.
+
+    Retorna:
+    Array real de solo lectura de longitud N//2 + 1
+    """
+    h = np.full(N // 2 + 1, 2.0)
+    h[0] = 1.0
+    if N % 2 == 0:
+        h[-1] = 1.0
+    return _solo_lectura(h)
+
+
+# =============================================================================
+# BENCHMARK: LONGITUDES PRIMAS
+# =============================================================================
+if __name__ == "__main__":
+    import timeit
+
+    print("Longitud  directa (ms)  relleno (ms)  aceleración")
+    for N in [10007, 100003, 1000003, 4000037]:
+        x = np.random.randn(N)
+        repeticiones = max(3, 2_000_000 // N)
+        t_directa = timeit.timeit(lambda: sp_fft.fft(x), number=repeticiones) / repeticiones
+        t_relleno = timeit.timeit(lambda: fft(x, rellenar=True), number=repeticiones) / repeticiones
+        print(f"{N:>8}  {1e3*t_directa:>12.3f}  {1e3*t_relleno:>12.3f}  {t_directa/t_relleno:>10.1f}x")
@@ -0,0 +1,521 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .transformadas import rfft, frecuencias
+from .espectro import medir_tonos
+from .analitica import HilbertStreaming
+from .entropia import EntropiaDeslizante, entropia_conteos
+from .instrumentacion import tramo
+
+# =============================================================================
+# BLOQUES Y BUFFERS
+# =============================================================================
+# La fuente llena buffers preasignados y cada bloque viaja por las colas como
+# referencia: ninguna etapa copia las muestras. El buffer vuelve al pool
+# cuando el bloque sale de la última etapa, así que las etapas no deben
+# escribir en bloque.datos ni guardar referencias a él
+_FIN = object()
+
+
+class Bloque:
+    """Un bloque de muestras en tránsito y los resultados de cada etapa."""
+
+    __slots__ = ('indice', 'inicio', 'datos', 'buffer', 'creado', 'encolado', 'resultados')
+
+    def __init__(self, indice, inicio, buffer, n):
+        self.indice = indice
+        self.inicio = inicio        # Índice de la primera muestra en el flujo
+        self.buffer = buffer        # None en el bloque final de una etapa con estado
+        self.datos = buffer[:n] if buffer is not None else np.empty(0)  # Vista, sin copia
+        self.creado = time.perf_counter()
+        self.encolado = self.creado
+        self.resultados = {}
+
+
+class PoolBuffers:
+    """
+    Buffers de bloque preasignados y reutilizables.
+
+    La cantidad de buffers acota los bloques en tránsito: si las etapas no
+    dan abasto, la fuente espera un buffer libre en lugar de reservar más
+    memoria.
+    """
+
+    def __init__(self, cantidad, tam_bloque, dtype=np.float64):
+        self._libres = queue.Queue()
+        for _ in range(cantidad):
+            self._libres.put(np.empty(tam_bloque, dtype=dtype))
+
+    def tomar(self, cancelado):
+        """Espera un buffer libre; devuelve None si la tubería se canceló."""
+        while not cancelado.is_set():
+            try:
+                return self._libres.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        return None
+
+    def devolver(self, buffer):
+        if buffer is not None:
+            self._libres.put(buffer)
+
+
+# =============================================================================
+# FUENTES
+# =============================================================================
+# Una fuente tiene la frecuencia de muestreo fs y un método llenar(buffer)
+# que escribe las muestras siguientes en el buffer y devuelve cuántas
+# escribió (0 al terminar)
+class FuenteSintetica:
+    """
+    Suma de tonos más ruido gaussiano, generada bloque a bloque en el buffer.
+
+    Reemplaza al dispositivo de adquisición: por defecto son los tonos del
+    ejercicio 1 con amplitud modulada por un tono lento, para que la
+    envolvente y su entropía varíen en el tiempo.
+    """
+
+    def __init__(self, fs=1000.0, tonos=((50, 1.0, np.pi/2), (120, 0.5, np.pi/2), (200, 0.3, np.pi/2)),
+                 modulacion=0.5, f_modulacion=0.5, ruido=0.01, duracion=None, semilla=0):
+        self.fs = fs
+        self.tonos = tuple(tonos)
+        self.modulacion = modulacion
+        self.f_modulacion = f_modulacion
+        self.ruido = ruido
+        self.total = None if duracion is None else int(round(duracion * fs))
+        self._rng = np.random.default_rng(semilla)
+        self._n = 0
+
+    def llenar(self, buffer):
+        n = len(buffer) if self.total is None else min(len(buffer), self.total - self._n)
+        if n <= 0:
+            return 0
+        x = buffer[:n]
+        t = (self._n + np.arange(n)) / self.fs
+        x[:] = 0
+        fase = np.empty(n)
+        for f, A, phi in self.tonos:
+            np.multiply(2*np.pi*f, t, out=fase)
+            fase += phi
+            np.sin(fase, out=fase)
+            x += A * fase
+        x *= 1 + self.modulacion * np.sin(2*np.pi*self.f_modulacion*t)
+        x += self.ruido * self._rng.standard_normal(n)
+        self._n += n
+        return n
+
+
+class FuenteArchivo:
+    """
+    Muestras leídas de un archivo .npy o binario crudo con readinto.
+
+    El archivo se lee directamente en el buffer del bloque (sin copias
+    intermedias), así que sirve para reproducir una captura real. Los
+    buffers de la tubería se reservan con el dtype del archivo (atributo
+    dtype).
+    """
+
+    def __init__(self, ruta, fs, dtype=np.float64):
+        self.fs = fs
+        self._archivo = open(ruta, 'rb')
+        if str(ruta).endswith('.npy'):
+            version = np.lib.format.read_magic(self._archivo)
+            leer = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                    else np.lib.format.read_array_header_2_0)
+            forma, orden_fortran, dtype = leer(self._archivo)
+            if len(forma) != 1 or orden_fortran or dtype.hasobject:
+                self._archivo.close()
+                raise ValueError(f"{ruta}: se espera un array 1-D numérico en orden C, "
+                                 f"no forma {forma} (fortran_order={orden_fortran}, dtype {dtype})")
+        self.dtype = np.dtype(dtype)
+
+    def llenar(self, buffer):
+        if buffer.dtype != self.dtype:
+            raise TypeError(f"el buffer es {buffer.dtype} y el archivo {self.dtype}")
+        if self._archivo.closed:
+            return 0
+        # readinto puede leer menos de lo pedido sin haber llegado al final
+        # del archivo: se sigue leyendo hasta llenar el buffer o hasta EOF
+        destino = memoryview(buffer).cast('B')
+        leidos = 0
+        while leidos < len(destino):
+            n = self._archivo.readinto(destino[leidos:])
+            if not n:
+                self._archivo.close()
+                break
+            leidos += n
+        if leidos % self.dtype.itemsize:
+            raise ValueError(f"el archivo termina con una muestra incompleta "
+                             f"({leidos % self.dtype.itemsize} de {self.dtype.itemsize} bytes)")
+        return leidos // self.dtype.itemsize
+
+
+# =============================================================================
+# ETAPAS
+# =============================================================================
+class Etapa:
+    """
+    Una etapa de la tubería: una función que recibe el bloque y agrega sus
+    resultados en bloque.resultados.
+
+    Parámetros:
+    nombre: Nombre para las métricas
+    funcion: Callable funcion(bloque)
+    hilos: Hilos que atienden la etapa. Con más de uno los bloques pueden
+           salir desordenados
+    ordenada: Si es True, la etapa recibe los bloques en orden aunque la
+              anterior los desordene (necesario si guarda estado entre
+              bloques; exige hilos=1)
+    finalizar: Callable opcional finalizar(bloque) para etapas con estado.
+               Al terminar la fuente se llama con un bloque final sin
+               muestras (datos vacío) para que vacíe lo pendiente en sus
+               resultados; el bloque sigue por las etapas siguientes.
+               Exige ordenada=True
+    """
+
+    def __init__(self, nombre, funcion, hilos=1, ordenada=False, finalizar=None):
+        if ordenada and hilos != 1:
+            raise ValueError("una etapa ordenada solo puede tener un hilo")
+        if finalizar is not None and not ordenada:
+            raise ValueError("una etapa con finalizar debe ser ordenada")
+        self.nombre = nombre
+        self.funcion = funcion
+        self.hilos = hilos
+        self.ordenada = ordenada
+        self.finalizar = finalizar
+
+
+def etapa_espectro(fs, tonos=(50, 120, 200), hilos=1):
+    """
+    Ejercicio 1: frecuencia dominante del bloque y amplitud de cada tono.
+
+    No guarda estado, así que admite varios hilos.
+    """
+    tonos = np.asarray(tonos, dtype=float)
+
+    def espectro(bloque):
+        x = bloque.datos
+        magnitud = np.abs(rfft(x))
+        magnitud[0] = 0
+        amplitudes, _ = medir_tonos(x, tonos, fs)
+        bloque.resultados['frecuencia_pico'] = frecuencias(len(x), fs)[np.argmax(magnitud)]
+        bloque.resultados['amplitudes'] = amplitudes
+
+    return Etapa('espectro', espectro, hilos)
+
+
+def etapa_envolvente(num_taps=255, tam_bloque=4096):
+    """
+    Ejercicio 3: envolvente |x + j·H{x}| con el filtro de Hilbert por bloques.
+
+    HilbertStreaming guarda las últimas muestras entre bloques, así que la
+    envolvente es continua (sin efectos de borde) y la etapa es ordenada.
+    La salida va retrasada (num_taps - 1)/2 muestras; al terminar la fuente
+    el bloque final lleva las muestras que quedaban en el filtro.
+    """
+    hilbert = HilbertStreaming(num_taps, tam_bloque)
+
+    def envolvente(bloque):
+        bloque.resultados['envolvente'] = np.abs(hilbert.procesar(bloque.datos))
+
+    def finalizar(bloque):
+        bloque.resultados['envolvente'] = np.abs(hilbert.finalizar())
+
+    return Etapa('envolvente', envolvente, ordenada=True, finalizar=finalizar)
+
+
+def etapa_entropia(escala, niveles=16, ventana=1000):
+    """
+    Ejercicio 4: entropía de la envolvente cuantizada en niveles símbolos.
+
+    Registra la entropía de los símbolos del bloque y la de la ventana
+    deslizante de las últimas ventana muestras (EntropiaDeslizante). El
+    filtro de Hilbert entrega la salida en pasos internos, así que hay
+    bloques sin envolvente nueva (siempre el primero): esos bloques no llevan
+    'entropia' en lugar de informar 0 bits.
+
+    Parámetros:
+    escala: Valor de la envolvente que corresponde al nivel más alto
+    niveles: Cantidad de símbolos
+    ventana: Muestras de la ventana deslizante
+    """
+    deslizante = EntropiaDeslizante(ventana, niveles)
+
+    def entropia(bloque):
+        envolvente = bloque.resultados.pop('envolvente')
+        if len(envolvente) == 0:
+            return
+        simbolos = np.minimum((envolvente * (niveles / escala)).astype(np.int64), niveles - 1)
+        bloque.resultados['entropia'] = entropia_conteos(np.bincount(simbolos, minlength=niveles))
+        H = deslizante.procesar(simbolos)
+        if len(H):
+            bloque.resultados['entropia_ventana'] = H[-1]
+
+    return Etapa('entropia', entropia, ordenada=True)
+
+
+# =============================================================================
+# TUBERÍA
+# =============================================================================
+class Tuberia:
+    """
+    Fuente → etapas → sumidero, con colas acotadas entre cada par.
+
+    Cada etapa corre en sus propios hilos de un ThreadPoolExecutor. Las FFT
+    de scipy y las operaciones grandes de NumPy liberan el GIL, así que las
+    etapas avanzan en paralelo sobre bloques distintos. Una cola llena
+    bloquea a la etapa anterior (contrapresión) y el pool de buffers frena a
+    la fuente, de modo que la memoria queda acotada aunque la fuente sea más
+    rápida que el procesamiento.
+
+    Parámetros:
+    fuente: Objeto con fs y llenar(buffer) (FuenteSintetica, FuenteArchivo)
+    etapas: Lista de Etapa
+    tam_bloque: Muestras por bloque
+    capacidad: Bloques que entran en cada cola
+    buffers: Buffers del pool (por defecto los que llenan todas las colas
+             más uno por hilo)
+    """
+
+    def __init__(self, fuente, etapas, tam_bloque=4096, capacidad=4, buffers=None):
+        self.fuente = fuente
+        self.etapas = list(etapas)
+        self.tam_bloque = tam_bloque
+        self.capacidad = capacidad
+        hilos = sum(e.hilos for e in self.etapas)
+        self.buffers = buffers or capacidad * (len(self.etapas) + 1) + hilos + 1
+
+    def _producir(self, salida, pool, cancelado, max_bloques, siguientes):
+        indice = inicio = 0
+        try:
+            while max_bloques is None or indice < max_bloques:
+                buffer = pool.tomar(cancelado)
+                if buffer is None:
+                    break
+                n = self.fuente.llenar(buffer)
+                if n == 0:
+                    pool.devolver(buffer)
+                    break
+                bloque = Bloque(indice, inicio, buffer, n)
+                salida.put(bloque)
+                indice += 1
+                inicio += n
+        finally:
+            for _ in range(siguientes):
+                salida.put(_FIN)
+
+    def _atender(self, etapa, entrada, salida, pool, estado, i, siguientes):
+        pendientes, esperado, siguiente_muestra = {}, 0, 0
+        tiempos = estado['tiempos'][i]
+        final = False
+        while not final:
+            bloque = entrada.get()
+            if bloque is _FIN:
+                # Una etapa con estado emite un bloque final con lo que le quedaba
+                if etapa.finalizar is None or estado['error'] is not None:
+                    break
+                final = True
+                listos = [Bloque(esperado, siguiente_muestra, None, 0)]
+            elif etapa.ordenada:
+                pendientes[bloque.indice] = bloque
+                listos = []
+                while esperado in pendientes:
+                    listos.append(pendientes.pop(esperado))
+                    esperado += 1
+            else:
+                listos = [bloque]
+            for bloque in listos:
+                siguiente_muestra = bloque.inicio + len(bloque.datos)
+                espera = time.perf_counter() - bloque.encolado
+                if estado['error'] is not None:
+                    # Tras un error se sigue vaciando la cola para no trabar a las anteriores
+                    pool.devolver(bloque.buffer)
+                    continue
+                inicio = time.perf_counter()
+                funcion = etapa.finalizar if final else etapa.funcion
+                try:
+                    with tramo(f'tuberia.{etapa.nombre}', n=len(bloque.datos)):
+                        funcion(bloque)
+                except BaseException as error:
+                    with estado['cerrojo']:
+                        if estado['error'] is None:
+                            estado['error'] = error
+                    estado['cancelado'].set()
+                    pool.devolver(bloque.buffer)
+                    continue
+                tiempos.append((espera, time.perf_counter() - inicio))
+                bloque.encolado = time.perf_counter()
+                salida.put(bloque)
+        # El último hilo de la etapa avisa a la siguiente
+        with estado['cerrojo']:
+            estado['activos'][i] -= 1
+            ultimo = estado['activos'][i] == 0
+        if ultimo:
+            for _ in range(siguientes):
+                salida.put(_FIN)
+
+    def correr(self, max_bloques=None, consumidor=None):
+        """
+        Corre la tubería hasta agotar la fuente (o procesar max_bloques).
+
+        Parámetros:
+        max_bloques: Tope de bloques a leer de la fuente
+        consumidor: Función opcional que recibe cada bloque terminado (en el
+                    orden en que terminan), antes de devolver su buffer
+
+        Retorna:
+        Diccionario con 'resultados' (por bloque, en orden, solo los valores
+        de hasta 16 elementos) y 'metricas' (ver imprimir_metricas)
+        """
+        colas = [queue.Queue(self.capacidad) for _ in range(len(self.etapas) + 1)]
+        pool = PoolBuffers(self.buffers, self.tam_bloque, getattr(self.fuente, 'dtype', np.float64))
+        estado = {'error': None, 'cancelado': threading.Event(), 'cerrojo': threading.Lock(),
+                  'activos': [e.hilos for e in self.etapas],
+                  'tiempos': [[] for _ in self.etapas]}
+        siguientes = [e.hilos for e in self.etapas[1:]] + [1]
+
+        resultados, latencias, muestras = [], [], 0
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(1 + sum(e.hilos for e in self.etapas),
+                                thread_name_prefix='tuberia') as ejecutor:
+            futuros = [ejecutor.submit(self._producir, colas[0], pool, estado['cancelado'],
+                                       max_bloques, self.etapas[0].hilos)]
+            for i, etapa in enumerate(self.etapas):
+                futuros += [ejecutor.submit(self._atender, etapa, colas[i], colas[i + 1], pool,
+                                            estado, i, siguientes[i])
+                            for _ in range(etapa.hilos)]
+            # Sumidero en el hilo que llama. Si el consumidor falla se cancela la
+            # fuente pero se sigue vaciando la última cola hasta el fin, para que
+            # ningún hilo quede trabado en un put y el ejecutor pueda cerrarse
+            while True:
+                bloque = colas[-1].get()
+                if bloque is _FIN:
+                    break
+                if estado['error'] is None:
+                    try:
+                        if consumidor is not None:
+                            consumidor(bloque)
+                    except BaseException as error:
+                        with estado['cerrojo']:
+                            if estado['error'] is None:
+                                estado['error'] = error
+                        estado['cancelado'].set()
+                    else:
+                        latencias.append(time.perf_counter() - bloque.creado)
+                        muestras += len(bloque.datos)
+                        resultados.append((bloque.indice, {k: v for k, v in bloque.resultados.items()
+                                                           if np.size(v) <= 16}))
+                pool.devolver(bloque.buffer)
+            for futuro in futuros:
+                futuro.result()
+        segundos = time.perf_counter() - inicio
+        if estado['error'] is not None:
+            raise estado['error']
+
+        resultados.sort(key=lambda r: r[0])
+        metricas = {'bloques': len(resultados), 'muestras': muestras, 'segundos': segundos,
+                    'muestras_por_segundo': muestras / segundos if segundos else 0.0,
+                    'latencia': _percentiles(latencias), 'etapas': {}}
+        for etapa, tiempos in zip(self.etapas, estado['tiempos']):
+            esperas, procesos = (np.array(c) for c in zip(*tiempos)) if tiempos else ([], [])
+            metricas['etapas'][etapa.nombre] = {
+                'hilos': etapa.hilos, 'proceso': _percentiles(procesos),
+                'espera': _percentiles(esperas),
+                'ocupacion': float(np.sum(procesos)) / (segundos * etapa.hilos) if segundos else 0.0}
+        return {'resultados': [r for _, r in resultados], 'metricas': metricas}
+
+
+def _percentiles(valores):
+    """Media, p50, p95 y máximo en milisegundos."""
+    if len(valores) == 0:
+        return {'media': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    v = 1e3 * np.asarray(valores)
+    return {'media': float(v.mean()), 'p50': float(np.percentile(v, 50)),
+            'p95': float(np.percentile(v, 95)), 'max': float(v.max())}
+
+
+def imprimir_metricas(metricas):
+    """Imprime el rendimiento total y la latencia de cada etapa."""
+    print(f"{metricas['bloques']} bloques, {metricas['muestras']} muestras en "
+          f"{metricas['segundos']:.2f} s: {metricas['muestras_por_segundo']/1e6:.2f} M muestras/s")
+    lat = metricas['latencia']
+    print(f"Latencia de punta a punta: media {lat['media']:.2f} ms, p95 {lat['p95']:.2f} ms, "
+          f"máx {lat['max']:.2f} ms")
+    print(f"{'etapa':<12} {'hilos':>5} {'proceso ms':>11} {'p95 ms':>8} {'espera ms':>10} "
+          f"{'ocupación':>10}")
+    for nombre, e in metricas['etapas'].items():
+        print(f"{nombre:<12} {e['hilos']:>5} {e['proceso']['media']:11.3f} {e['proceso']['p95']:8.3f} "
+              f"{e['espera']['media']:10.3f} {100*e['ocupacion']:9.1f}%")
+
+
+def tuberia_ejercicios(fuente, tam_bloque=4096, capacidad=4, hilos_espectro=1, niveles=16,
+                       escala=None):
+    """
+    Tubería de los ejercicios: espectro (1) → envolvente (3) → entropía (4).
+
+    Parámetros:
+    fuente: Fuente de muestras
+    tam_bloque: Muestras por bloque
+    capacidad: Bloques por cola
+    hilos_espectro: Hilos de la etapa de espectro (la única sin estado)
+    niveles: Símbolos de la cuantización de la envolvente
+    escala: Envolvente máxima esperada (por defecto la suma de las amplitudes
+            de la fuente sintética con su modulación, o 2)
+    """
+    if escala is None:
+        if isinstance(fuente, FuenteSintetica):
+            escala = sum(A for _, A, _ in fuente.tonos) * (1 + fuente.modulacion)
+        else:
+            escala = 2.0
+    etapas = [etapa_espectro(fuente.fs, hilos=hilos_espectro),
+              etapa_envolvente(tam_bloque=tam_bloque),
+              etapa_entropia(escala, niveles, ventana=int(fuente.fs))]
+    return Tuberia(fuente, etapas, tam_bloque, capacidad)
+
+
+# =============================================================================
+# LÍNEA DE COMANDOS
+# =============================================================================
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Tubería espectro → envolvente → entropía sobre un flujo de muestras")
+    parser.add_argument('--archivo', default=None,
+                        help="Archivo .npy o binario float64 (por defecto, fuente sintética)")
+    parser.add_argument('--fs', type=float, default=1000.0)
+    parser.add_argument('--duracion', type=float, default=600.0,
+                        help="Segundos de señal sintética")
+    parser.add_argument('--tam-bloque', type=int, default=4096)
+    parser.add_argument('--capacidad', type=int, default=4, help="Bloques por cola")
+    parser.add_argument('--hilos-espectro', type=int, default=os.cpu_count() or 1)
+    opciones = parser.parse_args(argv)
+
+    if opciones.archivo:
+        fuente = FuenteArchivo(opciones.archivo, opciones.fs)
+    else:
+        fuente = FuenteSintetica(opciones.fs, duracion=opciones.duracion)
+    tuberia = tuberia_ejercicios(fuente, opciones.tam_bloque, opciones.capacidad,
+                                 opciones.hilos_espectro)
+    salida = tuberia.correr()
+    resultados = salida['resultados']
+    # El bloque final de la envolvente no trae muestras ni espectro
+    espectros = [r for r in resultados if 'frecuencia_pico' in r]
+    if espectros:
+        H = [r['entropia_ventana'] for r in resultados if 'entropia_ventana' in r]
+        print(f"Frecuencia dominante: {espectros[-1]['frecuencia_pico']:.1f} Hz, "
+              f"amplitudes medidas: {np.round(espectros[-1]['amplitudes'], 3)}")
+        if H:
+            print(f"Entropía de la envolvente (ventana de 1 s): "
+                  f"mín {min(H):.3f}, máx {max(H):.3f} bits/muestra")
+    imprimir_metricas(salida['metricas'])
+    return salida
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import numpy as np
+from scipy.signal import hilbert
+
+from Codigos.analitica import HilbertStreaming, nucleo_hilbert, señal_analitica_rfft
+
+
+def test_señal_analitica_igual_a_scipy():
+    rng = np.random.default_rng(0)
+    for N in (1000, 1001):
+        x = rng.standard_normal(N)
+        assert np.allclose(señal_analitica_rfft(x), hilbert(x), atol=1e-12)
+    lote = rng.standard_normal((256, 3))
+    assert np.allclose(señal_analitica_rfft(lote, axis=0), hilbert(lote, axis=0), atol=1e-12)
+
+
+def test_hilbert_streaming_igual_a_la_convolucion_retrasada():
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal(20_000)
+    filtro = HilbertStreaming(num_taps=255, tam_bloque=1000)
+    D = filtro.retardo
+    partes, inicio = [], 0
+    while inicio < len(x):
+        tam = int(rng.integers(1, 3000))
+        partes.append(filtro.procesar(x[inicio:inicio + tam]))
+        inicio += tam
+    partes.append(filtro.finalizar())
+    z = np.concatenate(partes)
+
+    # La salida k corresponde a la entrada k - D; finalizar entrega también las últimas D
+    assert len(z) == len(x) + D
+    assert np.allclose(z.imag, np.convolve(x, nucleo_hilbert(255))[:len(x) + D], atol=1e-12)
+    assert np.array_equal(z.real, np.concatenate((np.zeros(D), x)))
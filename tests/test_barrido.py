@@ -0,0 +1,22 @@
+import numpy as np
+
+from Codigos.barrido import barrido, metricas_fourier
+
+
+def test_sobrepico_no_depende_de_la_grilla():
+    # Con 50 armónicos el sobrepico de Gibbs es ~8.95 % del salto aunque fs
+    # sea demasiado baja para muestrear el rizado
+    sobrepicos = [metricas_fourier(np.arange(0, 2, 1 / fs), fs, 1.0)['sobrepico']
+                  for fs in (50, 5000)]
+    assert np.allclose(sobrepicos, 0.0895, atol=5e-4)
+
+
+def test_grilla_vacia_da_tabla_vacia():
+    tabla = barrido('fourier', {'armonicos': []}, procesos=1)
+    assert len(tabla) == 0 and tabla.dtype.names == ('armonicos',)
+
+
+def test_barrido_con_varios_procesos():
+    tabla = barrido('fourier', {'armonicos': [1, 5, 21], 'fs': [500, 1000]}, procesos=2, lote=2)
+    assert len(tabla) == 6
+    assert np.allclose(tabla['sobrepico'][tabla['armonicos'] == 1], (4 / np.pi - 1) / 2)
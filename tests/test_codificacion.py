@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from Codigos.codificacion import (codigo_huffman, cuantizar_frecuencias, evaluar_codigos,
+                                  rans_codificar, rans_decodificar)
+
+
+def test_codigo_sesgado_respeta_el_largo_maximo():
+    # Conteos 2^0..2^29 más uno: Huffman sin límite da palabras de 30 bits
+    conteos = np.array([2**k for k in range(30)] + [1])
+    largos, _ = codigo_huffman(conteos)
+    assert largos.max() <= 20
+    assert np.sum(2.0 ** -largos) <= 1
+
+    rng = np.random.default_rng(0)
+    fuente = rng.choice(len(conteos), 100_000, p=conteos / conteos.sum()).astype(np.uint8)
+    r = evaluar_codigos(fuente, modo='bytes')
+    assert r['entropia'] <= r['huffman'] < r['entropia'] + 1
+
+
+def test_fuente_vacia():
+    r = evaluar_codigos(b'', modo='bytes')
+    assert r['n'] == 0 and r['huffman'] == 0.0
+
+
+@pytest.mark.parametrize('n', [1, 7, 100, 4096, 4097, 10_000])
+def test_rans_ida_y_vuelta_con_carriles_incompletos(n):
+    rng = np.random.default_rng(n)
+    simbolos = rng.integers(0, 5, n)
+    f = cuantizar_frecuencias(np.bincount(simbolos, minlength=5))
+    palabras, largos = rans_codificar(simbolos, f, simbolos_por_carril=4096)
+    assert np.array_equal(rans_decodificar(palabras, largos, n, f, simbolos_por_carril=4096), simbolos)
+
+
+def test_cuantizar_frecuencias_con_mas_simbolos_que_la_escala():
+    with pytest.raises(ValueError):
+        cuantizar_frecuencias(np.ones(300), bits_escala=8)
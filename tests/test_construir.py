@@ -0,0 +1,27 @@
+import numpy as np
+
+from Codigos.construir import _guardar_resultados, _reconstruir
+
+
+def _iguales(a, b):
+    if isinstance(a, dict):
+        return isinstance(b, dict) and set(a) == set(b) and all(_iguales(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(map(_iguales, a, b))
+    return np.array_equal(np.asarray(a), np.asarray(b), equal_nan=True)
+
+
+def test_resultados_anidados_vuelven_de_la_cache(tmp_path):
+    # Como ejercicio_3: una lista de diccionarios de arrays, y claves enteras
+    resultados = {
+        't': np.linspace(0, 1, 5),
+        'resultados': [{'envolvente': np.ones(3), 'hilbert': np.arange(3.0)},
+                       {'envolvente': np.zeros(2), 'hilbert': np.array([np.nan, 1.0])}],
+        'coeficientes': {1: 1.27 + 0j, 3: 0.42 + 0j},
+        'pares': [(1, 0.5), (3, 0.25)],
+        'error_rms': 1e-15,
+    }
+    ruta = tmp_path / 'resultados.npz'
+    _guardar_resultados(resultados, ruta)
+    with np.load(ruta) as datos:
+        assert _iguales(resultados, _reconstruir(dict(datos)))
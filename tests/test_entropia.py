@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from Codigos.entropia import (EntropiaDeslizante, autoinformacion_complemento, contar_simbolos,
+                              entropia_conteos)
+
+
+def test_autoinformacion_complemento_precisa_con_p_chica():
+    p = 150 / 31536000
+    # Serie de -ln(1-p) = p + p²/2 + p³/3 + ..., exacta a precisión doble para p ≈ 5e-6
+    esperado = (p + p**2 / 2 + p**3 / 3) / np.log(2)
+    assert abs(autoinformacion_complemento(p) - esperado) <= 1e-15 * esperado
+    assert np.isinf(autoinformacion_complemento(1.0))
+
+
+def test_entropia_conteos_coincide_con_scipy():
+    from scipy.stats import entropy
+
+    conteos = np.array([0, 5, 1, 0, 12, 3])
+    assert entropia_conteos(conteos) == entropy(conteos[conteos > 0], base=2)
+    assert entropia_conteos([0, 0]) == 0.0
+
+
+def test_str_es_texto_y_las_rutas_son_pathlike(tmp_path):
+    ruta = tmp_path / 'fuente.txt'
+    ruta.write_bytes(b'abracadabra')
+    assert np.array_equal(contar_simbolos(ruta), contar_simbolos('abracadabra'))
+    # Un str es texto aunque nombre un archivo existente
+    assert np.array_equal(contar_simbolos(str(ruta)), contar_simbolos(str(ruta).encode()))
+    with pytest.raises(TypeError):
+        contar_simbolos(12)
+
+
+def test_entropia_deslizante_por_bloques_igual_a_recontar():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 7, 3000)
+    W = 250
+    esperado = [entropia_conteos(np.bincount(x[i - W + 1:i + 1])) for i in range(W - 1, len(x))]
+    estimador = EntropiaDeslizante(W, 7)
+    obtenido = [estimador.agregar(s) for s in x[:100]]
+    # Bloques más chicos y más grandes que la ventana, mezclados con símbolos sueltos
+    for desde, hasta in [(100, 117), (117, 700), (700, 701), (701, 2000)]:
+        obtenido.extend(estimador.procesar(x[desde:hasta]))
+    obtenido.extend(estimador.agregar(s) for s in x[2000:2100])
+    obtenido.extend(estimador.procesar(x[2100:]))
+    assert np.allclose([h for h in obtenido if h is not None], esperado, atol=1e-12)
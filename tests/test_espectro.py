@@ -0,0 +1,69 @@
+import numpy as np
+from scipy import signal
+
+from Codigos.espectro import (espectro_multicanal, espectro_suma, medir_tonos, stft_streaming,
+                              welch_streaming)
+
+
+def test_welch_streaming_igual_a_scipy():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(50_000)
+    # Bloques que no son múltiplo del salto para que las tramas crucen bloques
+    estimador = welch_streaming(x, 1000.0, nperseg=512, tam_bloque=7_001)
+    freq, psd = signal.welch(x, 1000.0, window='hann', nperseg=512, detrend=False)
+    assert np.allclose(estimador.freq, freq)
+    assert np.allclose(estimador.psd, psd)
+
+
+def test_stft_streaming_igual_a_scipy():
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal(20_000)
+    lotes = list(stft_streaming(x, 1000.0, nperseg=256, noverlap=192,
+                                tam_bloque=3_000, tramas_por_lote=50))
+    tiempos = np.concatenate([t for t, _ in lotes])
+    magnitudes = np.concatenate([m for _, m in lotes])
+    _, t, Z = signal.stft(x, 1000.0, window='hann', nperseg=256, noverlap=192,
+                          boundary=None, padded=False)
+    assert np.allclose(tiempos, t)
+    # scipy escala por sum(ventana); la magnitud de ejercicio_1.py es el doble
+    assert np.allclose(magnitudes, 2 * np.abs(Z).T)
+
+
+def test_espectro_multicanal_igual_a_numpy():
+    rng = np.random.default_rng(2)
+    señales = rng.standard_normal((3, 1000))
+    freq, magnitud, fase = espectro_multicanal(señales, 500.0)
+    for canal, x in enumerate(señales):
+        X = np.fft.rfft(x)
+        assert np.allclose(magnitud[canal], 2 * np.abs(X) / len(x))
+        assert np.allclose(fase[canal], np.angle(X))
+    assert np.allclose(freq, np.fft.rfftfreq(1000, 1 / 500.0))
+    # Un array 1-D es un canal
+    _, magnitud_1d, _ = espectro_multicanal(señales[0], 500.0)
+    assert np.allclose(magnitud_1d, magnitud[:1])
+    # Por linealidad, sumar en el tiempo equivale a sumar las transformadas
+    _, suma = espectro_suma(señales, 500.0)
+    assert np.allclose(suma, 2 * np.abs(np.fft.rfft(señales, axis=-1).sum(axis=0)) / 1000)
+
+
+def test_medir_tonos_recupera_amplitud_y_fase():
+    fs, N = 1000.0, 10_000
+    t = np.arange(N) / fs
+    freqs, amps, fases = [50.0, 120.0, 333.0], [1.0, 0.5, 2.0], [0.3, -1.2, 2.5]
+    x = sum(A * np.sin(2 * np.pi * f * t + p) for f, A, p in zip(freqs, amps, fases))
+    # tam_bloque no divide a N: el último bloque es parcial
+    amplitud, fase = medir_tonos(x, freqs, fs, tam_bloque=3_000)
+    assert np.allclose(amplitud, amps)
+    assert np.allclose(fase, fases)
+
+
+def test_medir_tonos_igual_a_la_dtft_fuera_de_bin():
+    rng = np.random.default_rng(3)
+    fs = 1000.0
+    x = rng.standard_normal((2, 5_000))
+    freqs = np.array([12.34, 100.0, 456.7])
+    amplitud, fase = medir_tonos(x, freqs, fs, tam_bloque=1_024)
+    n = np.arange(x.shape[-1])
+    X = x @ np.exp(-2j * np.pi * np.outer(n, freqs) / fs)
+    assert np.allclose(amplitud, 2 * np.abs(X) / x.shape[-1])
+    assert np.allclose(np.exp(1j * fase), np.exp(1j * np.angle(X * 1j)))
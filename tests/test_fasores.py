@@ -0,0 +1,30 @@
+import numpy as np
+
+from Codigos.fasores import Fasores
+
+
+def test_algebra_de_fasores_igual_a_numpy():
+    amp = np.array([1.0, 2.0, 0.5])
+    fase = np.array([0.0, np.pi / 3, -2.0])
+    z = amp * np.exp(1j * fase)
+    w = np.array([1 - 1j, 0.5j, 3.0])
+    f = Fasores.desde_polar(amp, fase)
+    g = Fasores(w)
+    assert np.allclose((f + g).z, z + w)
+    assert np.allclose((f - g).z, z - w)
+    assert np.allclose((f * g).z, z * w)
+    assert np.allclose((f / g).z, z / w)
+    assert np.allclose((2 * f + 1).z, 2 * z + 1)
+    assert np.allclose(f.rotar(np.pi / 2).z, 1j * z)
+    assert np.allclose(f.resultante().z, [z.sum()])
+    assert np.allclose(f.polar(), (np.abs(z), np.angle(z)))
+    assert np.allclose(f.cartesiano(), (z.real, z.imag))
+
+
+def test_senal_es_el_coseno_del_fasor():
+    amp, fase, frec = np.array([1.5, 0.7]), np.array([0.4, -1.1]), np.array([2.0, 5.0])
+    f = Fasores.desde_polar(amp, fase, frecuencias=frec)
+    t = np.linspace(0, 1, 101)
+    esperada = amp[:, None] * np.cos(2 * np.pi * np.outer(frec, t) + fase[:, None])
+    assert np.allclose(f.senal(t), esperada)
+    assert np.allclose(f.en_instante(0.25), amp * np.exp(1j * (2 * np.pi * frec * 0.25 + fase)))
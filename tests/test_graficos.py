@@ -0,0 +1,44 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from Codigos.graficos import diezmar_minmax, stem_rapido
+
+
+def test_diezmar_minmax_conserva_extremos_por_pixel():
+    rng = np.random.default_rng(0)
+    N, pixeles = 10_007, 300
+    x = np.arange(N) * 0.5
+    y = rng.standard_normal(N)
+    xd, yd = diezmar_minmax(x, y, pixeles)
+    assert len(yd) <= 2 * pixeles
+    assert np.all(np.diff(xd) >= 0)
+    grupo = -(-N // pixeles)
+    for inicio in range(0, N, grupo):
+        trozo = y[inicio:inicio + grupo]
+        elegidos = yd[(xd >= x[inicio]) & (xd <= x[min(inicio + grupo, N) - 1])]
+        assert elegidos.min() == trozo.min()
+        assert elegidos.max() == trozo.max()
+    # Las series cortas no se tocan
+    assert np.array_equal(diezmar_minmax(x[:100], y[:100], pixeles)[1], y[:100])
+
+
+def test_stem_rapido_conserva_el_tallo_mayor_por_pixel():
+    rng = np.random.default_rng(1)
+    N, pixeles = 5_000, 100
+    x = np.arange(N, dtype=float)
+    y = rng.standard_normal(N)
+    fig, ax = plt.subplots()
+    tallos = stem_rapido(ax, x, y, pixeles=pixeles)
+    segmentos = np.array(tallos.get_segments())
+    grupo = -(-N // pixeles)
+    esperados = [inicio + np.argmax(np.abs(y[inicio:inicio + grupo])) for inicio in range(0, N, grupo)]
+    assert np.array_equal(segmentos[:, 0, 0], x[esperados])
+    assert np.array_equal(segmentos[:, 0, 1], np.zeros(len(esperados)))
+    assert np.array_equal(segmentos[:, 1, 1], y[esperados])
+    # Por debajo del umbral es el ax.stem de siempre
+    contenedor = stem_rapido(ax, x[:50], y[:50])
+    assert np.array_equal(contenedor.markerline.get_ydata(), y[:50])
+    plt.close(fig)
@@ -0,0 +1,70 @@
+import threading
+import tracemalloc
+import warnings
+
+from Codigos import instrumentacion
+
+
+def test_registros_acotados_y_totales_completos(tmp_path):
+    @instrumentacion.instrumentar(nombre='interna')
+    def interna():
+        return None
+
+    @instrumentacion.instrumentar(nombre='externa')
+    def externa():
+        interna()
+
+    instrumentacion.reiniciar()
+    instrumentacion.activar(max_registros=10)
+    try:
+        for _ in range(1000):
+            externa()
+    finally:
+        instrumentacion.desactivar()
+        instrumentacion.activar(max_registros=100_000)
+        instrumentacion.desactivar()
+
+    assert len(instrumentacion.registros()) <= 10
+    llamadas = {t['nombre']: t['llamadas'] for t in instrumentacion.resumen()}
+    assert llamadas == {'externa': 1000, 'interna': 1000}
+    ruta = tmp_path / 'traza.folded'
+    instrumentacion.exportar_pilas(ruta)
+    assert {linea.split()[0] for linea in ruta.read_text().splitlines()} == {'externa', 'externa;interna'}
+    instrumentacion.reiniciar()
+
+
+def test_memoria_se_apaga_con_varios_hilos():
+    def otro_hilo():
+        with instrumentacion.tramo('otro'):
+            pass
+
+    instrumentacion.reiniciar()
+    instrumentacion.activar(memoria=True)
+    try:
+        with instrumentacion.tramo('principal'):
+            pass
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter('always')
+            hilo = threading.Thread(target=otro_hilo)
+            hilo.start()
+            hilo.join()
+        assert any(issubclass(a.category, RuntimeWarning) for a in avisos)
+        assert not tracemalloc.is_tracing()
+        with instrumentacion.tramo('despues'):
+            pass
+    finally:
+        instrumentacion.desactivar()
+    picos = {r['nombre']: 'pico_bytes' in r for r in instrumentacion.registros()}
+    assert picos == {'principal': True, 'otro': False, 'despues': False}
+
+
+def test_no_detiene_una_traza_ajena():
+    tracemalloc.start()
+    try:
+        instrumentacion.activar(memoria=True)
+        with instrumentacion.tramo('medido'):
+            pass
+        instrumentacion.desactivar()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
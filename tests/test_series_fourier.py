@@ -0,0 +1,79 @@
+import numpy as np
+
+from Codigos.series_fourier import (_matriz_armonicos, analizar_gibbs, estimar_coeficientes,
+                                    reconstrucciones_parciales, sintetizar)
+
+
+def _cuadrada(n_max):
+    return [(n, 4 / (n * np.pi)) for n in range(1, n_max + 1, 2)]
+
+
+def test_ancho_del_rizado_finito_y_proporcional_a_1_sobre_n():
+    gibbs = analizar_gibbs(_cuadrada(50), 1.0, (0.0, -1.0, 1.0), [20, 50])
+    assert not gibbs['censurado'].any()
+    assert np.all(np.isfinite(gibbs['ancho']))
+    # El lóbulo principal de Gibbs se angosta como 1/N
+    assert np.isclose(20 * gibbs['ancho'][0], 50 * gibbs['ancho'][1], rtol=0.02)
+    assert np.allclose(gibbs['sobrepico'], 0.0895, atol=2e-3)
+
+
+def test_fejer_no_tiene_rizado():
+    gibbs = analizar_gibbs(_cuadrada(21), 1.0, (0.0, -1.0, 1.0), [21], sumacion='fejer')
+    assert gibbs['sobrepico'][0] == 0 and gibbs['ancho'][0] == 0 and not gibbs['censurado'][0]
+
+
+def _suma_directa(t, coeficientes, f0=1.0):
+    # Camino de reconstruct_signal del ejercicio original: un seno por armónico
+    senal = np.zeros_like(t)
+    for n, c in coeficientes:
+        senal += c * np.sin(2 * np.pi * n * f0 * t)
+    return senal
+
+
+def test_mse_de_sumas_parciales_igual_a_la_suma_directa():
+    t = np.linspace(0, 2, 1000)
+    cuadrada = np.sign(np.sin(2 * np.pi * t))
+    cantidades = [1, 3, 5, 10, 20, 50]
+    esperado = [np.mean((cuadrada - _suma_directa(t, _cuadrada(N))) ** 2) for N in cantidades]
+    for metodo in ('recurrencia', 'directo'):
+        recon, mse = reconstrucciones_parciales(t, _cuadrada(50), cantidades, 1.0,
+                                                original=cuadrada, metodo=metodo)
+        assert np.allclose(mse, esperado, rtol=1e-10, atol=0)
+        assert np.allclose(recon[-1], _suma_directa(t, _cuadrada(50)), atol=1e-11)
+
+
+def test_recurrencia_igual_a_la_sintesis_directa_con_muchos_armonicos():
+    t = np.linspace(0, 2, 20_001)
+    coeficientes = _cuadrada(2001)
+    directo = _suma_directa(t, coeficientes)
+    assert np.max(np.abs(sintetizar(t, coeficientes, 1.0, metodo='recurrencia') - directo)) < 1e-10
+    # La matriz por recurrencia, con resincronización, sigue a la exponencial exacta
+    n = np.arange(1, 800, 2.0)
+    Z = _matriz_armonicos(2 * np.pi * t[:500], n, 32)
+    assert np.max(np.abs(Z - np.exp(1j * np.outer(n, 2 * np.pi * t[:500])))) < 1e-11
+
+
+def test_ifft_igual_a_la_sintesis_directa_en_grilla_periodica():
+    t = np.arange(4000) / 1000
+    coeficientes = _cuadrada(101) + [(2, 0.3 + 0.2j)]
+    directo = _suma_directa(t, _cuadrada(101)) + 0.3 * np.sin(4 * np.pi * t) + 0.2 * np.cos(4 * np.pi * t)
+    assert np.max(np.abs(sintetizar(t, coeficientes, 1.0, metodo='ifft') - directo)) < 1e-10
+
+
+def test_coeficientes_estimados_de_la_cuadrada():
+    P = 1000
+    t = (np.arange(3 * P) + 0.5) / P          # sin muestras justo en los saltos
+    coeficientes = dict(estimar_coeficientes(np.sign(np.sin(2 * np.pi * t)), P, n_max=9, t0=t[0]))
+    for n in range(1, 10):
+        teorico = 4 / (n * np.pi) if n % 2 else 0.0
+        assert abs(coeficientes[n] - teorico) < 1e-3
+
+
+def test_convencion_de_coeficientes_seno_mas_j_coseno():
+    # c = b_n + j·a_n representa b_n·sin + a_n·cos
+    P = 64
+    t = np.arange(P) / P
+    x = 0.3 * np.sin(2 * np.pi * t) + 0.7 * np.cos(2 * np.pi * 3 * t)
+    coeficientes = dict(estimar_coeficientes(x, P, n_max=4))
+    assert np.isclose(coeficientes[1], 0.3) and np.isclose(coeficientes[3], 0.7j)
+    assert np.allclose(sintetizar(t, list(coeficientes.items()), 1.0, metodo='directo'), x)
@@ -0,0 +1,24 @@
+import numpy as np
+from scipy.fft import next_fast_len
+
+from Codigos import transformadas
+
+
+def test_transformadas_con_relleno_reutilizado_igual_a_numpy():
+    rng = np.random.default_rng(0)
+    # Se repite para que el buffer reutilizado llegue con datos de la llamada anterior
+    for _ in range(3):
+        for forma, n, eje in [((100,), 150, -1), ((4, 100), 128, -1), ((100, 3), 128, 0),
+                              ((100,), 60, -1)]:
+            x = rng.standard_normal(forma)
+            assert np.allclose(transformadas.rfft(x, n=n, axis=eje), np.fft.rfft(x, n=n, axis=eje))
+            assert np.allclose(transformadas.fft(x, n=n, axis=eje), np.fft.fft(x, n=n, axis=eje))
+            assert np.allclose(transformadas.ifft(x, n=n, axis=eje), np.fft.ifft(x, n=n, axis=eje))
+
+
+def test_relleno_a_longitud_rapida():
+    x = np.random.default_rng(1).standard_normal(1009)
+    n = transformadas.longitud_rapida(1009)
+    assert n == next_fast_len(1009, real=True)
+    assert np.allclose(transformadas.rfft(x, rellenar=True), np.fft.rfft(x, n=n))
+    assert np.allclose(transformadas.frecuencias(n, 1000.0), np.fft.rfftfreq(n, 1 / 1000.0))
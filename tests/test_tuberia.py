@@ -0,0 +1,116 @@
+import io
+import threading
+
+import numpy as np
+import pytest
+
+from Codigos.tuberia import (Etapa, FuenteArchivo, FuenteSintetica, Tuberia, etapa_envolvente,
+                             etapa_espectro, tuberia_ejercicios)
+
+
+def _correr_con_limite(tuberia, segundos=30, **kwargs):
+    """Corre la tubería en otro hilo y falla si no termina a tiempo (en lugar de colgarse)."""
+    salida = {}
+
+    def correr():
+        try:
+            salida['valor'] = tuberia.correr(**kwargs)
+        except BaseException as error:
+            salida['error'] = error
+
+    hilo = threading.Thread(target=correr, daemon=True)
+    hilo.start()
+    hilo.join(segundos)
+    assert not hilo.is_alive(), "la tubería quedó trabada"
+    return salida
+
+
+def test_error_en_etapa_se_propaga():
+    def falla(bloque):
+        if bloque.indice == 5:
+            raise RuntimeError("falla en la etapa")
+
+    tuberia = Tuberia(FuenteSintetica(), [etapa_espectro(1000.0, hilos=2), Etapa('falla', falla)],
+                      tam_bloque=1024, capacidad=2)
+    salida = _correr_con_limite(tuberia)
+    assert isinstance(salida.get('error'), RuntimeError)
+
+
+def test_error_en_consumidor_se_propaga():
+    def consumidor(bloque):
+        if bloque.indice == 3:
+            raise RuntimeError("falla en el consumidor")
+
+    tuberia = tuberia_ejercicios(FuenteSintetica(duracion=2000))
+    salida = _correr_con_limite(tuberia, consumidor=consumidor)
+    assert isinstance(salida.get('error'), RuntimeError)
+
+
+def test_bloques_sin_envolvente_no_informan_entropia():
+    resultados = tuberia_ejercicios(FuenteSintetica(duracion=60)).correr()['resultados']
+    # El primer bloque no completa un paso del filtro de Hilbert
+    assert 'entropia' not in resultados[0]
+    medidos = [r['entropia'] for r in resultados if 'entropia' in r]
+    assert medidos and min(medidos) > 0
+
+
+class _LecturaCorta(io.RawIOBase):
+    """Archivo crudo cuyo readinto entrega a lo sumo 3 bytes por llamada."""
+
+    def __init__(self, datos):
+        self._datos = io.BytesIO(datos)
+
+    def readable(self):
+        return True
+
+    def readinto(self, destino):
+        return self._datos.readinto(memoryview(destino)[:3])
+
+
+def test_fuente_archivo_completa_lecturas_cortas(tmp_path):
+    muestras = np.arange(10, dtype=np.float32)
+    ruta = tmp_path / 'captura.raw'
+    muestras.tofile(ruta)
+    fuente = FuenteArchivo(ruta, 1000.0, dtype=np.float32)
+    fuente._archivo.close()
+    fuente._archivo = _LecturaCorta(muestras.tobytes())
+    buffer = np.empty(4, dtype=np.float32)
+    leidas = []
+    while n := fuente.llenar(buffer):
+        leidas.extend(buffer[:n])
+    assert np.array_equal(leidas, muestras)
+
+    ruta.write_bytes(muestras.tobytes() + b'\x00\x01')
+    fuente = FuenteArchivo(ruta, 1000.0, dtype=np.float32)
+    with pytest.raises(ValueError, match='incompleta'):
+        while fuente.llenar(np.empty(16, dtype=np.float32)):
+            pass
+
+
+def test_fuente_archivo_npy_con_su_dtype(tmp_path):
+    muestras = np.sin(np.arange(10000) / 7).astype(np.float32)
+    ruta = tmp_path / 'captura.npy'
+    np.save(ruta, muestras)
+    tuberia = Tuberia(FuenteArchivo(ruta, 1000.0), [etapa_espectro(1000.0)], tam_bloque=1024)
+    assert tuberia.correr()['metricas']['muestras'] == len(muestras)
+
+    np.save(ruta, muestras.reshape(100, 100))
+    with pytest.raises(ValueError, match='1-D'):
+        FuenteArchivo(ruta, 1000.0)
+    np.save(ruta, np.asfortranarray(muestras.reshape(100, 100)))
+    with pytest.raises(ValueError):
+        FuenteArchivo(ruta, 1000.0)
+
+
+def test_envolvente_completa_al_terminar_la_fuente():
+    fuente = FuenteSintetica(duracion=10)
+    total = int(fuente.fs * 10)
+    envolventes = []
+
+    def consumidor(bloque):
+        envolventes.append(len(bloque.resultados['envolvente']))
+
+    etapas = [etapa_envolvente(tam_bloque=1000)]
+    Tuberia(fuente, etapas, tam_bloque=1000).correr(consumidor=consumidor)
+    # La salida va retrasada (num_taps - 1)/2 = 127 muestras: al final salen todas
+    assert sum(envolventes) == total + 127